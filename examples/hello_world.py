@@ -20,36 +20,38 @@ async def main():
 
     # Initialize client from environment
     # Required env vars: OMEGA_FEDERATION_URL, OMEGA_TENANT_ID, OMEGA_ACTOR_ID
-    client = OmegaClient.from_env()
-
-    try:
-        # Health check - verifies Federation Core connectivity
-        print("Connecting to OMEGA Federation Core...")
-        health = await client.health()
-
-        if health.healthy:
-            print(f"Hello, OMEGA!")
-            print(f"  Federation: {health.federation_version}")
-            print(f"  Status: healthy")
-            # --------------------------------------------------
-            # KEON INTEGRATION SEAM
-            # When Keon evidence browser is wired:
-            #   - Display verification status here
-            #   - Show governance state
-            #   - Link to evidence dashboard
-            # --------------------------------------------------
-        else:
-            print(f"Federation unhealthy: {health.message}")
-
-    except OmegaError as e:
-        print(f"Connection failed: {e.message}")
-        print(f"  Code: {e.code}")
-        print(f"  Correlation: {e.correlation_id}")
-
-    finally:
-        await client.close()
-        print("Goodbye.")
+    async with OmegaClient.from_env() as client:
+        try:
+            # Health check - verifies Federation Core connectivity
+            print("Connecting to OMEGA Federation Core...")
+            health = await client.health()
+
+            if health.healthy:
+                print(f"Hello, OMEGA!")
+                print(f"  Federation: {health.federation_version}")
+                print(f"  Status: healthy")
+                # --------------------------------------------------
+                # KEON INTEGRATION SEAM
+                # When Keon evidence browser is wired:
+                #   - Display verification status here
+                #   - Show governance state
+                #   - Link to evidence dashboard
+                # --------------------------------------------------
+            else:
+                print(f"Federation unhealthy: {health.message}")
+
+        except OmegaError as e:
+            print(f"Connection failed: {e.message}")
+            print(f"  Code: {e.code}")
+            print(f"  Correlation: {e.correlation_id}")
+        finally:
+            print("Goodbye.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional faster event loop (not available on Windows)
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
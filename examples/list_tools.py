@@ -3,11 +3,12 @@ Example: List all available tools in Federation Core.
 
 This example demonstrates:
 - Environment-based configuration
-- Tool listing with pagination
+- Tool listing across all pages
 - Error handling
 """
 
 import asyncio
+import sys
 
 from omega_sdk import OmegaClient
 from omega_sdk.errors import OmegaError
@@ -16,38 +17,38 @@ from omega_sdk.errors import OmegaError
 async def main():
     # Create client from environment variables
     # Requires: OMEGA_FEDERATION_URL, OMEGA_TENANT_ID, OMEGA_ACTOR_ID
-    client = OmegaClient.from_env()
-
-    try:
-        # List all tools
-        print("Fetching tools from Federation Core...")
-        tools = await client.tools.list()
-
-        print(f"\nFound {len(tools.items)} tools:\n")
-
-        for tool in tools.items:
-            print(f"  • {tool.tool_id}")
-            print(f"    Name: {tool.display_name}")
-            print(f"    Description: {tool.description}")
-            print(f"    Agent: {tool.agent_id}")
-            print(f"    Status: {tool.status}")
-            print(f"    Tags: {', '.join(tool.tags or [])}")
-            print()
-
-        # Pagination example
-        if tools.page.next_cursor:
-            print("More results available. Use cursor for pagination:")
-            print(f"  next_cursor = '{tools.page.next_cursor}'")
-
-    except OmegaError as e:
-        print(f"Error: {e.code} - {e.message}")
-        if e.correlation_id:
-            print(f"Correlation ID: {e.correlation_id}")
-        if e.request_id:
-            print(f"Request ID: {e.request_id}")
-    finally:
-        await client.close()
+    async with OmegaClient.from_env() as client:
+        try:
+            # Iterate over all tools (pages are fetched as needed)
+            print("Fetching tools from Federation Core...\n")
+            count = 0
+
+            async for tool in client.tools.iter():
+                count += 1
+                # One write per tool rather than one print per field
+                sys.stdout.write(
+                    f"  • {tool.tool_id}\n"
+                    f"    Name: {tool.display_name}\n"
+                    f"    Description: {tool.description}\n"
+                    f"    Agent: {tool.agent_id}\n"
+                    f"    Status: {tool.status}\n"
+                    f"    Tags: {', '.join(tool.tags or [])}\n\n"
+                )
+
+            print(f"Found {count} tools")
+
+        except OmegaError as e:
+            print(f"Error: {e.code} - {e.message}")
+            if e.correlation_id:
+                print(f"Correlation ID: {e.correlation_id}")
+            if e.request_id:
+                print(f"Request ID: {e.request_id}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional faster event loop (not available on Windows)
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,110 +1,121 @@
 """
-Example: Spawn an asynchronous task and poll for completion.
+Example: Spawn an asynchronous task and wait for completion.
 
 This example demonstrates:
 - Task creation with routing
-- Task polling
-- Progress tracking
+- Waiting for completion via server-pushed status
+- Waiting on a batch of tasks at once
 - Governance configuration
 """
 
 import asyncio
+import sys
 from omega_sdk import OmegaClient
 from omega_sdk.models import TaskRouting, TaskGovernance, TaskStatus
 from omega_sdk.errors import OmegaError
 
 
+async def spawn_batch(client: OmegaClient) -> None:
+    """Spawn several tasks and collect them as they finish."""
+    print("Creating batch of tasks...")
+    created = await client.tasks.create_many(
+        [
+            {
+                "task_type": "workflow.run",
+                "input": {
+                    "workflow": "brand_campaign",
+                    "business_idea": "AI fitness app",
+                    "target_audience": audience,
+                },
+            }
+            for audience in ("Millennials", "Gen Z", "Boomers")
+        ]
+    )
+    task_ids = [task.task_id for task in created]
+
+    # One wait per task, drained as each completes (no sequential polling)
+    results = await client.tasks.gather(task_ids, timeout=300)
+    sys.stdout.write("".join(f"  {status.task_id}: {status.status}\n" for status in results))
+
+
 async def main():
     # Create client from environment
-    client = OmegaClient.from_env()
-
-    try:
-        # Create an asynchronous task
-        print("Creating task...")
-        task = await client.tasks.create(
-            task_type="workflow.run",
-            input={
-                "workflow": "brand_campaign",
-                "business_idea": "AI fitness app",
-                "target_audience": "Millennials",
-            },
-            routing=TaskRouting(
-                strategy="capability",
-                capability="branding",
-            ),
-            governance=TaskGovernance(
-                require_receipt=True,
-                policy_tags=["prod", "customer_facing"],
-            ),
-        )
-
-        print(f"✓ Task created: {task.task_id}")
-        print(f"  Status: {task.status}")
-        print()
-
-        # Poll for completion
-        print("Polling for completion...")
-        max_polls = 60  # 5 minutes max
-        poll_count = 0
-
-        while poll_count < max_polls:
-            # Get task status
-            status = await client.tasks.get(task.task_id)
-            poll_count += 1
-
-            # Print progress
-            if status.state and status.state.progress is not None:
-                progress_pct = status.state.progress * 100
-                print(f"  [{status.status}] {progress_pct:.1f}% - {status.state.current_step or 'processing'}")
-            else:
-                print(f"  [{status.status}]")
-
-            # Check if done
-            if status.status == TaskStatus.COMPLETED:
-                print()
-                print("✓ Task completed successfully!")
-                print()
-                print("Result:")
-                print(f"  {status.result}")
-                print()
+    async with OmegaClient.from_env() as client:
+        try:
+            # Create and wait under one correlation ID so the whole task
+            # lifecycle shows up as a single trace
+            async with client.correlation_scope():
+                # Create an asynchronous task
+                print("Creating task...")
+                task = await client.tasks.create(
+                    task_type="workflow.run",
+                    input={
+                        "workflow": "brand_campaign",
+                        "business_idea": "AI fitness app",
+                        "target_audience": "Millennials",
+                    },
+                    routing=TaskRouting(
+                        strategy="capability",
+                        capability="branding",
+                    ),
+                    governance=TaskGovernance(
+                        require_receipt=True,
+                        policy_tags=["prod", "customer_facing"],
+                    ),
+                )
+
+                sys.stdout.write(f"✓ Task created: {task.task_id}\n  Status: {task.status}\n\n")
+
+                # Wait for completion (server pushes status changes, no polling).
+                # Without status streams, use client.tasks.poll_until_done(task.task_id),
+                # which polls with exponential backoff instead.
+                print("Waiting for completion...")
+                status = await asyncio.wait_for(client.tasks.wait(task.task_id), timeout=300)
+
+            if status.status is TaskStatus.COMPLETED:
+                # Build the report once and emit it with a single write
+                parts = [
+                    "\n✓ Task completed successfully!\n\n",
+                    f"Result:\n  {status.result}\n\n",
+                ]
 
                 # Access audit metadata
                 if status.audit:
-                    print("Audit:")
+                    parts.append("Audit:\n")
                     if status.audit.keon_receipt_id:
-                        print(f"  Keon Receipt: {status.audit.keon_receipt_id}")
+                        parts.append(f"  Keon Receipt: {status.audit.keon_receipt_id}\n")
                     if status.audit.evidence_pack_id:
-                        print(f"  Evidence Pack: {status.audit.evidence_pack_id}")
+                        parts.append(f"  Evidence Pack: {status.audit.evidence_pack_id}\n")
 
-                break
+                sys.stdout.write("".join(parts))
 
-            elif status.status == TaskStatus.FAILED:
+            elif status.status is TaskStatus.FAILED:
                 print()
                 print("✗ Task failed")
                 if status.result:
                     print(f"Error: {status.result}")
-                break
 
-            elif status.status == TaskStatus.CANCELLED:
+            elif status.status is TaskStatus.CANCELLED:
                 print()
                 print("Task was cancelled")
-                break
 
-            # Wait before next poll
-            await asyncio.sleep(5)
+            print()
+            await spawn_batch(client)
 
-        else:
+        except asyncio.TimeoutError:
             print()
             print("Timeout: Task did not complete within 5 minutes")
 
-    except OmegaError as e:
-        print(f"Error: {e.code} - {e.message}")
-        if e.correlation_id:
-            print(f"Correlation ID: {e.correlation_id}")
-
-    finally:
-        await client.close()
+        except OmegaError as e:
+            print(f"Error: {e.code} - {e.message}")
+            if e.correlation_id:
+                print(f"Correlation ID: {e.correlation_id}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional faster event loop (not available on Windows)
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -14,42 +14,99 @@ Example:
 
 __version__ = "1.0.0"
 
-from omega_sdk.client import OmegaClient
-from omega_sdk.config import OmegaConfig
-from omega_sdk.errors import (
-    OmegaError,
-    AuthenticationError,
-    ValidationError,
-    NotFoundError,
-    RateLimitError,
-    UpstreamError,
-    InternalError,
-)
-from omega_sdk.models import (
-    Envelope,
-    Meta,
-    Error,
-    Agent,
-    Tool,
-    Task,
-    TaskStatus,
-)
-from omega_sdk.workflows import (
-    WorkflowRunStatus,
-    GateStatus,
-    GateInfo,
-    WorkflowRunLogEntry,
-    WorkflowRunOptions,
-    WorkflowRunResult,
-    ResumeRunResult,
-    WorkflowRegisterRequest,
-    WorkflowRegisterResult,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from omega_sdk.client import OmegaClient, get_default_client
+    from omega_sdk.config import OmegaConfig
+    from omega_sdk.errors import (
+        OmegaError,
+        AuthenticationError,
+        ValidationError,
+        NotFoundError,
+        RateLimitError,
+        UpstreamError,
+        InternalError,
+    )
+    from omega_sdk.models import (
+        Envelope,
+        Meta,
+        Error,
+        Agent,
+        Tool,
+        Task,
+        TaskStatus,
+    )
+    from omega_sdk.workflows import (
+        WorkflowRunStatus,
+        GateStatus,
+        GateInfo,
+        WorkflowRunLogEntry,
+        WorkflowRunOptions,
+        WorkflowRunResult,
+        WorkflowRunEvent,
+        ResumeRunResult,
+        WorkflowRegisterRequest,
+        WorkflowRegisterResult,
+    )
+
+# Public symbols resolved on first access (PEP 562), so importing the package
+# does not load httpx, pydantic models or workflow machinery up front
+_LAZY_IMPORTS: dict[str, str] = {
+    # Core client
+    "OmegaClient": "omega_sdk.client",
+    "OmegaConfig": "omega_sdk.config",
+    "get_default_client": "omega_sdk.client",
+    # Errors
+    "OmegaError": "omega_sdk.errors",
+    "AuthenticationError": "omega_sdk.errors",
+    "ValidationError": "omega_sdk.errors",
+    "NotFoundError": "omega_sdk.errors",
+    "RateLimitError": "omega_sdk.errors",
+    "UpstreamError": "omega_sdk.errors",
+    "InternalError": "omega_sdk.errors",
+    # Models
+    "Envelope": "omega_sdk.models",
+    "Meta": "omega_sdk.models",
+    "Error": "omega_sdk.models",
+    "Agent": "omega_sdk.models",
+    "Tool": "omega_sdk.models",
+    "Task": "omega_sdk.models",
+    "TaskStatus": "omega_sdk.models",
+    # Workflow models
+    "WorkflowRunStatus": "omega_sdk.workflows",
+    "GateStatus": "omega_sdk.workflows",
+    "GateInfo": "omega_sdk.workflows",
+    "WorkflowRunLogEntry": "omega_sdk.workflows",
+    "WorkflowRunOptions": "omega_sdk.workflows",
+    "WorkflowRunResult": "omega_sdk.workflows",
+    "WorkflowRunEvent": "omega_sdk.workflows",
+    "ResumeRunResult": "omega_sdk.workflows",
+    "WorkflowRegisterRequest": "omega_sdk.workflows",
+    "WorkflowRegisterResult": "omega_sdk.workflows",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Core client
     "OmegaClient",
     "OmegaConfig",
+    "get_default_client",
     # Errors
     "OmegaError",
     "AuthenticationError",
@@ -73,6 +130,7 @@ __all__ = [
     "WorkflowRunLogEntry",
     "WorkflowRunOptions",
     "WorkflowRunResult",
+    "WorkflowRunEvent",
     "ResumeRunResult",
     "WorkflowRegisterRequest",
     "WorkflowRegisterResult",
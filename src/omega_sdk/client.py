@@ -6,24 +6,37 @@ Provides a clean, ergonomic interface to the Federation Core API.
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+import random
+import time
+from contextlib import aclosing, asynccontextmanager
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Optional,
+    Union,
+    overload,
+)
 from uuid import uuid4
 
+import pydantic
+
 from omega_sdk.config import OmegaConfig
-from omega_sdk.federation import FederationCoreGateway
+from omega_sdk.errors import NotFoundError, OmegaError
+from omega_sdk.federation import FederationCoreGateway, _endpoint_url
 from omega_sdk.models import (
+    Envelope,
     Agent,
     AgentListResponse,
     Tool,
     ToolListResponse,
-    ToolInvokeRequest,
-    ToolInvokeContext,
-    ToolInvokeOptions,
     ToolInvokeResult,
     Task,
-    TaskCreateRequest,
+    TERMINAL_TASK_STATUSES,
+    TaskBatchGetResponse,
     TaskCreateResponse,
-    TaskContext,
     TaskRouting,
     TaskGovernance,
     HealthStatus,
@@ -34,8 +47,32 @@ from omega_sdk.evidence import (
     EvidencePackListResponse,
     EvidenceVerificationResult,
 )
-from omega_sdk.workflows import WorkflowsNamespace
-from omega_sdk.utils.correlation import make_correlation_id
+from omega_sdk.utils.concurrency import bounded_gather
+from omega_sdk.utils.correlation import correlation_scope, current_correlation_id
+
+if TYPE_CHECKING:
+    from omega_sdk.workflows import WorkflowsNamespace
+
+
+# Envelope validators specialised per response type, built once at import so
+# each response is validated (envelope and data) by one compiled validator
+_TOOL_LIST_ENVELOPE = Envelope[ToolListResponse]
+_TOOL_ENVELOPE = Envelope[Tool]
+_TOOL_INVOKE_ENVELOPE = Envelope[ToolInvokeResult]
+_AGENT_LIST_ENVELOPE = Envelope[AgentListResponse]
+_AGENT_ENVELOPE = Envelope[Agent]
+_TASK_CREATE_ENVELOPE = Envelope[TaskCreateResponse]
+_TASK_ENVELOPE = Envelope[Task]
+_TASK_BATCH_ENVELOPE = Envelope[TaskBatchGetResponse]
+_EVIDENCE_LIST_ENVELOPE = Envelope[EvidencePackListResponse]
+_EVIDENCE_PACK_ENVELOPE = Envelope[MemoryEvidencePack]
+_EVIDENCE_VERIFY_ENVELOPE = Envelope[EvidenceVerificationResult]
+_HEALTH_ENVELOPE = Envelope[HealthStatus]
+_STATUS_ENVELOPE = Envelope[StatusResponse]
+
+# Backoff between task stream resubscriptions when the server closes early
+_RESUBSCRIBE_INITIAL_S = 0.1
+_RESUBSCRIBE_MAX_S = 5.0
 
 
 class ToolsNamespace:
@@ -44,6 +81,8 @@ class ToolsNamespace:
     def __init__(self, gateway: FederationCoreGateway, config: OmegaConfig):
         self._gateway = gateway
         self._config = config
+        self._default_tenant = config.tenant_id or ""
+        self._default_actor = config.actor_id or ""
 
     async def list(
         self,
@@ -77,9 +116,9 @@ class ToolsNamespace:
             >>> for tool in tools.items:
             ...     print(f"{tool.tool_id}: {tool.description}")
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
 
         params: dict[str, Any] = {"limit": limit}
         if capability:
@@ -91,15 +130,77 @@ class ToolsNamespace:
         if cursor:
             params["cursor"] = cursor
 
-        data = await self._gateway.get(
+        return await self._gateway.get(
             "/tools",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
             params=params,
+            envelope_model=_TOOL_LIST_ENVELOPE,
         )
 
-        return ToolListResponse.model_validate(data)
+    async def iter(
+        self,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        capability: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        tag: Optional[str] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Tool]:
+        """
+        Iterate over all available tools, page by page.
+
+        The next page is fetched in the background while the current page is
+        being consumed, and only one page is held in memory at a time.
+
+        Args:
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID (auto-generated if not provided)
+            capability: Filter by capability
+            agent_id: Filter by agent ID
+            tag: Filter by tag
+            page_size: Page limit per request (max 200)
+
+        Yields:
+            Tools across all pages
+
+        Example:
+            >>> async for tool in client.tools.iter(capability="data"):
+            ...     print(f"{tool.tool_id}: {tool.description}")
+        """
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        # One correlation ID for the whole listing
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
+
+        def fetch(cursor: Optional[str]) -> asyncio.Task[ToolListResponse]:
+            return asyncio.create_task(
+                self.list(
+                    tenant_id=tenant_id,
+                    actor_id=actor_id,
+                    correlation_id=correlation_id,
+                    capability=capability,
+                    agent_id=agent_id,
+                    tag=tag,
+                    limit=page_size,
+                    cursor=cursor,
+                )
+            )
+
+        next_page: Optional[asyncio.Task[ToolListResponse]] = fetch(None)
+        try:
+            while next_page is not None:
+                page = await next_page
+                cursor = page.page.next_cursor
+                next_page = fetch(cursor) if cursor else None
+                for tool in page.items:
+                    yield tool
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
     async def get(
         self,
@@ -124,19 +225,18 @@ class ToolsNamespace:
             >>> tool = await client.tools.get("csv_processor")
             >>> print(tool.input_schema)
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
 
-        data = await self._gateway.get(
+        return await self._gateway.get(
             f"/tools/{tool_id}",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
+            envelope_model=_TOOL_ENVELOPE,
         )
 
-        return Tool.model_validate(data)
-
     async def invoke(
         self,
         tool_id: str,
@@ -173,36 +273,85 @@ class ToolsNamespace:
             ... )
             >>> print(result.result)
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
-
-        request = ToolInvokeRequest(
-            input=input,
-            options=ToolInvokeOptions(
-                timeout_ms=timeout_ms,
-                stream=stream,
-            ),
-            context=ToolInvokeContext(
-                tenant_id=tenant_id,
-                actor_id=actor_id,
-                correlation_id=correlation_id,
-                decision_receipt_id=decision_receipt_id,
-                tags=tags,
-            ),
-        )
-
-        data = await self._gateway.post(
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
+
+        # Plain dict in the wire shape of ToolInvokeRequest; every field is
+        # SDK-assembled, so a validating model round-trip adds nothing
+        options: dict[str, Any] = {"stream": stream}
+        if timeout_ms is not None:
+            options["timeout_ms"] = timeout_ms
+        context: dict[str, Any] = {
+            "tenant_id": tenant_id,
+            "actor_id": actor_id,
+            "correlation_id": correlation_id,
+        }
+        if decision_receipt_id is not None:
+            context["decision_receipt_id"] = decision_receipt_id
+        if tags is not None:
+            context["tags"] = tags
+        request = {"input": input, "options": options, "context": context}
+
+        return await self._gateway.post(
             f"/tools/{tool_id}:invoke",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
-            json=request.model_dump(exclude_none=True),
-            idempotency_key=str(uuid4()),
+            json=request,
+            idempotency_key=uuid4().hex,
             decision_receipt_id=decision_receipt_id,
+            envelope_model=_TOOL_INVOKE_ENVELOPE,
         )
 
-        return ToolInvokeResult.model_validate(data)
+    async def invoke_many(
+        self,
+        requests: list[dict[str, Any]],
+        max_concurrency: int = 32,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> list[ToolInvokeResult]:
+        """
+        Invoke several tools concurrently.
+
+        Each request is a dict of invoke() arguments (tool_id, input and
+        optionally decision_receipt_id, timeout_ms, stream, tags). Tenant,
+        actor and correlation are resolved once for the whole batch, and at
+        most max_concurrency invocations are in flight at a time. If one
+        invocation fails, the others are cancelled and the error is raised.
+
+        Args:
+            requests: invoke() arguments, one dict per invocation
+            max_concurrency: Maximum invocations in flight
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID shared by the batch (auto-generated if not provided)
+
+        Returns:
+            Tool invocation results, in the order of requests
+
+        Example:
+            >>> results = await client.tools.invoke_many(
+            ...     [{"tool_id": "csv_processor", "input": {"file": f}} for f in files]
+            ... )
+        """
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
+
+        return await bounded_gather(
+            (
+                self.invoke(
+                    **request,
+                    tenant_id=tenant_id,
+                    actor_id=actor_id,
+                    correlation_id=correlation_id,
+                )
+                for request in requests
+            ),
+            max_concurrency,
+        )
 
 
 class AgentsNamespace:
@@ -211,6 +360,8 @@ class AgentsNamespace:
     def __init__(self, gateway: FederationCoreGateway, config: OmegaConfig):
         self._gateway = gateway
         self._config = config
+        self._default_tenant = config.tenant_id or ""
+        self._default_actor = config.actor_id or ""
 
     async def list(
         self,
@@ -242,9 +393,9 @@ class AgentsNamespace:
             >>> for agent in agents.items:
             ...     print(f"{agent.agent_id}: {agent.status}")
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
 
         params: dict[str, Any] = {"limit": limit}
         if kind:
@@ -254,16 +405,15 @@ class AgentsNamespace:
         if cursor:
             params["cursor"] = cursor
 
-        data = await self._gateway.get(
+        return await self._gateway.get(
             "/agents",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
             params=params,
+            envelope_model=_AGENT_LIST_ENVELOPE,
         )
 
-        return AgentListResponse.model_validate(data)
-
     async def get(
         self,
         agent_id: str,
@@ -287,18 +437,25 @@ class AgentsNamespace:
             >>> agent = await client.agents.get("gpt_titan")
             >>> print(agent.capabilities)
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
 
-        data = await self._gateway.get(
+        return await self._gateway.get(
             f"/agents/{agent_id}",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
+            envelope_model=_AGENT_ENVELOPE,
         )
 
-        return Agent.model_validate(data)
+
+class _TaskWatch:
+    """A shared subscription to one task's status stream."""
+
+    def __init__(self, task: asyncio.Task[Task]):
+        self.task = task
+        self.waiters = 0
 
 
 class TasksNamespace:
@@ -307,6 +464,10 @@ class TasksNamespace:
     def __init__(self, gateway: FederationCoreGateway, config: OmegaConfig):
         self._gateway = gateway
         self._config = config
+        self._default_tenant = config.tenant_id or ""
+        self._default_actor = config.actor_id or ""
+        # One status stream per task, shared by concurrent wait() callers
+        self._watches: dict[str, _TaskWatch] = {}
 
     async def create(
         self,
@@ -341,32 +502,81 @@ class TasksNamespace:
             ... )
             >>> print(f"Task created: {task.task_id}")
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
-
-        request = TaskCreateRequest(
-            task_type=task_type,
-            input=input,
-            routing=routing,
-            governance=governance,
-            context=TaskContext(
-                tenant_id=tenant_id,
-                actor_id=actor_id,
-                correlation_id=correlation_id,
-            ),
-        )
-
-        data = await self._gateway.post(
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
+
+        # Plain dict in the wire shape of TaskCreateRequest (see tools.invoke)
+        request: dict[str, Any] = {"task_type": task_type, "input": input}
+        if routing is not None:
+            request["routing"] = routing.model_dump(exclude_none=True)
+        if governance is not None:
+            request["governance"] = governance.model_dump(exclude_none=True)
+        request["context"] = {
+            "tenant_id": tenant_id,
+            "actor_id": actor_id,
+            "correlation_id": correlation_id,
+        }
+
+        return await self._gateway.post(
             "/tasks",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
-            json=request.model_dump(exclude_none=True),
-            idempotency_key=str(uuid4()),
+            json=request,
+            idempotency_key=uuid4().hex,
+            envelope_model=_TASK_CREATE_ENVELOPE,
         )
 
-        return TaskCreateResponse.model_validate(data)
+    async def create_many(
+        self,
+        requests: list[dict[str, Any]],
+        max_concurrency: int = 32,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> list[TaskCreateResponse]:
+        """
+        Create several tasks concurrently.
+
+        Each request is a dict of create() arguments (task_type, input and
+        optionally routing, governance). Tenant, actor and correlation are
+        resolved once for the whole batch, and at most max_concurrency
+        creations are in flight at a time. If one creation fails, the others
+        are cancelled and the error is raised.
+
+        Args:
+            requests: create() arguments, one dict per task
+            max_concurrency: Maximum creations in flight
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID shared by the batch (auto-generated if not provided)
+
+        Returns:
+            Task creation responses, in the order of requests
+
+        Example:
+            >>> created = await client.tasks.create_many(
+            ...     [{"task_type": "workflow.run", "input": {"audience": a}} for a in audiences]
+            ... )
+            >>> final = await client.tasks.gather([t.task_id for t in created])
+        """
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
+
+        return await bounded_gather(
+            (
+                self.create(
+                    **request,
+                    tenant_id=tenant_id,
+                    actor_id=actor_id,
+                    correlation_id=correlation_id,
+                )
+                for request in requests
+            ),
+            max_concurrency,
+        )
 
     async def get(
         self,
@@ -393,18 +603,375 @@ class TasksNamespace:
             >>> if task.result:
             ...     print(f"Result: {task.result}")
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
 
-        data = await self._gateway.get(
+        return await self._gateway.get(
             f"/tasks/{task_id}",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
+            envelope_model=_TASK_ENVELOPE,
         )
 
-        return Task.model_validate(data)
+    async def get_many(
+        self,
+        task_ids: list[str],
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> list[Task]:
+        """
+        Get the status and result of several tasks in one request.
+
+        Args:
+            task_ids: Task identifiers
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID (auto-generated if not provided)
+
+        Returns:
+            Task details, in the order of task_ids
+
+        Raises:
+            NotFoundError: If Federation Core omits one of the requested tasks
+
+        Example:
+            >>> for task in await client.tasks.get_many(["tk_01H...", "tk_01J..."]):
+            ...     print(f"{task.task_id}: {task.status}")
+        """
+        if not task_ids:
+            return []
+
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
+
+        # Plain dict in the wire shape of TaskBatchGetRequest (see tools.invoke)
+        response: TaskBatchGetResponse = await self._gateway.post(
+            "/tasks:batchGet",
+            tenant_id=tenant_id,
+            actor_id=actor_id,
+            correlation_id=correlation_id,
+            json={"task_ids": task_ids},
+            envelope_model=_TASK_BATCH_ENVELOPE,
+        )
+
+        by_id = {task.task_id: task for task in response.items}
+        missing = [task_id for task_id in task_ids if task_id not in by_id]
+        if missing:
+            raise NotFoundError(
+                message=f"Tasks not found: {', '.join(missing)}",
+                resource_type="task",
+                resource_id=missing[0],
+                correlation_id=correlation_id,
+            )
+        return [by_id[task_id] for task_id in task_ids]
+
+    async def wait(
+        self,
+        task_id: str,
+        timeout: Optional[float] = None,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> Task:
+        """
+        Wait for a task to reach a terminal status.
+
+        Subscribes to the task's status stream and returns as soon as Federation
+        Core pushes a completed, failed or cancelled status. Concurrent callers
+        waiting on the same task share a single stream.
+
+        Args:
+            task_id: Task identifier
+            timeout: Maximum wait in seconds (waits indefinitely if not provided)
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID (auto-generated if not provided)
+
+        Returns:
+            Task details in their terminal state
+
+        Raises:
+            OmegaError: If the timeout is exceeded or the stream fails
+
+        Example:
+            >>> task = await client.tasks.create(task_type="workflow.run", input={})
+            >>> final = await client.tasks.wait(task.task_id, timeout=300)
+            >>> print(f"Status: {final.status}")
+        """
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
+
+        watch = self._watches.get(task_id)
+        if watch is None:
+            watch = _TaskWatch(
+                asyncio.create_task(self._watch(task_id, tenant_id, actor_id, correlation_id))
+            )
+            self._watches[task_id] = watch
+            watch.task.add_done_callback(lambda _: self._release_watch(task_id, watch))
+
+        watch.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(watch.task), timeout)
+        except asyncio.TimeoutError:
+            raise OmegaError(
+                code="TIMEOUT",
+                message=f"Task {task_id} did not complete within {timeout}s",
+                retryable=False,
+            )
+        finally:
+            watch.waiters -= 1
+            if watch.waiters == 0 and not watch.task.done():
+                # Nobody is listening anymore; drop the stream
+                watch.task.cancel()
+                self._release_watch(task_id, watch)
+
+    async def gather(
+        self,
+        task_ids: list[str],
+        timeout: Optional[float] = None,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> list[Task]:
+        """
+        Wait for several tasks to reach a terminal status.
+
+        All tasks are watched concurrently and collected as each one finishes.
+        If any wait fails, the remaining waits are cancelled and the error is
+        raised.
+
+        Args:
+            task_ids: Task identifiers
+            timeout: Maximum wait per task in seconds (waits indefinitely if not provided)
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID (auto-generated per task if not provided)
+
+        Returns:
+            Task details in their terminal state, in the order of task_ids
+
+        Raises:
+            OmegaError: If a timeout is exceeded or a stream fails
+
+        Example:
+            >>> ids = [(await client.tasks.create(...)).task_id for _ in range(3)]
+            >>> for task in await client.tasks.gather(ids):
+            ...     print(f"{task.task_id}: {task.status}")
+        """
+        positions = {
+            asyncio.create_task(
+                self.wait(
+                    task_id,
+                    timeout=timeout,
+                    tenant_id=tenant_id,
+                    actor_id=actor_id,
+                    correlation_id=correlation_id,
+                )
+            ): index
+            for index, task_id in enumerate(task_ids)
+        }
+        results: list[Optional[Task]] = [None] * len(task_ids)
+
+        pending = set(positions)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    results[positions[future]] = future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            # Let cancelled waits release their streams before returning
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return [task for task in results if task is not None]
+
+    @overload
+    async def poll_until_done(
+        self,
+        task_id: str,
+        initial: float = ...,
+        max_interval: float = ...,
+        factor: float = ...,
+        jitter: float = ...,
+        timeout: Optional[float] = ...,
+        tenant_id: Optional[str] = ...,
+        actor_id: Optional[str] = ...,
+        correlation_id: Optional[str] = ...,
+    ) -> Task: ...
+
+    @overload
+    async def poll_until_done(
+        self,
+        task_id: list[str],
+        initial: float = ...,
+        max_interval: float = ...,
+        factor: float = ...,
+        jitter: float = ...,
+        timeout: Optional[float] = ...,
+        tenant_id: Optional[str] = ...,
+        actor_id: Optional[str] = ...,
+        correlation_id: Optional[str] = ...,
+    ) -> list[Task]: ...
+
+    async def poll_until_done(
+        self,
+        task_id: Union[str, list[str]],
+        initial: float = 0.1,
+        max_interval: float = 5.0,
+        factor: float = 2.0,
+        jitter: float = 0.2,
+        timeout: Optional[float] = None,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> Union[Task, list[Task]]:
+        """
+        Poll one or more tasks until they reach a terminal status.
+
+        Polling fallback for deployments without status streams. The interval
+        starts small so short tasks return quickly, then grows exponentially
+        up to max_interval so long tasks are not polled needlessly. When given
+        a list, every tick fetches all still-pending tasks with a single
+        get_many() request.
+
+        Args:
+            task_id: Task identifier, or a list of task identifiers
+            initial: First poll interval in seconds
+            max_interval: Upper bound for the poll interval in seconds
+            factor: Interval growth factor per poll
+            jitter: Random spread applied to each interval (0.2 = +/-20%)
+            timeout: Maximum wait in seconds (waits indefinitely if not provided)
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID (stable across polls)
+
+        Returns:
+            Task details in their terminal state (a list in the order of
+            task_id when a list was given)
+
+        Raises:
+            OmegaError: If the timeout is exceeded
+
+        Example:
+            >>> final = await client.tasks.poll_until_done(task.task_id, max_interval=2.0)
+            >>> print(f"Status: {final.status}")
+        """
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        # Use stable correlation ID for all polls
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
+
+        task_ids = [task_id] if isinstance(task_id, str) else task_id
+        finished: dict[str, Task] = {}
+        pending = list(dict.fromkeys(task_ids))
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        interval = initial
+
+        while pending:
+            if len(pending) == 1:
+                tasks = [
+                    await self.get(
+                        pending[0],
+                        tenant_id=tenant_id,
+                        actor_id=actor_id,
+                        correlation_id=correlation_id,
+                    )
+                ]
+            else:
+                tasks = await self.get_many(
+                    pending,
+                    tenant_id=tenant_id,
+                    actor_id=actor_id,
+                    correlation_id=correlation_id,
+                )
+            for task in tasks:
+                if task.status in TERMINAL_TASK_STATUSES:
+                    finished[task.task_id] = task
+            pending = [pending_id for pending_id in pending if pending_id not in finished]
+            if not pending:
+                break
+
+            delay = min(max_interval, interval) * (1 + random.uniform(-jitter, jitter))
+            interval *= factor
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise OmegaError(
+                        code="TIMEOUT",
+                        message=f"Task {', '.join(pending)} did not complete within {timeout}s",
+                        retryable=False,
+                    )
+                delay = min(delay, remaining)
+
+            await asyncio.sleep(delay)
+
+        if isinstance(task_id, str):
+            return finished[task_id]
+        return [finished[pending_id] for pending_id in task_ids]
+
+    def _release_watch(self, task_id: str, watch: _TaskWatch) -> None:
+        """Forget a finished watch so later waits resubscribe."""
+        if self._watches.get(task_id) is watch:
+            del self._watches[task_id]
+
+    async def _watch(
+        self,
+        task_id: str,
+        tenant_id: str,
+        actor_id: str,
+        correlation_id: str,
+    ) -> Task:
+        """Drain the task's status stream until a terminal status arrives."""
+        backoff = _RESUBSCRIBE_INITIAL_S
+        while True:
+            received = False
+            events = self._gateway.stream(
+                f"/tasks/{task_id}/watch",
+                tenant_id=tenant_id,
+                actor_id=actor_id,
+                correlation_id=correlation_id,
+            )
+            async with aclosing(events):
+                async for frame in events:
+                    received = True
+                    try:
+                        task = Task.model_validate(frame)
+                    except pydantic.ValidationError as e:
+                        raise OmegaError(
+                            code="INVALID_RESPONSE",
+                            message=f"Failed to parse task status event: {e}",
+                            retryable=False,
+                        )
+                    if task.status in TERMINAL_TASK_STATUSES:
+                        return task
+
+            # The server closed the stream early; make sure we did not miss the
+            # final transition before resubscribing
+            task = await self.get(
+                task_id,
+                tenant_id=tenant_id,
+                actor_id=actor_id,
+                correlation_id=correlation_id,
+            )
+            if task.status in TERMINAL_TASK_STATUSES:
+                return task
+
+            # Back off before resubscribing so a server that keeps closing the
+            # stream straight away is not hammered; delivered frames reset it
+            if received:
+                backoff = _RESUBSCRIBE_INITIAL_S
+            await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+            backoff = min(_RESUBSCRIBE_MAX_S, backoff * 2)
 
 
 class EvidenceNamespace:
@@ -413,6 +980,8 @@ class EvidenceNamespace:
     def __init__(self, gateway: FederationCoreGateway, config: OmegaConfig):
         self._gateway = gateway
         self._config = config
+        self._default_tenant = config.tenant_id or ""
+        self._default_actor = config.actor_id or ""
 
     async def list(
         self,
@@ -435,9 +1004,9 @@ class EvidenceNamespace:
         Returns:
             Evidence pack list response
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
 
         params: dict[str, Any] = {"limit": limit}
         if correlation_id:
@@ -445,16 +1014,15 @@ class EvidenceNamespace:
         if cursor:
             params["cursor"] = cursor
 
-        data = await self._gateway.get(
+        return await self._gateway.get(
             "/compliance/evidence-packs",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
             params=params,
+            envelope_model=_EVIDENCE_LIST_ENVELOPE,
         )
 
-        return EvidencePackListResponse.model_validate(data)
-
     async def get(
         self,
         pack_hash: str,
@@ -474,19 +1042,18 @@ class EvidenceNamespace:
         Returns:
             Evidence pack details
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
 
-        data = await self._gateway.get(
+        return await self._gateway.get(
             f"/compliance/evidence-packs/{pack_hash}",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
+            envelope_model=_EVIDENCE_PACK_ENVELOPE,
         )
 
-        return MemoryEvidencePack.model_validate(data)
-
     async def verify(
         self,
         pack_hash: str,
@@ -506,20 +1073,19 @@ class EvidenceNamespace:
         Returns:
             Verification result
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
 
-        data = await self._gateway.post(
+        return await self._gateway.post(
             f"/compliance/evidence-packs/{pack_hash}:verify",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
             json={},
+            envelope_model=_EVIDENCE_VERIFY_ENVELOPE,
         )
 
-        return EvidenceVerificationResult.model_validate(data)
-
 
 class OmegaClient:
     """
@@ -566,25 +1132,58 @@ class OmegaClient:
         if config is None:
             config = OmegaConfig.from_env()
 
-        # Override config fields if provided
-        if federation_url:
-            config = config.model_copy(update={"federation_url": federation_url})
-        if api_key:
-            config = config.model_copy(update={"api_key": api_key})
-        if tenant_id:
-            config = config.model_copy(update={"tenant_id": tenant_id})
-        if actor_id:
-            config = config.model_copy(update={"actor_id": actor_id})
+        # Override config fields if provided, in a single copy
+        overrides = {
+            name: value
+            for name, value in (
+                ("federation_url", federation_url),
+                ("api_key", api_key),
+                ("tenant_id", tenant_id),
+                ("actor_id", actor_id),
+            )
+            if value
+        }
+        if overrides:
+            config = config.model_copy(update=overrides)
 
         self.config = config
+        self._default_tenant = config.tenant_id or ""
+        self._default_actor = config.actor_id or ""
         self._gateway = FederationCoreGateway(config)
+        # Background connection warmup started by __aenter__
+        self._warmup: Optional[asyncio.Task[None]] = None
+        # Last health() result and when it was fetched
+        self._health_cache: Optional[tuple[float, HealthStatus]] = None
+        self._health_lock = asyncio.Lock()
+
+    # API namespaces, built on first access
 
-        # API namespaces
-        self.tools = ToolsNamespace(self._gateway, config)
-        self.agents = AgentsNamespace(self._gateway, config)
-        self.tasks = TasksNamespace(self._gateway, config)
-        self.evidence = EvidenceNamespace(self._gateway, config)
-        self.workflows = WorkflowsNamespace(self._gateway, config)
+    @cached_property
+    def tools(self) -> ToolsNamespace:
+        """Tools API namespace."""
+        return ToolsNamespace(self._gateway, self.config)
+
+    @cached_property
+    def agents(self) -> AgentsNamespace:
+        """Agents API namespace."""
+        return AgentsNamespace(self._gateway, self.config)
+
+    @cached_property
+    def tasks(self) -> TasksNamespace:
+        """Tasks API namespace."""
+        return TasksNamespace(self._gateway, self.config)
+
+    @cached_property
+    def evidence(self) -> EvidenceNamespace:
+        """Evidence API namespace."""
+        return EvidenceNamespace(self._gateway, self.config)
+
+    @cached_property
+    def workflows(self) -> WorkflowsNamespace:
+        """Workflows API namespace (its models are imported on first access)."""
+        from omega_sdk.workflows import WorkflowsNamespace
+
+        return WorkflowsNamespace(self._gateway, self.config)
 
     @classmethod
     def from_env(cls) -> "OmegaClient":
@@ -608,22 +1207,87 @@ class OmegaClient:
         return cls(config=OmegaConfig.from_env())
 
     async def __aenter__(self) -> "OmegaClient":
-        """Async context manager entry."""
+        """Async context manager entry (starts warming the connection pool)."""
         await self._gateway.__aenter__()
+        self._warmup = asyncio.create_task(self.warmup())
         return self
 
     async def __aexit__(self, *args: Any) -> None:
         """Async context manager exit."""
+        await self._cancel_warmup()
         await self._gateway.__aexit__(*args)
 
     async def close(self) -> None:
         """Close the client."""
+        await self._cancel_warmup()
         await self._gateway.close()
 
-    async def health(self) -> HealthStatus:
+    async def warmup(self, connections: int = 2) -> None:
+        """
+        Open connections to Federation Core ahead of the first request.
+
+        Runs automatically in the background when the client is used as an
+        async context manager; call it directly to warm a client that is not.
+
+        Args:
+            connections: Number of connections to open
+
+        Example:
+            >>> client = OmegaClient.from_env()
+            >>> await client.warmup()
+        """
+        await self._gateway.warmup(connections)
+
+    async def _cancel_warmup(self) -> None:
+        """Stop a still-running background warmup before closing the pool."""
+        if self._warmup is not None and not self._warmup.done():
+            self._warmup.cancel()
+            await asyncio.gather(self._warmup, return_exceptions=True)
+        self._warmup = None
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the client's connection pool has been closed."""
+        return self._gateway._client.is_closed
+
+    @asynccontextmanager
+    async def correlation_scope(
+        self,
+        correlation_id: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Share one correlation ID across every request made inside the block.
+
+        Useful for multi-step operations (create, then wait or poll) that
+        should show up as a single correlation in logs and traces.
+
+        Args:
+            correlation_id: Correlation ID to pin (generated if not provided)
+            tenant_id: Tenant ID (defaults to config)
+
+        Yields:
+            The pinned correlation ID
+
+        Example:
+            >>> async with client.correlation_scope() as cid:
+            ...     task = await client.tasks.create(task_type="workflow.run", input={})
+            ...     final = await client.tasks.poll_until_done(task.task_id)
+        """
+        tenant_id = tenant_id or self._default_tenant
+        with correlation_scope(tenant_id, correlation_id) as scoped_id:
+            yield scoped_id
+
+    async def health(self, max_age: float = 1.0) -> HealthStatus:
         """
         Check Federation Core health.
 
+        Results are reused for max_age seconds, and concurrent calls share a
+        single request, so bursts of probes cost one round trip.
+
+        Args:
+            max_age: Seconds a previous result may be reused (0 always re-checks)
+
         Returns:
             Health status
 
@@ -631,9 +1295,17 @@ class OmegaClient:
             >>> health = await client.health()
             >>> print(f"Federation Core {health.version}: {health.status}")
         """
-        data = await self._gateway._client.get(f"{self._gateway.base_url}/health")
-        envelope = self._gateway._unwrap_envelope(data)
-        return HealthStatus.model_validate(envelope)
+        async with self._health_lock:
+            cached = self._health_cache
+            if cached is not None and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+
+            data = await self._gateway._client.get(
+                _endpoint_url(self._gateway.base_url, "/health")
+            )
+            health = self._gateway._unwrap_envelope(data, _HEALTH_ENVELOPE)
+            self._health_cache = (time.monotonic(), health)
+            return health
 
     async def status(
         self,
@@ -656,15 +1328,39 @@ class OmegaClient:
             >>> status = await client.status()
             >>> print(status.dependencies)
         """
-        tenant_id = tenant_id or self.config.tenant_id or ""
-        actor_id = actor_id or self.config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id = tenant_id or self._default_tenant
+        actor_id = actor_id or self._default_actor
+        correlation_id = correlation_id or current_correlation_id(tenant_id)
 
-        data = await self._gateway.get(
+        return await self._gateway.get(
             "/status",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
+            envelope_model=_STATUS_ENVELOPE,
         )
 
-        return StatusResponse.model_validate(data)
+
+_default_client: Optional[OmegaClient] = None
+
+
+def get_default_client() -> OmegaClient:
+    """
+    Get the process-wide default client.
+
+    The client is built from environment variables on first use and reused
+    afterwards, so notebooks and REPL sessions share one connection pool
+    instead of opening a new one per client. It is rebuilt if it was closed.
+
+    Returns:
+        Shared OmegaClient
+
+    Example:
+        >>> from omega_sdk import get_default_client
+        >>> client = get_default_client()
+        >>> tools = await client.tools.list()
+    """
+    global _default_client
+    if _default_client is None or _default_client.is_closed:
+        _default_client = OmegaClient.from_env()
+    return _default_client
@@ -5,8 +5,21 @@ Supports environment variable mapping for doctrine-compliant configuration.
 """
 
 import os
-from typing import Optional
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# Environment variables read by OmegaConfig.from_env(), in argument order
+_ENV_VARS = (
+    "OMEGA_FEDERATION_URL",
+    "OMEGA_API_KEY",
+    "OMEGA_TENANT_ID",
+    "OMEGA_ACTOR_ID",
+    "OMEGA_TIMEOUT_MS",
+    "OMEGA_MAX_RETRIES",
+    "OMEGA_TRANSPORT",
+)
 
 
 class OmegaConfig(BaseModel):
@@ -23,8 +36,13 @@ class OmegaConfig(BaseModel):
         OMEGA_ACTOR_ID: Default actor ID
         OMEGA_TIMEOUT_MS: Default request timeout in milliseconds
         OMEGA_MAX_RETRIES: Maximum number of retries for transient failures
+        OMEGA_TRANSPORT: HTTP transport ("httpx" or "aiohttp")
     """
 
+    # Immutable: clients resolve their defaults from the config once, so
+    # derive changed configs with model_copy() / with_defaults() instead
+    model_config = ConfigDict(frozen=True)
+
     # Federation Core connection
     federation_url: str = Field(
         default="http://localhost:9405",
@@ -63,6 +81,27 @@ class OmegaConfig(BaseModel):
         le=10,
     )
 
+    pool_size: int = Field(
+        default=100,
+        description="Maximum pooled connections to Federation Core",
+        ge=1,
+        le=1000,
+    )
+
+    pool_keepalive_s: float = Field(
+        default=75.0,
+        description="Seconds an idle pooled connection is kept open",
+        ge=0,
+    )
+
+    transport: Literal["httpx", "aiohttp"] = Field(
+        default="httpx",
+        description=(
+            "HTTP transport; aiohttp handles large concurrent fan-out better "
+            'but needs the aiohttp extra (pip install "omega-sdk[aiohttp]")'
+        ),
+    )
+
     # SDK metadata (sent in requests)
     sdk_name: str = Field(
         default="omega-sdk-python",
@@ -74,11 +113,23 @@ class OmegaConfig(BaseModel):
         description="SDK version (sent in meta)",
     )
 
+    @field_validator("federation_url")
+    @classmethod
+    def _check_federation_url(cls, value: str) -> str:
+        """Reject URLs the HTTP client cannot use before any request is made."""
+        if not value.startswith(("http://", "https://")):
+            raise ValueError(f"federation_url must start with http:// or https://, got: {value}")
+        return value
+
     @classmethod
     def from_env(cls) -> "OmegaConfig":
         """
         Load configuration from environment variables.
 
+        Parsed configs are cached per set of environment values, so repeated
+        calls in one process only re-read the environment. The config is
+        frozen, so the cached instance is returned as-is.
+
         Returns:
             OmegaConfig instance with values from environment
 
@@ -86,14 +137,8 @@ class OmegaConfig(BaseModel):
             >>> config = OmegaConfig.from_env()
             >>> client = OmegaClient(config=config)
         """
-        return cls(
-            federation_url=os.getenv("OMEGA_FEDERATION_URL", "http://localhost:9405"),
-            api_key=os.getenv("OMEGA_API_KEY"),
-            tenant_id=os.getenv("OMEGA_TENANT_ID"),
-            actor_id=os.getenv("OMEGA_ACTOR_ID"),
-            timeout_ms=int(os.getenv("OMEGA_TIMEOUT_MS", "120000")),
-            max_retries=int(os.getenv("OMEGA_MAX_RETRIES", "3")),
-        )
+        snapshot = tuple(os.getenv(name) for name in _ENV_VARS)
+        return _config_from_env(cls, snapshot)
 
     def with_defaults(
         self,
@@ -120,3 +165,21 @@ class OmegaConfig(BaseModel):
                 if v is not None
             }
         )
+
+
+@lru_cache(maxsize=8)
+def _config_from_env(
+    config_class: type[OmegaConfig],
+    snapshot: tuple[Optional[str], ...],
+) -> OmegaConfig:
+    """Build and validate a config from a snapshot of the _ENV_VARS values."""
+    federation_url, api_key, tenant_id, actor_id, timeout_ms, max_retries, transport = snapshot
+    return config_class(
+        federation_url=federation_url or "http://localhost:9405",
+        api_key=api_key,
+        tenant_id=tenant_id,
+        actor_id=actor_id,
+        timeout_ms=int(timeout_ms or "120000"),
+        max_retries=int(max_retries or "3"),
+        transport=transport or "httpx",
+    )
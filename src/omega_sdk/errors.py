@@ -5,7 +5,11 @@ All errors are correlation-aware and structured according to the Federation
 Core error model (KeonResult-style envelope discipline).
 """
 
-from typing import Any, Optional
+import copyreg
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from omega_sdk.models import Error
 
 
 class OmegaError(Exception):
@@ -21,6 +25,10 @@ class OmegaError(Exception):
         request_id: Federation Core request ID (if available)
     """
 
+    # Fixed attribute layout; errors are raised on every failed (and retried)
+    # request, so keep construction cheap
+    __slots__ = ("code", "message", "_details", "retryable", "correlation_id", "request_id")
+
     def __init__(
         self,
         code: str,
@@ -33,11 +41,29 @@ class OmegaError(Exception):
         super().__init__(message)
         self.code = code
         self.message = message
-        self.details = details or {}
+        self._details = details or None
         self.retryable = retryable
         self.correlation_id = correlation_id
         self.request_id = request_id
 
+    @property
+    def details(self) -> dict[str, Any]:
+        """Additional error details (the empty dict is only created when read)."""
+        if self._details is None:
+            self._details = {}
+        return self._details
+
+    @details.setter
+    def details(self, value: Optional[dict[str, Any]]) -> None:
+        self._details = value
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slot values live outside __dict__, so the default exception reduce
+        # drops them; rebuild via __new__ since subclass signatures differ
+        state = {name: getattr(self, name) for name in OmegaError.__slots__}
+        state.update(getattr(self, "__dict__", {}))
+        return copyreg.__newobj__, (type(self), *self.args), state
+
     def __repr__(self) -> str:
         parts = [f"code={self.code!r}", f"message={self.message!r}"]
         if self.correlation_id:
@@ -50,6 +76,8 @@ class OmegaError(Exception):
 class AuthenticationError(OmegaError):
     """Raised when authentication fails (401)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -70,6 +98,8 @@ class AuthenticationError(OmegaError):
 class ForbiddenError(OmegaError):
     """Raised when access is forbidden (403)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Access forbidden",
@@ -90,6 +120,8 @@ class ForbiddenError(OmegaError):
 class ValidationError(OmegaError):
     """Raised when request validation fails (400)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -97,7 +129,7 @@ class ValidationError(OmegaError):
         correlation_id: Optional[str] = None,
         request_id: Optional[str] = None,
     ):
-        details = {"field_errors": field_errors} if field_errors else {}
+        details = {"field_errors": field_errors} if field_errors else None
         super().__init__(
             code="VALIDATION_FAILED",
             message=message,
@@ -111,6 +143,8 @@ class ValidationError(OmegaError):
 class NotFoundError(OmegaError):
     """Raised when a resource is not found (404)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -119,11 +153,14 @@ class NotFoundError(OmegaError):
         correlation_id: Optional[str] = None,
         request_id: Optional[str] = None,
     ):
-        details = {}
-        if resource_type:
-            details["resource_type"] = resource_type
-        if resource_id:
-            details["resource_id"] = resource_id
+        # Only allocate details when there is something to record
+        details: Optional[dict[str, Any]] = None
+        if resource_type or resource_id:
+            details = {}
+            if resource_type:
+                details["resource_type"] = resource_type
+            if resource_id:
+                details["resource_id"] = resource_id
 
         super().__init__(
             code="NOT_FOUND",
@@ -138,6 +175,8 @@ class NotFoundError(OmegaError):
 class ConflictError(OmegaError):
     """Raised when a request conflicts with existing state (409)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -158,6 +197,8 @@ class ConflictError(OmegaError):
 class RateLimitError(OmegaError):
     """Raised when rate limit is exceeded (429)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -165,9 +206,7 @@ class RateLimitError(OmegaError):
         correlation_id: Optional[str] = None,
         request_id: Optional[str] = None,
     ):
-        details = {}
-        if retry_after_ms:
-            details["retry_after_ms"] = retry_after_ms
+        details = {"retry_after_ms": retry_after_ms} if retry_after_ms else None
 
         super().__init__(
             code="RATE_LIMITED",
@@ -182,6 +221,8 @@ class RateLimitError(OmegaError):
 class UpstreamError(OmegaError):
     """Raised when an upstream service fails (502, 503, 504)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -190,11 +231,13 @@ class UpstreamError(OmegaError):
         correlation_id: Optional[str] = None,
         request_id: Optional[str] = None,
     ):
-        details = {}
-        if upstream_service:
-            details["upstream_service"] = upstream_service
-        if upstream_status:
-            details["upstream_status"] = upstream_status
+        details: Optional[dict[str, Any]] = None
+        if upstream_service or upstream_status:
+            details = {}
+            if upstream_service:
+                details["upstream_service"] = upstream_service
+            if upstream_status:
+                details["upstream_status"] = upstream_status
 
         super().__init__(
             code="UPSTREAM_ERROR",
@@ -209,6 +252,8 @@ class UpstreamError(OmegaError):
 class TimeoutError(OmegaError):
     """Raised when a request times out (408, 504)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Request timeout",
@@ -216,9 +261,7 @@ class TimeoutError(OmegaError):
         correlation_id: Optional[str] = None,
         request_id: Optional[str] = None,
     ):
-        details = {}
-        if timeout_ms:
-            details["timeout_ms"] = timeout_ms
+        details = {"timeout_ms": timeout_ms} if timeout_ms else None
 
         super().__init__(
             code="TIMEOUT",
@@ -233,6 +276,8 @@ class TimeoutError(OmegaError):
 class InternalError(OmegaError):
     """Raised when an internal server error occurs (500)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Internal server error",
@@ -266,6 +311,55 @@ ERROR_MAP: dict[int, type[OmegaError]] = {
 }
 
 
+# Builds a typed error from (message, details, correlation_id, request_id),
+# picking the details each subclass takes as keyword arguments
+_ErrorBuilder = Callable[[str, dict[str, Any], Optional[str], Optional[str]], OmegaError]
+
+_BUILDERS: dict[type[OmegaError], _ErrorBuilder] = {
+    ValidationError: lambda m, d, c, r: ValidationError(
+        message=m, field_errors=d.get("field_errors"), correlation_id=c, request_id=r
+    ),
+    AuthenticationError: lambda m, d, c, r: AuthenticationError(
+        message=m, details=d, correlation_id=c, request_id=r
+    ),
+    ForbiddenError: lambda m, d, c, r: ForbiddenError(
+        message=m, details=d, correlation_id=c, request_id=r
+    ),
+    NotFoundError: lambda m, d, c, r: NotFoundError(
+        message=m,
+        resource_type=d.get("resource_type"),
+        resource_id=d.get("resource_id"),
+        correlation_id=c,
+        request_id=r,
+    ),
+    ConflictError: lambda m, d, c, r: ConflictError(
+        message=m, details=d, correlation_id=c, request_id=r
+    ),
+    RateLimitError: lambda m, d, c, r: RateLimitError(
+        message=m, retry_after_ms=d.get("retry_after_ms"), correlation_id=c, request_id=r
+    ),
+    UpstreamError: lambda m, d, c, r: UpstreamError(
+        message=m,
+        upstream_service=d.get("upstream_service"),
+        upstream_status=d.get("upstream_status"),
+        correlation_id=c,
+        request_id=r,
+    ),
+    TimeoutError: lambda m, d, c, r: TimeoutError(
+        message=m, timeout_ms=d.get("timeout_ms"), correlation_id=c, request_id=r
+    ),
+    InternalError: lambda m, d, c, r: InternalError(
+        message=m, details=d, correlation_id=c, request_id=r
+    ),
+}
+
+
+# Status code -> builder, resolved once so dispatch is a single lookup
+_STATUS_BUILDERS: dict[int, _ErrorBuilder] = {
+    status_code: _BUILDERS[error_class] for status_code, error_class in ERROR_MAP.items()
+}
+
+
 def error_from_response(
     status_code: int,
     error_data: dict[str, Any],
@@ -284,85 +378,57 @@ def error_from_response(
     Returns:
         Appropriate OmegaError subclass instance
     """
-    error_class = ERROR_MAP.get(status_code, OmegaError)
-    code = error_data.get("code", "UNKNOWN_ERROR")
     message = error_data.get("message", f"HTTP {status_code} error")
-    details = error_data.get("details", {})
-    retryable = error_data.get("retryable", False)
+    # Envelope errors dumped from the Error model carry details=None
+    details = error_data.get("details") or {}
 
-    # Special handling for specific error types
-    if error_class == ValidationError:
-        return ValidationError(
-            message=message,
-            field_errors=details.get("field_errors"),
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
-    elif error_class == AuthenticationError:
-        return AuthenticationError(
-            message=message,
-            details=details,
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
-    elif error_class == ForbiddenError:
-        return ForbiddenError(
-            message=message,
-            details=details,
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
-    elif error_class == NotFoundError:
-        return NotFoundError(
-            message=message,
-            resource_type=details.get("resource_type"),
-            resource_id=details.get("resource_id"),
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
-    elif error_class == ConflictError:
-        return ConflictError(
-            message=message,
-            details=details,
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
-    elif error_class == RateLimitError:
-        return RateLimitError(
-            message=message,
-            retry_after_ms=details.get("retry_after_ms"),
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
-    elif error_class == UpstreamError:
-        return UpstreamError(
-            message=message,
-            upstream_service=details.get("upstream_service"),
-            upstream_status=details.get("upstream_status"),
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
-    elif error_class == TimeoutError:
-        return TimeoutError(
-            message=message,
-            timeout_ms=details.get("timeout_ms"),
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
-    elif error_class == InternalError:
-        return InternalError(
-            message=message,
-            details=details,
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
-    else:
-        # Fallback for OmegaError base class
-        return OmegaError(
-            code=code,
-            message=message,
-            details=details,
-            retryable=retryable,
-            correlation_id=correlation_id,
-            request_id=request_id,
-        )
+    builder = _STATUS_BUILDERS.get(status_code)
+    if builder is not None:
+        return builder(message, details, correlation_id, request_id)
+
+    # Fallback for OmegaError base class
+    return OmegaError(
+        code=error_data.get("code", "UNKNOWN_ERROR"),
+        message=message,
+        details=details,
+        retryable=error_data.get("retryable", False),
+        correlation_id=correlation_id,
+        request_id=request_id,
+    )
+
+
+def error_from_envelope(
+    status_code: int,
+    error: "Error",
+    correlation_id: Optional[str] = None,
+    request_id: Optional[str] = None,
+) -> OmegaError:
+    """
+    Create an appropriate error instance from a validated envelope error.
+
+    Same mapping as :func:`error_from_response`, reading the fields of the
+    envelope's ``Error`` model directly instead of a dumped dict.
+
+    Args:
+        status_code: HTTP status code
+        error: Error model from the response envelope
+        correlation_id: Correlation ID from response meta
+        request_id: Request ID from response meta
+
+    Returns:
+        Appropriate OmegaError subclass instance
+    """
+    details = error.details or {}
+
+    builder = _STATUS_BUILDERS.get(status_code)
+    if builder is not None:
+        return builder(error.message, details, correlation_id, request_id)
+
+    return OmegaError(
+        code=error.code,
+        message=error.message,
+        details=details,
+        retryable=error.retryable,
+        correlation_id=correlation_id,
+        request_id=request_id,
+    )
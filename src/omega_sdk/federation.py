@@ -10,14 +10,52 @@ handling:
 - Structured logging
 """
 
-from typing import Any, Optional
+import asyncio
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
 import httpx
+import pydantic
 
 from omega_sdk.config import OmegaConfig
 from omega_sdk.models import Envelope
-from omega_sdk.errors import error_from_response, OmegaError
+from omega_sdk.errors import error_from_envelope, error_from_response, OmegaError
+from omega_sdk.utils import codec
 from omega_sdk.utils.retry import create_retry_decorator
-from omega_sdk.utils.correlation import validate_correlation_id
+from omega_sdk.utils.correlation import check_correlation_id
+
+
+@lru_cache(maxsize=256)
+def _endpoint_url(base_url: str, path: str) -> httpx.URL:
+    """Parse an endpoint URL once; httpx reuses a URL object without re-parsing."""
+    return httpx.URL(base_url + path)
+
+
+@lru_cache(maxsize=16)
+def _timeout(timeout_ms: int, stream: bool = False) -> httpx.Timeout:
+    """
+    Build the request timeout for a configured ``timeout_ms``, shared by gateways.
+
+    Event streams stay open until the server pushes a frame, so with
+    ``stream`` only connection setup is bounded.
+    """
+    seconds = timeout_ms / 1000.0
+    return httpx.Timeout(seconds, read=None) if stream else httpx.Timeout(seconds)
+
+
+def _aiohttp_transport(limits: httpx.Limits) -> httpx.AsyncBaseTransport:
+    """
+    Build an aiohttp-backed transport for the httpx client.
+
+    Requests, responses and errors keep their httpx types, so the rest of the
+    gateway is transport-agnostic. aiohttp speaks HTTP/1.1 only.
+    """
+    try:
+        from httpx_aiohttp import AiohttpTransport
+    except ImportError as e:
+        raise ImportError(
+            'transport="aiohttp" requires the aiohttp extra: pip install "omega-sdk[aiohttp]"'
+        ) from e
+    return AiohttpTransport(limits=limits)
 
 
 class FederationCoreGateway:
@@ -41,15 +79,37 @@ class FederationCoreGateway:
         self.config = config
         self.base_url = config.federation_url.rstrip("/") + "/api/v1"
 
-        # Create HTTP client with timeout
-        timeout = httpx.Timeout(config.timeout_ms / 1000.0)
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
+        # Create HTTP client with timeout. HTTP/2 (negotiated over TLS) lets
+        # concurrent calls share one connection instead of opening one each.
+        timeout = _timeout(config.timeout_ms)
+        limits = httpx.Limits(
+            max_connections=config.pool_size,
+            max_keepalive_connections=config.pool_size,
+            keepalive_expiry=config.pool_keepalive_s,
         )
+        if config.transport == "aiohttp":
+            self._client = httpx.AsyncClient(
+                timeout=timeout,
+                transport=_aiohttp_transport(limits),
+                follow_redirects=True,
+            )
+        else:
+            self._client = httpx.AsyncClient(
+                timeout=timeout,
+                limits=limits,
+                http2=True,
+                follow_redirects=True,
+            )
+        self._stream_timeout = _timeout(config.timeout_ms, stream=True)
+
+        # Request-invariant headers; per-call headers are added to a copy
+        self._base_headers = {"Content-Type": "application/json"}
+        if config.api_key:
+            self._base_headers["Authorization"] = f"Bearer {config.api_key}"
 
-        # Create retry decorator
+        # Create retry decorator, applied once to the shared send path
         self._retry = create_retry_decorator(max_attempts=config.max_retries)
+        self._send_with_retry = self._retry(self._send)
 
     async def __aenter__(self) -> "FederationCoreGateway":
         """Async context manager entry."""
@@ -64,6 +124,23 @@ class FederationCoreGateway:
         """Close the HTTP client."""
         await self._client.aclose()
 
+    async def warmup(self, connections: int = 2) -> None:
+        """
+        Pre-establish pooled connections to Federation Core.
+
+        Sends concurrent HEAD requests to the health endpoint so DNS
+        resolution, TCP and TLS setup happen before the first real request.
+        Failures are ignored; the next real request reports them.
+
+        Args:
+            connections: Number of connections to open
+        """
+        url = _endpoint_url(self.base_url, "/health")
+        await asyncio.gather(
+            *(self._client.head(url) for _ in range(connections)),
+            return_exceptions=True,
+        )
+
     def _build_headers(
         self,
         tenant_id: str,
@@ -89,19 +166,14 @@ class FederationCoreGateway:
             CorrelationError: If correlation ID is invalid
         """
         # Validate correlation ID
-        validate_correlation_id(correlation_id)
+        check_correlation_id(correlation_id)
 
-        headers = {
-            "X-Tenant-Id": tenant_id,
-            "X-Actor-Id": actor_id,
-            "X-Correlation-Id": correlation_id,
-            "Content-Type": "application/json",
-        }
+        headers = self._base_headers.copy()
+        headers["X-Tenant-Id"] = tenant_id
+        headers["X-Actor-Id"] = actor_id
+        headers["X-Correlation-Id"] = correlation_id
 
         # Add optional headers
-        if self.config.api_key:
-            headers["Authorization"] = f"Bearer {self.config.api_key}"
-
         if idempotency_key:
             headers["X-Idempotency-Key"] = idempotency_key
 
@@ -110,23 +182,28 @@ class FederationCoreGateway:
 
         return headers
 
-    def _unwrap_envelope(self, response: httpx.Response) -> Any:
+    def _parse_envelope(
+        self,
+        response: httpx.Response,
+        envelope_model: type[Envelope[Any]],
+    ) -> Envelope[Any]:
         """
-        Unwrap response envelope and handle errors.
+        Parse a response envelope, raising a structured error on failure.
 
         Args:
             response: HTTP response
+            envelope_model: Envelope type to validate against
 
         Returns:
-            Response data
+            Validated envelope
 
         Raises:
-            OmegaError: If the response indicates an error
+            OmegaError: If the response is an HTTP error or not a valid envelope
         """
         # Parse JSON
         try:
-            body = response.json()
-        except Exception as e:
+            body = codec.loads(response.content)
+        except ValueError as e:  # json and orjson decode errors are both ValueErrors
             raise OmegaError(
                 code="INVALID_RESPONSE",
                 message=f"Failed to parse JSON response: {e}",
@@ -166,20 +243,51 @@ class FederationCoreGateway:
 
         # Parse envelope
         try:
-            envelope = Envelope.model_validate(body)
-        except Exception as e:
+            return envelope_model.model_validate(body)
+        except pydantic.ValidationError as e:
             raise OmegaError(
                 code="INVALID_ENVELOPE",
                 message=f"Failed to parse response envelope: {e}",
                 retryable=False,
             )
 
+    def _unwrap_envelope(
+        self,
+        response: httpx.Response,
+        envelope_model: type[Envelope[Any]] = Envelope,
+    ) -> Any:
+        """
+        Unwrap response envelope and handle errors.
+
+        Args:
+            response: HTTP response
+            envelope_model: Envelope type to validate against; a parametrized
+                envelope (e.g. ``Envelope[Tool]``) also validates the data
+
+        Returns:
+            Response data
+
+        Raises:
+            OmegaError: If the response indicates an error
+        """
+        envelope: Optional[Envelope[Any]] = None
+        if response.status_code < 400:
+            # Validate successful responses straight from the raw bytes; the
+            # payload is never materialised as an intermediate dict tree
+            try:
+                envelope = envelope_model.model_validate_json(response.content)
+            except ValueError:
+                pass  # Re-parsed below to report a precise error
+
+        if envelope is None:
+            envelope = self._parse_envelope(response, envelope_model)
+
         # Check envelope ok flag
         if not envelope.ok:
             if envelope.error:
-                raise error_from_response(
+                raise error_from_envelope(
                     status_code=response.status_code,
-                    error_data=envelope.error.model_dump(),
+                    error=envelope.error,
                     correlation_id=envelope.meta.correlation_id,
                     request_id=envelope.meta.request_id,
                 )
@@ -192,8 +300,51 @@ class FederationCoreGateway:
                     request_id=envelope.meta.request_id,
                 )
 
+        if envelope.data is None and envelope_model is not Envelope:
+            raise OmegaError(
+                code="INVALID_ENVELOPE",
+                message="Response envelope has no data",
+                retryable=False,
+                correlation_id=envelope.meta.correlation_id,
+                request_id=envelope.meta.request_id,
+            )
+
         return envelope.data
 
+    async def _send(
+        self,
+        method: str,
+        url: httpx.URL,
+        headers: dict[str, str],
+        envelope_model: type[Envelope[Any]],
+        params: Optional[dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> Any:
+        """
+        Send a single request and unwrap its envelope.
+
+        Retried through ``_send_with_retry``; the URL, headers and body are
+        built once by the caller and reused across attempts.
+
+        Args:
+            method: HTTP method
+            url: Endpoint URL
+            headers: Request headers
+            envelope_model: Envelope type the response is validated against
+            params: Query parameters
+            content: Encoded request body
+
+        Returns:
+            Response data
+
+        Raises:
+            OmegaError: On error
+        """
+        response = await self._client.request(
+            method, url, headers=headers, params=params, content=content
+        )
+        return self._unwrap_envelope(response, envelope_model)
+
     async def get(
         self,
         path: str,
@@ -201,6 +352,7 @@ class FederationCoreGateway:
         actor_id: str,
         correlation_id: str,
         params: Optional[dict[str, Any]] = None,
+        envelope_model: type[Envelope[Any]] = Envelope,
     ) -> Any:
         """
         Send GET request to Federation Core.
@@ -211,6 +363,7 @@ class FederationCoreGateway:
             actor_id: Actor identifier
             correlation_id: Correlation ID
             params: Query parameters
+            envelope_model: Envelope type the response is validated against
 
         Returns:
             Response data
@@ -218,16 +371,12 @@ class FederationCoreGateway:
         Raises:
             OmegaError: On error
         """
+        url = _endpoint_url(self.base_url, path)
+        headers = self._build_headers(tenant_id, actor_id, correlation_id)
 
-        @self._retry
-        async def _request() -> Any:
-            url = f"{self.base_url}{path}"
-            headers = self._build_headers(tenant_id, actor_id, correlation_id)
-
-            response = await self._client.get(url, headers=headers, params=params or {})
-            return self._unwrap_envelope(response)
-
-        return await _request()
+        return await self._send_with_retry(
+            "GET", url, headers, envelope_model, params=params or {}
+        )
 
     async def post(
         self,
@@ -238,6 +387,8 @@ class FederationCoreGateway:
         json: dict[str, Any],
         idempotency_key: Optional[str] = None,
         decision_receipt_id: Optional[str] = None,
+        envelope_model: type[Envelope[Any]] = Envelope,
+        headers: Optional[dict[str, str]] = None,
     ) -> Any:
         """
         Send POST request to Federation Core.
@@ -250,6 +401,8 @@ class FederationCoreGateway:
             json: Request body
             idempotency_key: Idempotency key (optional)
             decision_receipt_id: Decision receipt ID (optional)
+            envelope_model: Envelope type the response is validated against
+            headers: Additional headers (override the defaults on conflict)
 
         Returns:
             Response data
@@ -258,18 +411,118 @@ class FederationCoreGateway:
             OmegaError: On error
         """
 
-        @self._retry
-        async def _request() -> Any:
-            url = f"{self.base_url}{path}"
-            headers = self._build_headers(
-                tenant_id,
-                actor_id,
-                correlation_id,
-                idempotency_key=idempotency_key,
-                decision_receipt_id=decision_receipt_id,
+        url = _endpoint_url(self.base_url, path)
+        request_headers = self._build_headers(
+            tenant_id,
+            actor_id,
+            correlation_id,
+            idempotency_key=idempotency_key,
+            decision_receipt_id=decision_receipt_id,
+        )
+        if headers:
+            request_headers.update(headers)
+
+        # Pre-encoded body; Content-Type is already set by _build_headers
+        return await self._send_with_retry(
+            "POST", url, request_headers, envelope_model, content=codec.dumps(json)
+        )
+
+    def _decode_event(self, raw: str) -> Any:
+        """
+        Decode the data of a single server-sent event.
+
+        Args:
+            raw: Joined ``data:`` lines of the event
+
+        Returns:
+            Event data (unwrapped if the frame is a response envelope)
+
+        Raises:
+            OmegaError: If the frame is malformed or carries an error
+        """
+        try:
+            frame = codec.loads(raw)
+        except ValueError as e:
+            raise OmegaError(
+                code="INVALID_RESPONSE",
+                message=f"Failed to parse event frame: {e}",
+                retryable=True,
+            )
+
+        if not (isinstance(frame, dict) and "ok" in frame and "meta" in frame):
+            return frame
+
+        try:
+            envelope = Envelope.model_validate(frame)
+        except pydantic.ValidationError as e:
+            raise OmegaError(
+                code="INVALID_ENVELOPE",
+                message=f"Failed to parse event envelope: {e}",
+                retryable=False,
+            )
+
+        if not envelope.ok:
+            error = envelope.error
+            raise OmegaError(
+                code=error.code if error else "ENVELOPE_ERROR",
+                message=error.message if error else "Event envelope indicates failure",
+                details=error.details if error else None,
+                retryable=error.retryable if error else False,
+                correlation_id=envelope.meta.correlation_id,
+                request_id=envelope.meta.request_id,
             )
 
-            response = await self._client.post(url, headers=headers, json=json)
-            return self._unwrap_envelope(response)
+        return envelope.data
+
+    async def stream(
+        self,
+        path: str,
+        tenant_id: str,
+        actor_id: str,
+        correlation_id: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Subscribe to a server-sent event stream from Federation Core.
+
+        Streams are not retried; the caller decides whether to reconnect
+        once the server closes the stream.
+
+        Args:
+            path: API path (relative to /api/v1)
+            tenant_id: Tenant identifier
+            actor_id: Actor identifier
+            correlation_id: Correlation ID
+            params: Query parameters
+
+        Yields:
+            Decoded data of each event
 
-        return await _request()
+        Raises:
+            OmegaError: If the stream cannot be opened or an event carries an error
+        """
+        url = _endpoint_url(self.base_url, path)
+        headers = self._build_headers(tenant_id, actor_id, correlation_id)
+        headers["Accept"] = "text/event-stream"
+
+        async with self._client.stream(
+            "GET",
+            url,
+            headers=headers,
+            params=params or {},
+            timeout=self._stream_timeout,
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                self._unwrap_envelope(response)
+
+            data_lines: list[str] = []
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].removeprefix(" "))
+                elif not line and data_lines:
+                    yield self._decode_event("\n".join(data_lines))
+                    data_lines = []
+
+            if data_lines:
+                yield self._decode_event("\n".join(data_lines))
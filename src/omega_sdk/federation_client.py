@@ -15,9 +15,9 @@ Implements SDK-001 through SDK-006:
 import hmac
 import hashlib
 import base64
-import json
+import binascii
+import os
 import time
-import secrets
 import logging
 from typing import Dict, Any, List, Optional, Callable
 from abc import ABC, abstractmethod
@@ -25,31 +25,37 @@ from abc import ABC, abstractmethod
 from omega_sdk.config import OmegaConfig
 from omega_sdk.federation import FederationCoreGateway
 from omega_sdk.errors import OmegaError
+from omega_sdk.utils import codec
+from omega_sdk.utils.correlation import current_correlation_id
 
 logger = logging.getLogger(__name__)
 
+# Method and path lines that open every invoke signing string
+_INVOKE_SIGNING_PREFIX = b"POST\n/mcp/tools/invoke\n"
+
+
+def canonicalize_jcs(obj: Any) -> str:
+    """
+    Canonicalize Python object to deterministic JSON string.
+    
+    Uses JSON with sorted keys, compact separators for stable signatures.
+    Encoded natively when orjson is installed, with identical output.
+    """
+    return codec.dumps_canonical(obj)
+
 
 class JCSCanonicalizer:
     """JCS (JSON Canonicalization Scheme) implementation for deterministic JSON"""
 
-    @staticmethod
-    def canonicalize(obj: Any) -> str:
-        """
-        Canonicalize Python object to deterministic JSON string.
-        
-        Uses JSON with sorted keys, compact separators for stable signatures.
-        """
-        return json.dumps(
-            obj,
-            sort_keys=True,
-            separators=(",", ":"),
-            ensure_ascii=True
-        )
+    # Kept for callers of the class API; the client calls canonicalize_jcs()
+    canonicalize = staticmethod(canonicalize_jcs)
 
 
 class PayloadValidator:
     """Validates payload constraints before sending"""
 
+    __slots__ = ("max_payload_bytes", "max_payload_depth")
+
     def __init__(
         self,
         max_payload_bytes: int = 262144,  # 256KB default
@@ -65,7 +71,12 @@ class PayloadValidator:
         Raises:
             OmegaError: If payload exceeds max bytes
         """
-        size = len(canonical_body.encode("utf-8"))
+        # Canonical JSON is ASCII-escaped, so its length is its size in bytes
+        # (isascii() reads a flag CPython keeps on the string)
+        if canonical_body.isascii():
+            size = len(canonical_body)
+        else:
+            size = len(canonical_body.encode("utf-8"))
         if size > self.max_payload_bytes:
             raise OmegaError(
                 code="PAYLOAD_TOO_LARGE",
@@ -86,30 +97,48 @@ class PayloadValidator:
         if max_depth is None:
             max_depth = self.max_payload_depth
 
-        def _check_depth(obj: Any, current_depth: int) -> None:
-            if current_depth > max_depth:
-                raise OmegaError(
-                    code="PAYLOAD_TOO_DEEP",
-                    message=(
-                        f"Payload nesting depth {current_depth} exceeds "
-                        f"limit of {max_depth}"
-                    ),
-                    retryable=False
+        # Walk containers with an explicit stack: no per-value calls and no
+        # recursion limit. A non-empty container at depth d puts values at
+        # depth d + 1, so scalars never need to be visited.
+        current_depth = 0
+        stack = [(obj, 0)] if isinstance(obj, (dict, list, tuple)) else []
+        while current_depth <= max_depth and stack:
+            node, depth = stack.pop()
+            children = node.values() if isinstance(node, dict) else node
+            if children:
+                current_depth = depth + 1
+                stack.extend(
+                    (child, current_depth)
+                    for child in children
+                    if isinstance(child, (dict, list, tuple))
                 )
 
-            if isinstance(obj, dict):
-                for value in obj.values():
-                    _check_depth(value, current_depth + 1)
-            elif isinstance(obj, (list, tuple)):
-                for item in obj:
-                    _check_depth(item, current_depth + 1)
-
-        _check_depth(obj, 0)
+        if current_depth > max_depth:
+            raise OmegaError(
+                code="PAYLOAD_TOO_DEEP",
+                message=(
+                    f"Payload nesting depth {current_depth} exceeds "
+                    f"limit of {max_depth}"
+                ),
+                retryable=False
+            )
 
 
 class SignedInvokeRequest:
     """Represents a signed tool invoke request"""
 
+    # Created on every invoke; a fixed layout avoids a per-instance __dict__
+    __slots__ = (
+        "passport_id",
+        "tool_name",
+        "payload",
+        "timestamp_ms",
+        "nonce",
+        "signature",
+        "sdk_name",
+        "sdk_version",
+    )
+
     def __init__(
         self,
         passport_id: str,
@@ -144,6 +173,20 @@ class SignedInvokeRequest:
 class FederationClientOptions:
     """Configuration options for FederationClient"""
 
+    __slots__ = (
+        "base_url",
+        "client_id",
+        "client_secret",
+        "environment",
+        "passport_id",
+        "allowed_tools",
+        "allowed_tools_set",
+        "signature_mode",
+        "max_payload_bytes",
+        "max_payload_depth",
+        "hmac_secret_b64",
+    )
+
     def __init__(
         self,
         base_url: str = None,
@@ -178,6 +221,8 @@ class FederationClientOptions:
         self.environment = environment
         self.passport_id = passport_id
         self.allowed_tools = allowed_tools or []
+        # Set form for O(1) allowlist checks; the list keeps error messages readable
+        self.allowed_tools_set = frozenset(self.allowed_tools)
         self.signature_mode = signature_mode
         self.max_payload_bytes = max_payload_bytes
         self.max_payload_depth = max_payload_depth
@@ -215,6 +260,17 @@ class FederationClient:
             max_payload_depth=options.max_payload_depth
         )
         self.canonicalizer = JCSCanonicalizer()
+        self._is_production = options.environment == "production"
+
+        # HMAC keyed once with the decoded secret; each signature works on a copy
+        self._hmac_secret_bytes: Optional[bytes] = (
+            base64.b64decode(options.hmac_secret_b64) if options.hmac_secret_b64 else None
+        )
+        self._hmac_template = (
+            hmac.new(self._hmac_secret_bytes, digestmod=hashlib.sha256)
+            if self._hmac_secret_bytes is not None
+            else None
+        )
         
         # Access token (cached)
         self._access_token: Optional[str] = None
@@ -222,14 +278,18 @@ class FederationClient:
         
         self.logger = logger
 
-    async def _ensure_token(self) -> str:
+    async def _ensure_token(self, correlation_id: Optional[str] = None) -> str:
         """
         Get valid access token, refreshing if needed.
         
+        Args:
+            correlation_id: Correlation ID of the calling operation (generated
+                if not provided)
+            
         Returns:
             Bearer token
         """
-        now_ms = int(time.time() * 1000)
+        now_ms = time.time_ns() // 1_000_000
         
         # Use cached token if still valid
         if self._access_token and now_ms < self._token_expiry_ms - 10000:
@@ -241,7 +301,7 @@ class FederationClient:
                 path="/auth/client/token",
                 tenant_id=self.config.tenant_id,
                 actor_id=self.config.actor_id,
-                correlation_id=self.config.get_correlation_id(),
+                correlation_id=correlation_id or current_correlation_id(self.config.tenant_id),
                 json={
                     "client_id": self.options.client_id,
                     "client_secret": self.options.client_secret,
@@ -262,7 +322,8 @@ class FederationClient:
     def _create_signed_request(
         self,
         tool_name: str,
-        payload: Dict[str, Any]
+        payload: Dict[str, Any],
+        canonical_body: Optional[str] = None
     ) -> SignedInvokeRequest:
         """
         Create signed invoke request.
@@ -272,34 +333,36 @@ class FederationClient:
         Args:
             tool_name: Name of tool to invoke
             payload: Tool parameters
+            canonical_body: Canonical JSON of payload (computed if not provided)
             
         Returns:
             SignedInvokeRequest with signature
         """
         # Canonicalize payload
-        canonical_body = self.canonicalizer.canonicalize(payload)
+        if canonical_body is None:
+            canonical_body = canonicalize_jcs(payload)
         
         # Generate nonce and timestamp
-        nonce = base64.b64encode(secrets.token_bytes(12)).decode()
-        timestamp_ms = int(time.time() * 1000)
-        
-        # Create canonical string for signing
-        canonical_string = (
-            f"POST\n"
-            f"/mcp/tools/invoke\n"
-            f"{timestamp_ms}\n"
-            f"{nonce}\n"
-            f"{canonical_body}"
-        )
+        # 12 CSPRNG bytes as base64 (secrets.token_bytes is os.urandom)
+        nonce = binascii.b2a_base64(os.urandom(12), newline=False).decode("ascii")
+        timestamp_ms = time.time_ns() // 1_000_000
         
-        # Compute HMAC-SHA256 signature
-        secret_bytes = base64.b64decode(self.options.hmac_secret_b64)
-        sig = hmac.new(
-            secret_bytes,
-            canonical_string.encode(),
-            hashlib.sha256
-        ).digest()
-        signature = base64.b64encode(sig).decode()
+        if self._hmac_template is None:
+            raise OmegaError(
+                code="SIGNING_KEY_MISSING",
+                message="hmac_secret_b64 is required to sign tool invocations",
+                retryable=False
+            )
+
+        # Compute HMAC-SHA256 over the canonical string
+        # "POST\n/mcp/tools/invoke\n<timestamp>\n<nonce>\n<body>", fed in parts
+        # so the (possibly large) body is never copied into a joined string
+        mac = self._hmac_template.copy()
+        mac.update(_INVOKE_SIGNING_PREFIX)
+        mac.update(f"{timestamp_ms}\n{nonce}\n".encode("ascii"))
+        mac.update(canonical_body.encode("ascii"))
+        sig = mac.digest()
+        signature = binascii.b2a_base64(sig, newline=False).decode("ascii")
         
         return SignedInvokeRequest(
             passport_id=self.options.passport_id,
@@ -322,7 +385,7 @@ class FederationClient:
                 path="/mcp/tools/list",
                 tenant_id=self.config.tenant_id,
                 actor_id=self.config.actor_id,
-                correlation_id=self.config.get_correlation_id()
+                correlation_id=current_correlation_id(self.config.tenant_id)
             )
             
             tools = response.get("tools", [])
@@ -361,14 +424,15 @@ class FederationClient:
         if options is None:
             options = {}
         
-        # SDK-004: Validate payload constraints
-        canonical_body = self.canonicalizer.canonicalize(payload)
-        self.payload_validator.validate_size(canonical_body)
+        # SDK-004: Validate payload constraints. Depth is checked first: it
+        # only walks containers and rejects payloads too deep to encode.
         self.payload_validator.validate_depth(payload)
+        canonical_body = canonicalize_jcs(payload)
+        self.payload_validator.validate_size(canonical_body)
         
         # SDK-005: Enforce tool allowlist in production
-        if self.options.environment == "production":
-            if tool_name not in self.options.allowed_tools:
+        if self._is_production:
+            if tool_name not in self.options.allowed_tools_set:
                 raise OmegaError(
                     code="TOOL_NOT_ALLOWED",
                     message=(
@@ -379,10 +443,12 @@ class FederationClient:
                 )
         
         # SDK-001: Ensure token
-        token = await self._ensure_token()
+        # One correlation ID covers the token refresh and the invocation
+        correlation_id = current_correlation_id(self.config.tenant_id)
+        token = await self._ensure_token(correlation_id)
         
         # Create signed request
-        signed_request = self._create_signed_request(tool_name, payload)
+        signed_request = self._create_signed_request(tool_name, payload, canonical_body)
         
         # Prepare invoke payload with metadata
         invoke_payload = {
@@ -395,16 +461,19 @@ class FederationClient:
         }
         
         try:
-            # Add signature headers to gateway
+            # Signature headers, plus the client-credentials token
             headers = signed_request.to_headers()
+            if token:
+                headers["Authorization"] = f"Bearer {token}"
             
             # Call Federation Core with signature
             response = await self.gateway.post(
                 path="/mcp/tools/invoke",
                 tenant_id=self.config.tenant_id,
                 actor_id=self.config.actor_id,
-                correlation_id=self.config.get_correlation_id(),
-                json=invoke_payload
+                correlation_id=correlation_id,
+                json=invoke_payload,
+                headers=headers
             )
             
             self.logger.info(f"✅ Tool invoked successfully: {tool_name}")
@@ -7,10 +7,13 @@ the canonical contract between SDK and Federation Core.
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Generic, Optional, TypeVar
 from pydantic import BaseModel, Field
 
 
+DataT = TypeVar("DataT")
+
+
 # ============================================================================
 # Envelope & Meta (Core Response Structure)
 # ============================================================================
@@ -34,11 +37,17 @@ class Error(BaseModel):
     retryable: bool = Field(..., description="Whether the error is retryable")
 
 
-class Envelope(BaseModel):
-    """Standard response envelope for all Federation Core responses."""
+class Envelope(BaseModel, Generic[DataT]):
+    """
+    Standard response envelope for all Federation Core responses.
+
+    Parametrize with a response model (e.g. ``Envelope[Tool]``) to validate
+    the envelope and its data in a single pass; the bare ``Envelope`` leaves
+    data untyped.
+    """
 
     ok: bool = Field(..., description="Success indicator")
-    data: Optional[Any] = Field(None, description="Response data (null on error)")
+    data: Optional[DataT] = Field(None, description="Response data (null on error)")
     error: Optional[Error] = Field(None, description="Error details (null on success)")
     meta: Meta = Field(..., description="Response metadata")
 
@@ -188,7 +197,12 @@ class ToolInvokeResult(BaseModel):
 
 
 class TaskStatus(str, Enum):
-    """Task execution status."""
+    """
+    Task execution status.
+
+    Validated models always hold the enum members themselves, so statuses
+    can be compared by identity (``task.status is TaskStatus.COMPLETED``).
+    """
 
     QUEUED = "queued"
     RUNNING = "running"
@@ -197,6 +211,12 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Statuses after which a task never transitions again
+TERMINAL_TASK_STATUSES = frozenset(
+    {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+)
+
+
 class TaskRouting(BaseModel):
     """Task routing configuration."""
 
@@ -264,6 +284,18 @@ class Task(BaseModel):
     audit: Optional[TaskAudit] = Field(None, description="Audit metadata")
 
 
+class TaskBatchGetRequest(BaseModel):
+    """Request body for POST /tasks:batchGet."""
+
+    task_ids: list[str] = Field(..., description="Task identifiers to look up")
+
+
+class TaskBatchGetResponse(BaseModel):
+    """Response data for POST /tasks:batchGet."""
+
+    items: list[Task] = Field(..., description="Task details for the requested IDs")
+
+
 # ============================================================================
 # Health
 # ============================================================================
@@ -2,6 +2,8 @@
 
 from omega_sdk.utils.correlation import (
     make_correlation_id,
+    current_correlation_id,
+    correlation_scope,
     validate_correlation_id,
     normalize_correlation_id,
     CorrelationError,
@@ -9,6 +11,8 @@ from omega_sdk.utils.correlation import (
 
 __all__ = [
     "make_correlation_id",
+    "current_correlation_id",
+    "correlation_scope",
     "validate_correlation_id",
     "normalize_correlation_id",
     "CorrelationError",
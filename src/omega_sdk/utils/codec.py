@@ -0,0 +1,98 @@
+"""
+JSON encoding/decoding for OMEGA SDK.
+
+Uses orjson when it is installed (pip install "omega-sdk[fast]") and falls
+back to the standard library otherwise. Both paths produce the same Python
+objects, so callers never need to know which one is active.
+"""
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+# orjson formats floats differently from json ("1e16" vs "1e+16", "0.00005"
+# vs "5e-05"), so canonical output containing any float is left to json. Every
+# float orjson writes has a "." or "e" right after a digit; the literal-first
+# pattern keeps the scan fast. A match inside a string only costs a fallback.
+_FLOAT = re.compile(rb"[.e](?<=[0-9][.e])")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: Raw JSON (bytes are decoded as UTF-8)
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode an object as compact UTF-8 JSON.
+
+    Args:
+        obj: JSON-serializable object (non-string dict keys are stringified)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_canonical(obj: Any) -> str:
+    """
+    Encode an object as canonical JSON for signing.
+
+    Keys are sorted, separators are compact and non-ASCII characters are
+    escaped. The output is byte-identical to
+    ``json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True)``
+    whichever encoder is active; orjson is only used when its output is known
+    to match, i.e. for payloads without floats, nulls (orjson writes NaN and
+    Infinity as null) or characters json escapes.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Canonical JSON string (ASCII only)
+
+    Raises:
+        TypeError: If the object is not JSON-serializable
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                obj,
+                option=orjson.OPT_SORT_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            )
+        except TypeError:  # Non-str keys, big ints, etc.: json decides
+            pass
+        else:
+            # json escapes DEL and non-ASCII characters; orjson emits them raw
+            if (
+                data.isascii()
+                and b"\x7f" not in data
+                and b"null" not in data
+                and _FLOAT.search(data) is None
+            ):
+                return data.decode("ascii")
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
@@ -0,0 +1,36 @@
+"""
+Concurrency helpers for OMEGA SDK.
+
+Fan-out helpers shared by the namespaces that issue many requests at once.
+"""
+
+import asyncio
+from typing import Awaitable, Iterable, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+
+async def bounded_gather(
+    calls: Iterable[Awaitable[ResultT]],
+    max_concurrency: int,
+) -> list[ResultT]:
+    """
+    Await calls with at most max_concurrency in flight, preserving order.
+
+    If any call fails, the remaining calls are cancelled and the error is
+    raised.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(call: Awaitable[ResultT]) -> ResultT:
+        async with semaphore:
+            return await call
+
+    futures = [asyncio.ensure_future(bounded(call)) for call in calls]
+    try:
+        return list(await asyncio.gather(*futures))
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        await asyncio.gather(*futures, return_exceptions=True)
+        raise
@@ -7,13 +7,70 @@ This ensures all operations are traceable to a tenant and can be correlated
 across distributed systems with time-ordered UUIDs.
 """
 
+import os
 import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
 from uuid import UUID
-from uuid6 import uuid7
 
 
-# Canonical format: t:<tenant>|c:<uuidv7>
-CORRELATION_ID_PATTERN = re.compile(r"^t:([^|]+)\|c:([0-9a-fA-F-]{36})$")
+# Canonical format: t:<tenant>|c:<uuidv7>. The UUID group spells out the
+# 8-4-4-4-12 hex layout, so a full match alone proves the UUID parses. The
+# anchors keep .match()/.search() by callers as strict as fullmatch() here.
+CORRELATION_ID_PATTERN = re.compile(
+    r"^t:([^|]+)\|c:"
+    r"([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+# (tenant_id, correlation_id) pinned by correlation_scope()
+_scoped_correlation: ContextVar[Optional[tuple[str, str]]] = ContextVar(
+    "omega_correlation_id", default=None
+)
+
+
+# Millisecond timestamp and 12-bit rand_a counter of the last generated
+# UUIDv7 (RFC 9562 section 6.2, method 1): IDs within one millisecond count up
+# so IDs from this process stay strictly ordered, and the timestamp only moves
+# past the clock when the counter overflows
+_last_v7_ms = 0
+_v7_counter = 0
+
+
+def _uuid7_str() -> str:
+    """
+    Generate a UUIDv7 directly in its canonical string form.
+
+    48-bit Unix millisecond timestamp, version 7, a 12-bit counter (seeded at
+    random each millisecond), 62 random bits and the RFC 4122 variant,
+    formatted without building a UUID object.
+    """
+    global _last_v7_ms, _v7_counter
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    if timestamp_ms > _last_v7_ms:
+        # New millisecond: random seed with the top bit clear leaves headroom
+        _v7_counter = rand >> 64 & 0x7FF
+    else:
+        # Same millisecond (or the clock stepped back): count up
+        timestamp_ms = _last_v7_ms
+        _v7_counter += 1
+        if _v7_counter > 0xFFF:
+            timestamp_ms += 1
+            _v7_counter = rand >> 64 & 0x7FF
+    _last_v7_ms = timestamp_ms
+
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | _v7_counter << 64
+        | 0x2 << 62
+        | rand & 0x3FFFFFFFFFFFFFFF
+    )
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 class CorrelationError(ValueError):
@@ -44,8 +101,24 @@ def make_correlation_id(tenant_id: str) -> str:
     if not tenant_id.strip():
         raise CorrelationError("Tenant ID cannot be empty")
 
-    correlation_uuid = uuid7()
-    return f"t:{tenant_id}|c:{correlation_uuid}"
+    return f"t:{tenant_id}|c:{_uuid7_str()}"
+
+
+def _split_correlation_id(correlation_id: str) -> tuple[str, str]:
+    """
+    Split a canonical correlation ID into its tenant and UUID strings.
+
+    The pattern already pins the UUID layout, so no UUID object is built.
+
+    Raises:
+        CorrelationError: If correlation ID is invalid
+    """
+    match = CORRELATION_ID_PATTERN.fullmatch(correlation_id)
+    if not match:
+        raise CorrelationError(
+            f"Invalid correlation ID format. Expected 't:<tenant>|c:<uuidv7>', got: {correlation_id}"
+        )
+    return match[1], match[2]
 
 
 def validate_correlation_id(correlation_id: str) -> tuple[str, UUID]:
@@ -66,20 +139,27 @@ def validate_correlation_id(correlation_id: str) -> tuple[str, UUID]:
         >>> print(tenant)
         acme
     """
-    match = CORRELATION_ID_PATTERN.match(correlation_id)
-    if not match:
-        raise CorrelationError(
-            f"Invalid correlation ID format. Expected 't:<tenant>|c:<uuidv7>', got: {correlation_id}"
-        )
+    tenant_id, uuid_str = _split_correlation_id(correlation_id)
+    return tenant_id, UUID(uuid_str)
 
-    tenant_id, uuid_str = match.groups()
 
-    try:
-        correlation_uuid = UUID(uuid_str)
-    except ValueError as e:
-        raise CorrelationError(f"Invalid UUID in correlation ID: {uuid_str}") from e
+def check_correlation_id(correlation_id: str) -> None:
+    """
+    Check that a correlation ID is canonical, without parsing it.
 
-    return tenant_id, correlation_uuid
+    Cheaper than validate_correlation_id() when only validity matters
+    (e.g. on every outbound request).
+
+    Args:
+        correlation_id: Correlation ID to check
+
+    Raises:
+        CorrelationError: If correlation ID is invalid
+    """
+    if CORRELATION_ID_PATTERN.fullmatch(correlation_id) is None:
+        raise CorrelationError(
+            f"Invalid correlation ID format. Expected 't:<tenant>|c:<uuidv7>', got: {correlation_id}"
+        )
 
 
 def normalize_correlation_id(correlation_id: str) -> str:
@@ -95,5 +175,61 @@ def normalize_correlation_id(correlation_id: str) -> str:
     Raises:
         CorrelationError: If correlation ID is invalid
     """
-    tenant_id, correlation_uuid = validate_correlation_id(correlation_id)
-    return f"t:{tenant_id}|c:{correlation_uuid}"
+    tenant_id, uuid_str = _split_correlation_id(correlation_id)
+    return f"t:{tenant_id}|c:{uuid_str.lower()}"
+
+
+def current_correlation_id(tenant_id: str) -> str:
+    """
+    Get the correlation ID for a request made on behalf of a tenant.
+
+    Returns the ID pinned by an enclosing correlation_scope() for the same
+    tenant, or a freshly generated one otherwise.
+
+    Args:
+        tenant_id: Tenant identifier
+
+    Returns:
+        Canonical correlation ID: t:<tenant>|c:<uuidv7>
+    """
+    scoped = _scoped_correlation.get()
+    if scoped is not None and scoped[0] == tenant_id:
+        return scoped[1]
+    return make_correlation_id(tenant_id)
+
+
+@contextmanager
+def correlation_scope(tenant_id: str, correlation_id: Optional[str] = None) -> Iterator[str]:
+    """
+    Pin one correlation ID for every request made inside the block.
+
+    The scope follows the current context, so tasks spawned inside the block
+    share the ID as well.
+
+    Args:
+        tenant_id: Tenant identifier
+        correlation_id: Correlation ID to pin (generated if not provided)
+
+    Yields:
+        The pinned correlation ID
+
+    Raises:
+        CorrelationError: If correlation_id is not canonical or belongs to
+            another tenant
+
+    Example:
+        >>> with correlation_scope("acme") as cid:
+        ...     assert current_correlation_id("acme") == cid
+    """
+    if correlation_id is None:
+        correlation_id = make_correlation_id(tenant_id)
+    elif _split_correlation_id(correlation_id)[0] != tenant_id:
+        raise CorrelationError(
+            f"Correlation ID {correlation_id} does not belong to tenant {tenant_id}"
+        )
+
+    token = _scoped_correlation.set((tenant_id, correlation_id))
+    try:
+        yield correlation_id
+    finally:
+        _scoped_correlation.reset(token)
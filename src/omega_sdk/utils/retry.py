@@ -1,14 +1,15 @@
 """
 Retry policy for OMEGA SDK.
 
-Implements bounded retries with exponential backoff for transient errors.
+Implements bounded retries with jittered exponential backoff for transient
+errors.
 """
 
 from typing import Any, Callable, TypeVar
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception,
     RetryError,
 )
@@ -35,10 +36,19 @@ def is_retryable_error(exception: BaseException) -> bool:
     return isinstance(exception, (ConnectionError, TimeoutError))
 
 
+def _no_retry(func: Callable[..., T]) -> Callable[..., T]:
+    """Retry decorator for a single attempt: the function itself."""
+    return func
+
+
 def create_retry_decorator(max_attempts: int = 3) -> Callable:
     """
     Create a retry decorator with SDK retry policy.
 
+    Waits are drawn at random up to an exponentially growing cap (1s, 2s,
+    4s, ... up to 10s), so clients failing together do not retry in lockstep.
+    With a single attempt the decorator returns functions unchanged.
+
     Args:
         max_attempts: Maximum number of attempts (including initial)
 
@@ -51,9 +61,12 @@ def create_retry_decorator(max_attempts: int = 3) -> Callable:
         ...     # API call that may fail transiently
         ...     pass
     """
+    if max_attempts <= 1:
+        return _no_retry
+
     return retry(
         stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=wait_random_exponential(multiplier=1, min=1, max=10),
         retry=retry_if_exception(is_retryable_error),
         reraise=True,
     )
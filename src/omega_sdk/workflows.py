@@ -7,9 +7,10 @@ the Federation Core workflow execution API.
 Supports:
 - Starting workflow runs
 - Getting run status and details
-- Retrieving run logs
+- Retrieving run logs (single page or paged iteration)
 - Resuming paused runs (gate approval/denial)
-- Polling for completion (optional)
+- Streaming run events
+- Waiting for completion (event stream, polling as fallback)
 
 Usage:
     >>> client = OmegaClient.from_env()
@@ -23,16 +24,24 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import random
+from contextlib import aclosing
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+import httpx
+import pydantic
+from pydantic import BaseModel, Field, TypeAdapter
 
 from omega_sdk.config import OmegaConfig
+from omega_sdk.errors import OmegaError, ValidationError
 from omega_sdk.federation import FederationCoreGateway
-from omega_sdk.utils.correlation import make_correlation_id
+from omega_sdk.utils import codec
+from omega_sdk.utils.concurrency import bounded_gather
+from omega_sdk.utils.correlation import current_correlation_id
 
 
 # =============================================================================
@@ -149,31 +158,177 @@ class WorkflowRunResult(BaseModel):
     logs: list[WorkflowRunLogEntry] = Field(default_factory=list)
 
 
-class ResumeRunResult(BaseModel):
+class WorkflowRunEvent(BaseModel):
+    """An event pushed on a workflow run's event stream."""
+
+    event: str = Field(..., description="Event type: status, log, gate (others are passed through)")
+    status: Optional[WorkflowRunStatus] = Field(None, description="New run status (status events)")
+    log: Optional[WorkflowRunLogEntry] = Field(None, description="Log entry (log events)")
+    gate: Optional[GateInfo] = Field(None, description="Gate record (gate events)")
+    data: Any = Field(None, description="Decoded event data")
+
+
+class ResumeRunResult(BaseModel):
     """Result of resuming a paused workflow run."""
 
     run_id: str = Field(..., description="Run identifier")
     status: WorkflowRunStatus = Field(..., description="New run status")
     gate_id: str = Field(..., description="Gate that was resolved")
     gate_status: GateStatus = Field(..., description="Gate resolution status")
-    message: str = Field(..., description="Result message")
-
-
-class WorkflowRegisterRequest(BaseModel):
-    """Request for workflow artifact registration."""
-    workflow_yaml: str
-    prompts_poml: str
-    schemas: dict[str, Any] = Field(default_factory=dict)
-    workflow_id: Optional[str] = None
-    version: Optional[str] = None
-
-
-class WorkflowRegisterResult(BaseModel):
-    """Workflow registration response."""
-    workflow_id: str
-    version: str
-    artifact_hashes: dict[str, Any]
-    idempotent: bool = False
+    message: str = Field(..., description="Result message")
+
+
+class WorkflowRegisterRequest(BaseModel):
+    """Request for workflow artifact registration."""
+    workflow_yaml: str
+    prompts_poml: str
+    schemas: dict[str, Any] = Field(default_factory=dict)
+    workflow_id: Optional[str] = None
+    version: Optional[str] = None
+
+
+class WorkflowRegisterResult(BaseModel):
+    """Workflow registration response."""
+    workflow_id: str
+    version: str
+    artifact_hashes: dict[str, Any]
+    idempotent: bool = False
+
+
+# Statuses with which a run stream open fails when the server has no event
+# stream; wait_for_completion then polls instead
+_EVENTS_UNSUPPORTED_STATUSES = frozenset({404, 405, 406, 426, 501})
+
+# Status lookup by wire value; dict access is cheaper than Enum.__call__
+_RUN_STATUS_BY_VALUE = {status.value: status for status in WorkflowRunStatus}
+
+# Run statuses at which wait_for_completion stops, as raw strings so polls
+# compare the decoded status without building the enum
+_WAIT_STOP_STATUSES = frozenset(
+    {
+        WorkflowRunStatus.COMPLETED.value,
+        WorkflowRunStatus.FAILED.value,
+        WorkflowRunStatus.CANCELLED.value,
+        WorkflowRunStatus.PAUSED.value,  # Also stop on paused (gate required)
+    }
+)
+
+# List validators built once at import, so a whole list of logs or gates is
+# validated in one call rather than one model_validate per item
+_LOG_LIST_ADAPTER = TypeAdapter(list[WorkflowRunLogEntry])
+_GATE_LIST_ADAPTER = TypeAdapter(list[GateInfo])
+
+
+def _fc_response_data(response: httpx.Response) -> Any:
+    """
+    Decode an FC response body (an empty success body decodes to ``{}``).
+
+    Raises:
+        OmegaError: FC_ERROR carrying the response detail for 4xx/5xx statuses
+            (retryable for 5xx)
+    """
+    status_code = response.status_code
+    if status_code < 400:
+        # Empty bodies (204 and the like) carry no data
+        return codec.loads(response.content) if response.content else {}
+
+    # Try to extract error details
+    detail = f"HTTP {status_code}"
+    try:
+        detail_raw = codec.loads(response.content).get("detail", detail)
+        if isinstance(detail_raw, dict):
+            detail = detail_raw.get("message", detail)
+        else:
+            detail = detail_raw
+    except Exception:
+        pass
+
+    raise OmegaError(
+        code="FC_ERROR",
+        message=str(detail),
+        details={"status_code": status_code},
+        retryable=status_code >= 500,
+    )
+
+
+def _run_event(event: str, data: str) -> WorkflowRunEvent:
+    """
+    Decode one run stream event, typing status, log and gate payloads.
+
+    Raises:
+        OmegaError: INVALID_RESPONSE if the data is not JSON, a typed event's
+            data is not an object, or its payload does not validate
+    """
+    try:
+        payload = codec.loads(data)
+    except ValueError as e:  # json and orjson decode errors are both ValueErrors
+        raise OmegaError(
+            code="INVALID_RESPONSE",
+            message=f"Failed to parse {event} event: {e}",
+            retryable=True,
+        )
+
+    fields: dict[str, Any] = {"event": event, "data": payload}
+    if event in ("status", "log", "gate"):
+        if not isinstance(payload, dict):
+            raise OmegaError(
+                code="INVALID_RESPONSE",
+                message=f"{event} event data is not a JSON object",
+                retryable=False,
+            )
+        if event == "status":
+            fields["status"] = payload.get("status")
+        else:
+            fields[event] = payload
+
+    try:
+        return WorkflowRunEvent.model_validate(fields)
+    except pydantic.ValidationError as e:
+        raise OmegaError(
+            code="INVALID_RESPONSE",
+            message=f"Failed to parse {event} event: {e}",
+            retryable=False,
+        )
+
+
+def _derive_idempotency_key(*parts: Any) -> str:
+    """Derive a stable idempotency key from the canonical JSON of parts."""
+    canonical = codec.dumps_canonical(list(parts)).encode("utf-8")
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def _build_run_result(
+    data: dict[str, Any],
+    fallback_correlation_id: str,
+    compute_gate_info: bool = False,
+) -> WorkflowRunResult:
+    """
+    Build a WorkflowRunResult from an FC run response.
+
+    Args:
+        data: FC response, either ``{run, logs, gates}`` or a bare run
+        fallback_correlation_id: Correlation ID used when the run has none
+        compute_gate_info: Set gate_info to the first pending gate of a paused run
+
+    Returns:
+        WorkflowRunResult validated in a single pass
+    """
+    run_data = data.get("run", data)
+    gates = _GATE_LIST_ADAPTER.validate_python(data.get("gates", []))
+
+    gate_info = None
+    if compute_gate_info and run_data.get("status") == "paused":
+        gate_info = next((g for g in gates if g.status is GateStatus.PENDING), None)
+
+    return WorkflowRunResult.model_validate(
+        {
+            **run_data,
+            "correlation_id": run_data.get("correlation_id", fallback_correlation_id),
+            "gate_info": gate_info,
+            "gates": gates,
+            "logs": _LOG_LIST_ADAPTER.validate_python(data.get("logs", [])),
+        }
+    )
 
 
 # =============================================================================
@@ -192,101 +347,89 @@ class WorkflowsNamespace:
     def __init__(self, gateway: FederationCoreGateway, config: OmegaConfig):
         self._gateway = gateway
         self._config = config
+        self._default_tenant = config.tenant_id or ""
+        self._default_actor = config.actor_id or ""
         # FC routes use /api/fc prefix, not /api/v1
-        # We'll construct the full URL directly
+        # We'll construct the full URL directly; fixed endpoints are built once
         self._fc_base_url = config.federation_url.rstrip("/") + "/api/fc"
+        self._runs_url = self._fc_base_url + "/runs"
+        self._register_url = self._fc_base_url + "/workflows/register"
+        # Invariant headers, copied and extended per request
+        self._get_headers_base: dict[str, str] = {}
+        if config.api_key:
+            self._get_headers_base["Authorization"] = f"Bearer {config.api_key}"
+        self._post_headers_base = {
+            **self._get_headers_base,
+            "Content-Type": "application/json",
+        }
+
+    def _resolve_ctx(
+        self,
+        tenant_id: Optional[str],
+        actor_id: Optional[str],
+        correlation_id: Optional[str],
+    ) -> tuple[str, str, str]:
+        """Fill tenant and actor from config and correlation from the current scope."""
+        tenant_id = tenant_id or self._default_tenant
+        return (
+            tenant_id,
+            actor_id or self._default_actor,
+            correlation_id or current_correlation_id(tenant_id),
+        )
+
+    def _get_headers(self, tenant_id: str, actor_id: str, correlation_id: str) -> dict[str, str]:
+        """Build GET headers from the invariant template."""
+        headers = self._get_headers_base.copy()
+        headers["X-Tenant-Id"] = tenant_id
+        headers["X-Actor-Id"] = actor_id
+        headers["X-Correlation-Id"] = correlation_id
+        return headers
 
     async def _fc_post(
         self,
-        path: str,
+        url: str,
         tenant_id: str,
         actor_id: str,
         correlation_id: str,
         json: dict[str, Any],
         idempotency_key: Optional[str] = None,
     ) -> Any:
-        """Send POST request to FC routes (not /api/v1)."""
-        import httpx
-
-        url = f"{self._fc_base_url}{path}"
-        headers = {
-            "X-Tenant-Id": tenant_id,
-            "X-Actor-Id": actor_id,
-            "X-Correlation-Id": correlation_id,
-            "Content-Type": "application/json",
-        }
-
-        if self._config.api_key:
-            headers["Authorization"] = f"Bearer {self._config.api_key}"
-
+        """Send POST request to an FC route URL (not /api/v1)."""
+        headers = self._post_headers_base.copy()
+        headers["X-Tenant-Id"] = tenant_id
+        headers["X-Actor-Id"] = actor_id
+        headers["X-Correlation-Id"] = correlation_id
         if idempotency_key:
             headers["X-Idempotency-Key"] = idempotency_key
 
         response = await self._gateway._client.post(url, headers=headers, json=json)
 
-        if response.status_code >= 400:
-            # Try to extract error details
-            try:
-                body = response.json()
-                detail_raw = body.get("detail", f"HTTP {response.status_code}")
-                if isinstance(detail_raw, dict):
-                    detail = detail_raw.get("message", f"HTTP {response.status_code}")
-                else:
-                    detail = detail_raw
-            except Exception:
-                detail = f"HTTP {response.status_code}"
-
-            from omega_sdk.errors import OmegaError
-            raise OmegaError(
-                code="FC_ERROR",
-                message=str(detail),
-                retryable=response.status_code >= 500,
-            )
-
-        return response.json()
+        return _fc_response_data(response)
 
     async def _fc_get(
         self,
-        path: str,
+        url: str,
         tenant_id: str,
         actor_id: str,
         correlation_id: str,
         params: Optional[dict[str, Any]] = None,
     ) -> Any:
-        """Send GET request to FC routes (not /api/v1)."""
-        url = f"{self._fc_base_url}{path}"
-        headers = {
-            "X-Tenant-Id": tenant_id,
-            "X-Actor-Id": actor_id,
-            "X-Correlation-Id": correlation_id,
-        }
-
-        if self._config.api_key:
-            headers["Authorization"] = f"Bearer {self._config.api_key}"
+        """Send GET request to an FC route URL (not /api/v1)."""
+        headers = self._get_headers(tenant_id, actor_id, correlation_id)
+        return await self._fc_get_raw(url, headers, params)
 
+    async def _fc_get_raw(
+        self,
+        url: str,
+        headers: dict[str, str],
+        params: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """Send GET request with prebuilt headers (reused across polls)."""
         response = await self._gateway._client.get(
             url, headers=headers, params=params or {}
         )
 
-        if response.status_code >= 400:
-            try:
-                body = response.json()
-                detail_raw = body.get("detail", f"HTTP {response.status_code}")
-                if isinstance(detail_raw, dict):
-                    detail = detail_raw.get("message", f"HTTP {response.status_code}")
-                else:
-                    detail = detail_raw
-            except Exception:
-                detail = f"HTTP {response.status_code}"
-
-            from omega_sdk.errors import OmegaError
-            raise OmegaError(
-                code="FC_ERROR",
-                message=str(detail),
-                retryable=response.status_code >= 500,
-            )
-
-        return response.json()
+        return _fc_response_data(response)
 
     async def run_workflow(
         self,
@@ -296,6 +439,8 @@ class WorkflowsNamespace:
         actor_id: Optional[str] = None,
         correlation_id: Optional[str] = None,
         options: Optional[WorkflowRunOptions] = None,
+        idempotency_key: Optional[str] = None,
+        deterministic_idempotency: bool = False,
     ) -> WorkflowRunResult:
         """
         Start a new workflow run.
@@ -307,6 +452,10 @@ class WorkflowsNamespace:
             actor_id: Actor ID (defaults to config)
             correlation_id: Correlation ID (auto-generated if not provided)
             options: Workflow run options
+            idempotency_key: Key that lets FC deduplicate retried starts
+                (random per call if not provided)
+            deterministic_idempotency: Derive the key from tenant, workflow
+                and inputs, so identical starts collapse into one run
 
         Returns:
             WorkflowRunResult with run_id and status
@@ -318,9 +467,9 @@ class WorkflowsNamespace:
             ... )
             >>> print(f"Run: {result.run_id}, Status: {result.status}")
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
 
         # Build request body
         request_body: dict[str, Any] = {
@@ -328,6 +477,14 @@ class WorkflowsNamespace:
             "input_payload": inputs or {},
         }
 
+        if idempotency_key is None:
+            if deterministic_idempotency:
+                idempotency_key = _derive_idempotency_key(
+                    tenant_id, workflow_id, request_body["input_payload"]
+                )
+            else:
+                idempotency_key = uuid4().hex
+
         if options:
             if options.metadata:
                 request_body["metadata"] = options.metadata
@@ -338,46 +495,64 @@ class WorkflowsNamespace:
 
         # POST /api/fc/runs
         data = await self._fc_post(
-            "/runs",
+            self._runs_url,
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
             json=request_body,
-            idempotency_key=str(uuid4()),
+            idempotency_key=idempotency_key,
         )
 
         # FC returns { run: {...}, logs: [...], gates: [...] }
-        run_data = data.get("run", data)
-
-        return WorkflowRunResult(
-            run_id=run_data["run_id"],
-            workflow_id=run_data["workflow_id"],
-            workflow_version=run_data.get("workflow_version", "1.0.0"),
-            status=WorkflowRunStatus(run_data["status"]),
-            current_step=run_data.get("current_step"),
-            step_index=run_data.get("step_index", 0),
-            tenant_id=run_data["tenant_id"],
-            actor_id=run_data["actor_id"],
-            correlation_id=run_data.get("correlation_id", correlation_id),
-            input_payload=run_data.get("input_payload", {}),
-            output_payload=run_data.get("output_payload"),
-            error_details=run_data.get("error_details"),
-            receipt_chain=run_data.get("receipt_chain", []),
-            workflow_receipt_hash=run_data.get("workflow_receipt_hash"),
-            evidence_pack_hash=run_data.get("evidence_pack_hash"),
-            evidence_pack_refs=run_data.get("evidence_pack_refs", []),
-            created_at=run_data.get("created_at"),
-            started_at=run_data.get("started_at"),
-            completed_at=run_data.get("completed_at"),
-            updated_at=run_data.get("updated_at"),
-            logs=[
-                WorkflowRunLogEntry.model_validate(log)
-                for log in data.get("logs", [])
-            ],
-            gates=[
-                GateInfo.model_validate(gate)
-                for gate in data.get("gates", [])
-            ],
+        return _build_run_result(data, correlation_id, compute_gate_info=True)
+
+    async def run_many(
+        self,
+        requests: list[dict[str, Any]],
+        max_concurrency: int = 32,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> list[WorkflowRunResult]:
+        """
+        Start several workflow runs concurrently.
+
+        Each request is a dict of run_workflow() arguments (workflow_id and
+        optionally inputs, options, idempotency_key). Tenant, actor and
+        correlation are resolved once for the whole batch, and at most
+        max_concurrency starts are in flight at a time. If one start fails,
+        the others are cancelled and the error is raised.
+
+        Args:
+            requests: run_workflow() arguments, one dict per run
+            max_concurrency: Maximum starts in flight
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID shared by the batch (auto-generated if not provided)
+
+        Returns:
+            Started runs, in the order of requests
+
+        Example:
+            >>> runs = await client.workflows.run_many(
+            ...     [{"workflow_id": "council-of-titans", "inputs": {"topic": t}} for t in topics]
+            ... )
+        """
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
+
+        return await bounded_gather(
+            (
+                self.run_workflow(
+                    **request,
+                    tenant_id=tenant_id,
+                    actor_id=actor_id,
+                    correlation_id=correlation_id,
+                )
+                for request in requests
+            ),
+            max_concurrency,
         )
 
     async def get_run(
@@ -409,9 +584,9 @@ class WorkflowsNamespace:
             >>> if run.status == WorkflowRunStatus.PAUSED:
             ...     print(f"Gate: {run.gates[0].gate_name}")
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
 
         params: dict[str, Any] = {}
         if include_logs:
@@ -420,52 +595,56 @@ class WorkflowsNamespace:
             params["include_gates"] = "true"
 
         data = await self._fc_get(
-            f"/runs/{run_id}",
+            f"{self._runs_url}/{run_id}",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
             params=params,
         )
 
-        run_data = data.get("run", data)
-
-        # Find pending gate if run is paused
-        gate_info = None
-        gates = [GateInfo.model_validate(g) for g in data.get("gates", [])]
-        if run_data.get("status") == "paused":
-            pending_gates = [g for g in gates if g.status == GateStatus.PENDING]
-            if pending_gates:
-                gate_info = pending_gates[0]
-
-        return WorkflowRunResult(
-            run_id=run_data["run_id"],
-            workflow_id=run_data["workflow_id"],
-            workflow_version=run_data.get("workflow_version", "1.0.0"),
-            status=WorkflowRunStatus(run_data["status"]),
-            current_step=run_data.get("current_step"),
-            step_index=run_data.get("step_index", 0),
-            tenant_id=run_data["tenant_id"],
-            actor_id=run_data["actor_id"],
-            correlation_id=run_data.get("correlation_id", correlation_id),
-            input_payload=run_data.get("input_payload", {}),
-            output_payload=run_data.get("output_payload"),
-            error_details=run_data.get("error_details"),
-            receipt_chain=run_data.get("receipt_chain", []),
-            workflow_receipt_hash=run_data.get("workflow_receipt_hash"),
-            evidence_pack_hash=run_data.get("evidence_pack_hash"),
-            evidence_pack_refs=run_data.get("evidence_pack_refs", []),
-            gate_info=gate_info,
-            gates=gates,
-            created_at=run_data.get("created_at"),
-            started_at=run_data.get("started_at"),
-            completed_at=run_data.get("completed_at"),
-            updated_at=run_data.get("updated_at"),
-            logs=[
-                WorkflowRunLogEntry.model_validate(log)
-                for log in data.get("logs", [])
-            ],
+        return _build_run_result(data, correlation_id, compute_gate_info=True)
+
+    async def get_run_status(
+        self,
+        run_id: str,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> WorkflowRunStatus:
+        """
+        Get only the status of a workflow run.
+
+        Fetches the run without logs or gates and reads just its status,
+        skipping validation of the full run payload. Use it for cheap polling
+        and call get_run() once the status is interesting.
+
+        Args:
+            run_id: Run identifier
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID (auto-generated if not provided)
+
+        Returns:
+            Current run status
+
+        Example:
+            >>> status = await client.workflows.get_run_status("run-123")
+            >>> print(f"Status: {status}")
+        """
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
+        data = await self._fc_get(
+            f"{self._runs_url}/{run_id}",
+            tenant_id=tenant_id,
+            actor_id=actor_id,
+            correlation_id=correlation_id,
         )
 
+        status = data.get("run", data)["status"]
+        # Unknown values go through the enum so they raise its ValueError
+        return _RUN_STATUS_BY_VALUE.get(status) or WorkflowRunStatus(status)
+
     async def get_run_logs(
         self,
         run_id: str,
@@ -496,9 +675,9 @@ class WorkflowsNamespace:
             >>> for log in logs:
             ...     print(f"[{log.event_type}] {log.message}")
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
 
         params: dict[str, Any] = {
             "limit": limit,
@@ -508,7 +687,7 @@ class WorkflowsNamespace:
             params["event_type"] = event_type
 
         data = await self._fc_get(
-            f"/runs/{run_id}/logs",
+            f"{self._runs_url}/{run_id}/logs",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
@@ -517,19 +696,73 @@ class WorkflowsNamespace:
 
         # Response is a list of log entries
         if isinstance(data, list):
-            return [WorkflowRunLogEntry.model_validate(log) for log in data]
+            return _LOG_LIST_ADAPTER.validate_python(data)
         return []
 
-    async def resume_run(
-        self,
-        run_id: str,
-        gate_id: str,
-        decision: str = "approve",
-        input: Optional[dict[str, Any]] = None,
-        decision_receipt_id: Optional[str] = None,
-        tenant_id: Optional[str] = None,
-        actor_id: Optional[str] = None,
-        correlation_id: Optional[str] = None,
+    async def iter_run_logs(
+        self,
+        run_id: str,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[WorkflowRunLogEntry]:
+        """
+        Iterate over all logs for a workflow run, page by page.
+
+        Pages of up to page_size entries are fetched as the iteration reaches
+        them, so at most one page is held in memory. Offsets advance by the
+        entries actually returned, so a server that caps the page size still
+        yields every entry. Iteration ends at the first empty page.
+
+        Args:
+            run_id: Run identifier
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID shared by all pages (auto-generated if not provided)
+            event_type: Filter by event type (e.g., "FC-RUN-001")
+            page_size: Entries requested per page (the server may return fewer)
+
+        Yields:
+            Log entries in server order
+
+        Example:
+            >>> async for log in client.workflows.iter_run_logs("run-123"):
+            ...     print(f"[{log.event_type}] {log.message}")
+        """
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
+
+        url = f"{self._runs_url}/{run_id}/logs"
+        headers = self._get_headers(tenant_id, actor_id, correlation_id)
+        params: dict[str, Any] = {"limit": page_size}
+        if event_type:
+            params["event_type"] = event_type
+
+        offset = 0
+        while True:
+            data = await self._fc_get_raw(url, headers, {**params, "offset": offset})
+            page = _LOG_LIST_ADAPTER.validate_python(data) if isinstance(data, list) else []
+            if not page:
+                return
+            for entry in page:
+                yield entry
+            offset += len(page)
+
+    async def resume_run(
+        self,
+        run_id: str,
+        gate_id: str,
+        decision: str = "approve",
+        input: Optional[dict[str, Any]] = None,
+        decision_receipt_id: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        deterministic_idempotency: bool = False,
     ) -> WorkflowRunResult:
         """
         Resume a paused workflow run after gate resolution.
@@ -537,12 +770,15 @@ class WorkflowsNamespace:
         Args:
             run_id: Run identifier
             gate_id: Gate identifier to resolve
-            decision: "approve" or "deny"
-            input: Optional resume input payload
-            decision_receipt_id: Optional Keon decision receipt ID
+            decision: "approve" or "deny"
+            input: Optional resume input payload
+            decision_receipt_id: Optional Keon decision receipt ID
             tenant_id: Tenant ID (defaults to config)
             actor_id: Actor ID (defaults to config)
             correlation_id: Correlation ID (auto-generated if not provided)
+            idempotency_key: Key that lets FC deduplicate retried resumes
+            deterministic_idempotency: Derive the key from run, gate, decision
+                and receipt when no key is given
 
         Returns:
             Updated WorkflowRunResult
@@ -554,104 +790,165 @@ class WorkflowsNamespace:
             >>> run = await client.workflows.get_run("run-123")
             >>> if run.status == WorkflowRunStatus.PAUSED:
             ...     gate = run.gate_info
-            ...     result = await client.workflows.resume_run(
-            ...         run_id=run.run_id,
-            ...         gate_id=gate.gate_id,
-            ...         decision="approve"
-            ...     )
-            ...     print(f"Resumed: {result.status}")
-        """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
-
-        if decision not in ("approve", "deny"):
-            from omega_sdk.errors import ValidationError
-            raise ValidationError("decision must be 'approve' or 'deny'")
-
-        request_body: dict[str, Any] = {
-            "run_id": run_id,
-            "gate_id": gate_id,
-            "decision": decision,
-            "input": input or {},
-        }
-        if decision_receipt_id:
-            request_body["decision_receipt_id"] = decision_receipt_id
+            ...     result = await client.workflows.resume_run(
+            ...         run_id=run.run_id,
+            ...         gate_id=gate.gate_id,
+            ...         decision="approve"
+            ...     )
+            ...     print(f"Resumed: {result.status}")
+        """
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
+
+        if decision not in ("approve", "deny"):
+            raise ValidationError("decision must be 'approve' or 'deny'")
+
+        request_body: dict[str, Any] = {
+            "run_id": run_id,
+            "gate_id": gate_id,
+            "decision": decision,
+            "input": input or {},
+        }
+        if decision_receipt_id:
+            request_body["decision_receipt_id"] = decision_receipt_id
+
+        if idempotency_key is None and deterministic_idempotency:
+            idempotency_key = _derive_idempotency_key(
+                run_id, gate_id, decision, decision_receipt_id
+            )
 
         data = await self._fc_post(
-            f"/runs/{run_id}:resume",
+            f"{self._runs_url}/{run_id}:resume",
             tenant_id=tenant_id,
             actor_id=actor_id,
             correlation_id=correlation_id,
             json=request_body,
+            idempotency_key=idempotency_key,
+        )
+
+        return _build_run_result(data, correlation_id)
+
+    async def register(
+        self,
+        workflow_yaml: str,
+        prompts_poml: str,
+        schemas: Optional[dict[str, Any]] = None,
+        workflow_id: Optional[str] = None,
+        version: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> WorkflowRegisterResult:
+        """Register workflow artifacts with Federation Core."""
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
+
+        body = {
+            "workflow_yaml": workflow_yaml,
+            "prompts_poml": prompts_poml,
+            "schemas": schemas or {},
+        }
+        if workflow_id:
+            body["workflow_id"] = workflow_id
+        if version:
+            body["version"] = version
+
+        data = await self._fc_post(
+            self._register_url,
+            tenant_id=tenant_id,
+            actor_id=actor_id,
+            correlation_id=correlation_id,
+            json=body,
+            idempotency_key=idempotency_key or uuid4().hex,
         )
+        return WorkflowRegisterResult.model_validate(data)
 
-        run_data = data.get("run", data)
-        gates = [GateInfo.model_validate(g) for g in data.get("gates", [])]
-
-        return WorkflowRunResult(
-            run_id=run_data["run_id"],
-            workflow_id=run_data["workflow_id"],
-            workflow_version=run_data.get("workflow_version", "1.0.0"),
-            status=WorkflowRunStatus(run_data["status"]),
-            current_step=run_data.get("current_step"),
-            step_index=run_data.get("step_index", 0),
-            tenant_id=run_data["tenant_id"],
-            actor_id=run_data["actor_id"],
-            correlation_id=run_data.get("correlation_id", correlation_id),
-            input_payload=run_data.get("input_payload", {}),
-            output_payload=run_data.get("output_payload"),
-            error_details=run_data.get("error_details"),
-            receipt_chain=run_data.get("receipt_chain", []),
-            workflow_receipt_hash=run_data.get("workflow_receipt_hash"),
-            evidence_pack_hash=run_data.get("evidence_pack_hash"),
-            evidence_pack_refs=run_data.get("evidence_pack_refs", []),
-            gates=gates,
-            created_at=run_data.get("created_at"),
-            started_at=run_data.get("started_at"),
-            completed_at=run_data.get("completed_at"),
-            updated_at=run_data.get("updated_at"),
-            logs=[
-                WorkflowRunLogEntry.model_validate(log)
-                for log in data.get("logs", [])
-            ],
-        )
-
-    async def register(
-        self,
-        workflow_yaml: str,
-        prompts_poml: str,
-        schemas: Optional[dict[str, Any]] = None,
-        workflow_id: Optional[str] = None,
-        version: Optional[str] = None,
-        tenant_id: Optional[str] = None,
-        actor_id: Optional[str] = None,
-        correlation_id: Optional[str] = None,
-    ) -> WorkflowRegisterResult:
-        """Register workflow artifacts with Federation Core."""
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
-
-        body = {
-            "workflow_yaml": workflow_yaml,
-            "prompts_poml": prompts_poml,
-            "schemas": schemas or {},
-        }
-        if workflow_id:
-            body["workflow_id"] = workflow_id
-        if version:
-            body["version"] = version
-
-        data = await self._fc_post(
-            "/workflows/register",
-            tenant_id=tenant_id,
-            actor_id=actor_id,
-            correlation_id=correlation_id,
-            json=body,
-            idempotency_key=str(uuid4()),
-        )
-        return WorkflowRegisterResult.model_validate(data)
+    async def stream_run_events(
+        self,
+        run_id: str,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> AsyncIterator[WorkflowRunEvent]:
+        """
+        Subscribe to a workflow run's server-sent event stream.
+
+        Events arrive as the run changes: ``status`` events carry the new run
+        status, ``log`` events a log entry and ``gate`` events a gate record.
+        The stream is not retried; it ends when the server closes it.
+
+        Args:
+            run_id: Run identifier
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID (auto-generated if not provided)
+
+        Yields:
+            WorkflowRunEvent per event
+
+        Raises:
+            OmegaError: If the stream cannot be opened or an event is malformed
+
+        Example:
+            >>> async for event in client.workflows.stream_run_events("run-123"):
+            ...     if event.log:
+            ...         print(f"[{event.log.event_type}] {event.log.message}")
+        """
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
+
+        headers = self._get_headers(tenant_id, actor_id, correlation_id)
+        headers["Accept"] = "text/event-stream"
+
+        async with self._gateway._client.stream(
+            "GET",
+            f"{self._runs_url}/{run_id}/events",
+            headers=headers,
+            timeout=self._gateway._stream_timeout,
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                _fc_response_data(response)
+
+            event = "message"
+            data_lines: list[str] = []
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].removeprefix(" "))
+                elif line.startswith("event:"):
+                    event = line[6:].strip()
+                elif not line:
+                    if data_lines:
+                        yield _run_event(event, "\n".join(data_lines))
+                    event = "message"
+                    data_lines = []
+
+            if data_lines:
+                yield _run_event(event, "\n".join(data_lines))
+
+    async def _wait_for_event(
+        self,
+        run_id: str,
+        tenant_id: str,
+        actor_id: str,
+        correlation_id: str,
+    ) -> bool:
+        """Drain the run's event stream; True once a stop status arrives."""
+        events = self.stream_run_events(
+            run_id,
+            tenant_id=tenant_id,
+            actor_id=actor_id,
+            correlation_id=correlation_id,
+        )
+        async with aclosing(events):
+            async for event in events:
+                if event.status is not None and event.status.value in _WAIT_STOP_STATUSES:
+                    return True
+        return False
 
     async def wait_for_completion(
         self,
@@ -661,20 +958,32 @@ class WorkflowsNamespace:
         correlation_id: Optional[str] = None,
         poll_interval_ms: int = 2000,
         timeout_ms: int = 600_000,
+        initial_poll_interval_ms: int = 200,
+        use_events: bool = True,
     ) -> WorkflowRunResult:
         """
         Poll for workflow run completion.
 
         Waits until the run reaches a terminal state (completed, failed, cancelled)
-        or a paused state (gate required).
+        or a paused state (gate required). Polls start at
+        ``initial_poll_interval_ms`` and back off exponentially (with jitter) up
+        to ``poll_interval_ms``, so short runs are seen quickly and long runs
+        are not polled at a fixed rate. Each poll reads only the run status;
+        the full run (with gates) is fetched once the run stops.
+
+        With ``use_events`` the run's event stream is watched first, and
+        polling only starts if the server has no stream, sends events that
+        cannot be read, or closes the stream before the run stops.
 
         Args:
             run_id: Run identifier
             tenant_id: Tenant ID (defaults to config)
             actor_id: Actor ID (defaults to config)
             correlation_id: Correlation ID (stable across polls)
-            poll_interval_ms: Polling interval in milliseconds (default 2000)
+            poll_interval_ms: Maximum polling interval in milliseconds (default 2000)
             timeout_ms: Maximum wait time in milliseconds (default 600000 = 10 min)
+            initial_poll_interval_ms: First polling interval in milliseconds (default 200)
+            use_events: Watch the run's event stream before polling (default True)
 
         Returns:
             Final WorkflowRunResult
@@ -687,39 +996,153 @@ class WorkflowsNamespace:
             >>> final = await client.workflows.wait_for_completion(result.run_id)
             >>> print(f"Final status: {final.status}")
         """
-        tenant_id = tenant_id or self._config.tenant_id or ""
-        actor_id = actor_id or self._config.actor_id or ""
         # Use stable correlation ID for all polls
-        correlation_id = correlation_id or make_correlation_id(tenant_id)
-
-        terminal_states = {
-            WorkflowRunStatus.COMPLETED,
-            WorkflowRunStatus.FAILED,
-            WorkflowRunStatus.CANCELLED,
-            WorkflowRunStatus.PAUSED,  # Also stop on paused (gate required)
-        }
-
-        elapsed_ms = 0
-        poll_interval_s = poll_interval_ms / 1000.0
-
-        while elapsed_ms < timeout_ms:
-            run = await self.get_run(
-                run_id=run_id,
-                tenant_id=tenant_id,
-                actor_id=actor_id,
-                correlation_id=correlation_id,
-                include_gates=True,
-            )
-
-            if run.status in terminal_states:
-                return run
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
 
-            await asyncio.sleep(poll_interval_s)
-            elapsed_ms += poll_interval_ms
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_ms / 1000.0
+        max_interval_s = poll_interval_ms / 1000.0
+        interval_s = min(initial_poll_interval_ms, poll_interval_ms) / 1000.0
+
+        if use_events:
+            stopped = False
+            try:
+                async with asyncio.timeout_at(deadline):
+                    stopped = await self._wait_for_event(
+                        run_id, tenant_id, actor_id, correlation_id
+                    )
+            except TimeoutError:
+                # Deadline reached; the poll below makes the final check
+                pass
+            except OmegaError as exc:
+                # No stream on the server, or events we cannot read: poll instead
+                if (
+                    exc.code != "INVALID_RESPONSE"
+                    and exc.details.get("status_code") not in _EVENTS_UNSUPPORTED_STATUSES
+                ):
+                    raise
+            except httpx.TransportError:
+                # Stream dropped mid-wait (e.g. a proxy idle timeout): poll instead
+                pass
+
+            if stopped:
+                return await self.get_run(
+                    run_id=run_id,
+                    tenant_id=tenant_id,
+                    actor_id=actor_id,
+                    correlation_id=correlation_id,
+                    include_gates=True,
+                )
+
+        # Polls differ only in timing; build the status request once
+        status_url = f"{self._runs_url}/{run_id}"
+        poll_headers = self._get_headers(tenant_id, actor_id, correlation_id)
+
+        while True:
+            data = await self._fc_get_raw(status_url, poll_headers)
+
+            if data.get("run", data)["status"] in _WAIT_STOP_STATUSES:
+                return await self.get_run(
+                    run_id=run_id,
+                    tenant_id=tenant_id,
+                    actor_id=actor_id,
+                    correlation_id=correlation_id,
+                    include_gates=True,
+                )
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            delay = interval_s * (1 + random.uniform(-0.1, 0.1))
+            interval_s = min(max_interval_s, interval_s * 1.6)
+            await asyncio.sleep(min(delay, remaining))
 
-        from omega_sdk.errors import OmegaError
         raise OmegaError(
             code="TIMEOUT",
             message=f"Workflow run {run_id} did not complete within {timeout_ms}ms",
             retryable=False,
         )
+
+    async def run_and_wait(
+        self,
+        workflow_id: str,
+        inputs: Optional[dict[str, Any]] = None,
+        tenant_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        options: Optional[WorkflowRunOptions] = None,
+        idempotency_key: Optional[str] = None,
+        deterministic_idempotency: bool = False,
+        poll_interval_ms: int = 2000,
+        timeout_ms: int = 600_000,
+        initial_poll_interval_ms: int = 200,
+        use_events: bool = True,
+    ) -> WorkflowRunResult:
+        """
+        Start a workflow run and wait for it to stop.
+
+        Equivalent to run_workflow() followed by wait_for_completion(), except
+        that a run which has already stopped in the start response (completed,
+        failed, cancelled, or paused at a gate) is returned without another
+        request.
+
+        Args:
+            workflow_id: Workflow definition ID
+            inputs: Input payload for the workflow
+            tenant_id: Tenant ID (defaults to config)
+            actor_id: Actor ID (defaults to config)
+            correlation_id: Correlation ID shared by the start and the wait
+                (auto-generated if not provided)
+            options: Workflow run options
+            idempotency_key: Key that lets FC deduplicate retried starts
+            deterministic_idempotency: Derive the key from tenant, workflow
+                and inputs
+            poll_interval_ms: Maximum polling interval in milliseconds (default 2000)
+            timeout_ms: Maximum wait time in milliseconds (default 600000 = 10 min)
+            initial_poll_interval_ms: First polling interval in milliseconds (default 200)
+            use_events: Watch the run's event stream before polling (default True)
+
+        Returns:
+            Final WorkflowRunResult
+
+        Raises:
+            OmegaError: If the run cannot be started or the timeout is exceeded
+
+        Example:
+            >>> final = await client.workflows.run_and_wait("my-workflow", inputs={})
+            >>> print(f"Final status: {final.status}")
+        """
+        tenant_id, actor_id, correlation_id = self._resolve_ctx(
+            tenant_id, actor_id, correlation_id
+        )
+
+        run = await self.run_workflow(
+            workflow_id,
+            inputs,
+            tenant_id=tenant_id,
+            actor_id=actor_id,
+            correlation_id=correlation_id,
+            options=options,
+            idempotency_key=idempotency_key,
+            deterministic_idempotency=deterministic_idempotency,
+        )
+
+        # A paused run is only final here if the response named its gate
+        if run.status.value in _WAIT_STOP_STATUSES and (
+            run.status is not WorkflowRunStatus.PAUSED or run.gate_info is not None
+        ):
+            return run
+
+        return await self.wait_for_completion(
+            run.run_id,
+            tenant_id=tenant_id,
+            actor_id=actor_id,
+            correlation_id=correlation_id,
+            poll_interval_ms=poll_interval_ms,
+            timeout_ms=timeout_ms,
+            initial_poll_interval_ms=initial_poll_interval_ms,
+            use_events=use_events,
+        )
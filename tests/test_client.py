@@ -0,0 +1,211 @@
+"""
+Tests for OmegaClient lifecycle.
+"""
+
+import asyncio
+import sys
+
+import httpx
+import pytest
+
+from omega_sdk import OmegaClient, OmegaConfig
+from omega_sdk.federation import _endpoint_url, _timeout
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock config."""
+    return OmegaConfig(
+        federation_url="http://localhost:9405",
+        api_key="test-api-key",
+        tenant_id="tenant_test",
+        actor_id="user_test",
+        timeout_ms=30000,
+        max_retries=3,
+    )
+
+
+class TestWarmup:
+    """Test connection warmup."""
+
+    @pytest.mark.asyncio
+    async def test_context_manager_warms_pool(self, mock_config):
+        """Entering the client sends background HEAD requests to /health."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, request.url.path))
+            return httpx.Response(200)
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async with client:
+            await client._warmup
+
+        assert requests == [("HEAD", "/api/v1/health")] * 2
+        assert client._warmup is None
+
+    @pytest.mark.asyncio
+    async def test_warmup_ignores_connection_errors(self, mock_config):
+        """Warmup failures are swallowed."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client.warmup()
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_pending_warmup(self, mock_config):
+        """Leaving the client cancels a warmup that has not finished."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(10)
+            return httpx.Response(200)
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async with client:
+            warmup = client._warmup
+
+        assert warmup.cancelled()
+        assert client.is_closed
+
+
+class TestTransport:
+    """Test HTTP transport selection."""
+
+    def test_aiohttp_transport_requires_extra(self, mock_config, monkeypatch):
+        """Selecting aiohttp without the extra installed fails with an install hint."""
+        monkeypatch.setitem(sys.modules, "httpx_aiohttp", None)
+        config = mock_config.model_copy(update={"transport": "aiohttp"})
+
+        with pytest.raises(ImportError, match=r"omega-sdk\[aiohttp\]"):
+            OmegaClient(config=config)
+
+    def test_pool_limits_follow_config(self, mock_config):
+        """The connection pool is sized from the config."""
+        config = mock_config.model_copy(update={"pool_size": 8, "pool_keepalive_s": 30.0})
+
+        pool = OmegaClient(config=config)._gateway._client._transport._pool
+
+        assert pool._max_connections == 8
+        assert pool._max_keepalive_connections == 8
+        assert pool._keepalive_expiry == 30.0
+
+
+class TestConfigOverrides:
+    """Test constructor config overrides."""
+
+    def test_overrides_applied_in_one_copy(self, mock_config):
+        """Keyword overrides win over the config; the original is untouched."""
+        client = OmegaClient(config=mock_config, tenant_id="acme", actor_id="clint")
+
+        assert client.config.tenant_id == "acme"
+        assert client.config.actor_id == "clint"
+        assert client.config.federation_url == mock_config.federation_url
+        assert mock_config.tenant_id == "tenant_test"
+
+    def test_no_overrides_keeps_config(self, mock_config):
+        """Without overrides the given config is used as-is."""
+        assert OmegaClient(config=mock_config).config is mock_config
+
+
+class TestNamespaces:
+    """Test namespace construction."""
+
+    def test_namespaces_built_once_on_first_access(self, mock_config):
+        """Namespaces are created lazily and then reused."""
+        client = OmegaClient(config=mock_config)
+
+        assert "workflows" not in vars(client)
+        assert client.workflows is client.workflows
+        assert client.tasks is client.tasks
+
+
+class TestHealth:
+    """Test health() caching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_probes_share_one_request(self, mock_config):
+        """Bursts of health checks collapse into one request until max_age expires."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                200,
+                json={
+                    "ok": True,
+                    "data": {"status": "ok", "version": "1.2.3", "uptime_s": 10},
+                    "meta": {
+                        "correlation_id": "t:tenant_test|c:0194f0b0-1234-7890-abcd-ef0123456789",
+                        "request_id": "req_1",
+                        "ts": "2025-01-01T00:00:00Z",
+                    },
+                },
+            )
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = await asyncio.gather(*(client.health() for _ in range(5)))
+        assert calls == 1
+        assert all(r.version == "1.2.3" for r in results)
+
+        await client.health(max_age=0)
+        assert calls == 2
+
+
+class TestHeaders:
+    """Test gateway request headers."""
+
+    def test_headers_extend_shared_template(self, mock_config):
+        """Per-call headers are layered on a copy of the invariant headers."""
+        gateway = OmegaClient(config=mock_config)._gateway
+        correlation_id = "t:tenant_test|c:0194f0b0-1234-7890-abcd-ef0123456789"
+
+        headers = gateway._build_headers(
+            "tenant_test", "user_test", correlation_id, idempotency_key="key_1"
+        )
+
+        assert headers == {
+            "Content-Type": "application/json",
+            "Authorization": "Bearer test-api-key",
+            "X-Tenant-Id": "tenant_test",
+            "X-Actor-Id": "user_test",
+            "X-Correlation-Id": correlation_id,
+            "X-Idempotency-Key": "key_1",
+        }
+        assert "X-Tenant-Id" not in gateway._base_headers
+
+
+class TestEndpointUrl:
+    """Test endpoint URL caching."""
+
+    def test_endpoint_url_parsed_once(self):
+        """Repeated requests to one endpoint reuse the same parsed URL."""
+        first = _endpoint_url("http://localhost:9405/api/v1", "/tools")
+
+        assert _endpoint_url("http://localhost:9405/api/v1", "/tools") is first
+        assert str(first) == "http://localhost:9405/api/v1/tools"
+
+
+class TestTimeouts:
+    """Test shared gateway timeouts."""
+
+    def test_gateways_share_timeouts(self, mock_config):
+        """Gateways with the same timeout_ms reuse one Timeout per kind."""
+        first = OmegaClient(config=mock_config)._gateway
+        second = OmegaClient(config=mock_config)._gateway
+
+        assert first._client.timeout == _timeout(30000)
+        assert first._stream_timeout is second._stream_timeout
+        assert first._stream_timeout.read is None
+        assert _timeout(30000).read == 30.0
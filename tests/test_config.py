@@ -0,0 +1,59 @@
+"""
+Tests for OmegaConfig environment loading.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from omega_sdk.config import OmegaConfig, _config_from_env
+
+
+@pytest.fixture(autouse=True)
+def clear_env_cache(monkeypatch):
+    """Start each test from a clean environment and cache."""
+    for name in ("OMEGA_FEDERATION_URL", "OMEGA_TENANT_ID", "OMEGA_TIMEOUT_MS", "OMEGA_TRANSPORT"):
+        monkeypatch.delenv(name, raising=False)
+    _config_from_env.cache_clear()
+
+
+def test_from_env_reads_environment(monkeypatch):
+    """Test values are taken from OMEGA_* variables."""
+    monkeypatch.setenv("OMEGA_FEDERATION_URL", "https://fc.example.com")
+    monkeypatch.setenv("OMEGA_TENANT_ID", "acme")
+    monkeypatch.setenv("OMEGA_TIMEOUT_MS", "5000")
+
+    config = OmegaConfig.from_env()
+
+    assert config.federation_url == "https://fc.example.com"
+    assert config.tenant_id == "acme"
+    assert config.timeout_ms == 5000
+    assert config.transport == "httpx"
+
+
+def test_from_env_is_cached_per_environment(monkeypatch):
+    """Test repeated calls reuse the parsed config until the environment changes."""
+    monkeypatch.setenv("OMEGA_TENANT_ID", "acme")
+    first = OmegaConfig.from_env()
+    second = OmegaConfig.from_env()
+
+    assert _config_from_env.cache_info().hits == 1
+    assert first is second  # Frozen, so the cached instance is shared
+
+    monkeypatch.setenv("OMEGA_TENANT_ID", "globex")
+    assert OmegaConfig.from_env().tenant_id == "globex"
+
+
+def test_federation_url_requires_http_scheme():
+    """Test malformed URLs are rejected at construction time."""
+    with pytest.raises(ValidationError, match="federation_url"):
+        OmegaConfig(federation_url="localhost:9405")
+
+
+def test_config_is_immutable():
+    """Test configs are frozen; overrides go through with_defaults()."""
+    config = OmegaConfig(tenant_id="acme")
+
+    with pytest.raises(ValidationError):
+        config.tenant_id = "other"
+
+    assert config.with_defaults(tenant_id="other").tenant_id == "other"
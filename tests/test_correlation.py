@@ -9,9 +9,13 @@ from uuid import UUID
 
 from omega_sdk.utils.correlation import (
     make_correlation_id,
+    check_correlation_id,
+    current_correlation_id,
+    correlation_scope,
     validate_correlation_id,
     normalize_correlation_id,
     CorrelationError,
+    CORRELATION_ID_PATTERN,
 )
 
 
@@ -28,6 +32,46 @@ def test_make_correlation_id():
     assert isinstance(uuid, UUID)
 
 
+def test_make_correlation_id_is_time_ordered_uuid7():
+    """Test generated IDs are canonical, lowercase UUIDv7s in strictly increasing order."""
+    uuids = [validate_correlation_id(make_correlation_id("acme"))[1] for _ in range(100)]
+
+    for uuid in uuids:
+        assert uuid.version == 7
+        assert uuid.variant == "specified in RFC 4122"
+    assert uuids == sorted(set(uuids))
+    cid = make_correlation_id("acme")
+    assert normalize_correlation_id(cid) == cid
+
+
+def test_uuid7_keeps_clock_timestamp_within_a_millisecond(monkeypatch):
+    """Test IDs in one millisecond keep its timestamp and order by counter."""
+    from omega_sdk.utils import correlation
+
+    now_ms = 1_700_000_000_000
+    monkeypatch.setattr(correlation.time, "time_ns", lambda: now_ms * 1_000_000)
+    monkeypatch.setattr(correlation, "_last_v7_ms", 0)
+
+    uuids = [UUID(correlation._uuid7_str()) for _ in range(2048)]
+
+    assert {u.int >> 80 for u in uuids} == {now_ms}
+    assert uuids == sorted(set(uuids))
+
+    # Only a counter overflow moves the timestamp past the clock
+    uuids += [UUID(correlation._uuid7_str()) for _ in range(2048)]
+    assert max(u.int >> 80 for u in uuids) == now_ms + 1
+    assert uuids == sorted(set(uuids))
+
+
+def test_correlation_id_pattern_is_anchored():
+    """Test the public pattern rejects surrounding text with match() and search()."""
+    cid = "t:acme|c:0194f0b0-1234-7890-abcd-ef0123456789"
+
+    assert CORRELATION_ID_PATTERN.match(cid)
+    assert CORRELATION_ID_PATTERN.match(cid + "junk") is None
+    assert CORRELATION_ID_PATTERN.search("x" + cid) is None
+
+
 def test_make_correlation_id_invalid_tenant():
     """Test that tenant IDs cannot contain pipes."""
     with pytest.raises(CorrelationError, match="cannot contain '\\|'"):
@@ -86,3 +130,34 @@ def test_correlation_id_roundtrip():
 
     assert tenant == "acme"
     assert normalized == cid  # Should already be normalized
+
+
+def test_correlation_scope_pins_id():
+    """Test that a scope pins one correlation ID for its tenant only."""
+    assert current_correlation_id("acme") != current_correlation_id("acme")
+
+    with correlation_scope("acme") as cid:
+        assert current_correlation_id("acme") == cid
+        assert current_correlation_id("other") != cid
+
+    assert current_correlation_id("acme") != cid
+
+
+def test_correlation_scope_rejects_foreign_tenant():
+    """Test that a pinned correlation ID must belong to the scope's tenant."""
+    with pytest.raises(CorrelationError):
+        with correlation_scope("acme", make_correlation_id("other")):
+            pass
+
+
+def test_check_correlation_id():
+    """Test the parse-free validity check used on outbound requests."""
+    check_correlation_id(make_correlation_id("acme"))
+
+    for invalid in (
+        "t:acme|c:0194f0b0-1234-7890-abcd-ef0123456789\n",  # Trailing newline
+        "t:acme|c:0194f0b01234-7890-abcd-ef01-23456789",  # Misplaced hyphens
+        "t:acme",
+    ):
+        with pytest.raises(CorrelationError, match="Invalid correlation ID format"):
+            check_correlation_id(invalid)
@@ -4,6 +4,9 @@ Tests for structured error handling.
 Ensures all errors are correlation-aware and properly mapped from HTTP responses.
 """
 
+import copy
+import pickle
+
 import pytest
 
 from omega_sdk.errors import (
@@ -14,8 +17,10 @@ from omega_sdk.errors import (
     RateLimitError,
     UpstreamError,
     InternalError,
+    error_from_envelope,
     error_from_response,
 )
+from omega_sdk.models import Error
 
 
 def test_omega_error_basic():
@@ -229,3 +234,94 @@ def test_error_from_response_502():
 
     assert isinstance(error, UpstreamError)
     assert error.retryable is True
+
+
+def test_error_from_response_null_details():
+    """Test errors dumped from the envelope Error model (details=None) still map."""
+    error = error_from_response(
+        status_code=404,
+        error_data={"code": "NOT_FOUND", "message": "Gone", "details": None, "retryable": False},
+    )
+
+    assert isinstance(error, NotFoundError)
+    assert error.details == {}
+
+
+def test_error_from_response_unmapped_status():
+    """Test unmapped statuses fall back to a base OmegaError with the envelope code."""
+    error = error_from_response(
+        status_code=418,
+        error_data={"code": "TEAPOT", "message": "Short and stout", "retryable": True},
+    )
+
+    assert type(error) is OmegaError
+    assert error.code == "TEAPOT"
+    assert error.retryable is True
+
+
+def test_error_from_envelope():
+    """Test envelope Error models map without being dumped to a dict."""
+    error = error_from_envelope(
+        status_code=429,
+        error=Error(
+            code="RATE_LIMITED",
+            message="Slow down",
+            details={"retry_after_ms": 500},
+            retryable=True,
+        ),
+        request_id="req_1",
+    )
+
+    assert isinstance(error, RateLimitError)
+    assert error.details == {"retry_after_ms": 500}
+    assert error.request_id == "req_1"
+
+    fallback = error_from_envelope(
+        status_code=200,
+        error=Error(code="PARTIAL", message="Partial failure", retryable=False),
+    )
+    assert type(fallback) is OmegaError
+    assert fallback.code == "PARTIAL"
+
+
+def test_empty_details_allocated_on_read():
+    """Test errors without details only create the empty dict when it is read."""
+    error = NotFoundError(message="Gone")
+
+    assert error._details is None
+    assert error.details == {}
+    error.details["hint"] = "check the id"
+    assert error.details == {"hint": "check the id"}
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [lambda e: pickle.loads(pickle.dumps(e)), copy.copy, copy.deepcopy],
+    ids=["pickle", "copy", "deepcopy"],
+)
+def test_error_survives_pickle_and_copy(clone):
+    """Test pickling and copying keep every slot value."""
+    errors = [
+        NotFoundError(
+            "Task not found",
+            resource_type="task",
+            resource_id="task-1",
+            correlation_id="cid",
+            request_id="rid",
+        ),
+        OmegaError(code="TEST_ERROR", message="boom", details={"foo": "bar"}, retryable=True),
+    ]
+
+    for error in errors:
+        restored = clone(error)
+
+        assert type(restored) is type(error)
+        assert restored.args == error.args
+        assert (restored.code, restored.message, restored.retryable) == (
+            error.code,
+            error.message,
+            error.retryable,
+        )
+        assert restored.details == error.details
+        assert restored.correlation_id == error.correlation_id
+        assert restored.request_id == error.request_id
@@ -0,0 +1,218 @@
+"""
+Tests for FederationClient request signing.
+
+Signatures are computed over the canonical JSON of the payload, so the
+canonical form must not change with the installed JSON encoder.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+
+import httpx
+import pytest
+
+from omega_sdk import OmegaConfig
+from omega_sdk.errors import OmegaError
+from omega_sdk.federation_client import (
+    FederationClient,
+    FederationClientOptions,
+    JCSCanonicalizer,
+    PayloadValidator,
+    canonicalize_jcs,
+)
+from omega_sdk.utils import codec
+
+
+SECRET = b"test-signing-secret"
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock config."""
+    return OmegaConfig(
+        federation_url="http://localhost:9405",
+        tenant_id="tenant_test",
+        actor_id="user_test",
+    )
+
+
+@pytest.fixture
+def federation_client(mock_config):
+    """Create a client with a signing secret."""
+    options = FederationClientOptions(
+        passport_id="passport_1",
+        hmac_secret_b64=base64.b64encode(SECRET).decode(),
+    )
+    return FederationClient(options, config=mock_config)
+
+
+CANONICAL_CASES = [
+    {"b": 1, "a": [1.5, 2, None, True, False]},
+    {"text": "line\nbreak\t\"quoted\" \\ / \x01 \x7f"},
+    {"unicode": "café   \U0001f600"},
+    {"floats": [0.1, 1e16, 1e-7, -0.0, 123.456], "e_in_string": "1e5"},
+    {"small_floats": [5e-05, 1.5e-05, 9.99e-05, -5e-05, 1e-05, 1e-04]},
+    {"non_finite": [float("nan"), float("inf"), float("-inf")], "none": None},
+    {"ints_only": [1, -2, 3], "text": "no floats here"},
+    {"nested": {"z": {"y": [{"b": 2, "a": 1}]}}},
+    {"big": 2**70},
+    {1: "int key"},
+    [],
+    "scalar",
+]
+
+
+def _reference(obj):
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+
+@pytest.mark.parametrize("payload", CANONICAL_CASES)
+def test_canonicalize_matches_reference(payload):
+    """Test canonical JSON is byte-identical to sorted, ASCII-escaped json.dumps."""
+    assert canonicalize_jcs(payload) == _reference(payload)
+    assert JCSCanonicalizer().canonicalize(payload) == _reference(payload)
+
+
+@pytest.mark.parametrize("payload", CANONICAL_CASES)
+def test_canonicalize_without_orjson(payload, monkeypatch):
+    """Test the standard library fallback produces the same canonical JSON."""
+    monkeypatch.setattr(codec, "orjson", None)
+
+    assert canonicalize_jcs(payload) == _reference(payload)
+
+
+def test_canonicalize_rejects_unserializable():
+    """Test unserializable payloads fail the same way with either encoder."""
+    with pytest.raises(TypeError):
+        canonicalize_jcs({"when": object()})
+
+
+@pytest.mark.parametrize(
+    ("payload", "max_depth", "too_deep"),
+    [
+        ({"a": {"b": [1]}}, 3, False),
+        ({"a": {"b": [1]}}, 2, True),
+        ({"a": {"b": []}}, 2, False),
+        ([[], {}, ({"x": "y"},)], 2, True),
+        ("a long string is not a container", 0, False),
+        ({"a": 1}, 0, True),
+    ],
+)
+def test_validate_depth(payload, max_depth, too_deep):
+    """Test depth counts values under non-empty containers, scalars included."""
+    validator = PayloadValidator(max_payload_depth=max_depth)
+
+    if too_deep:
+        with pytest.raises(OmegaError) as exc_info:
+            validator.validate_depth(payload)
+        assert exc_info.value.code == "PAYLOAD_TOO_DEEP"
+        assert f"depth {max_depth + 1} exceeds" in exc_info.value.message
+    else:
+        validator.validate_depth(payload)
+
+
+def test_validate_size_counts_utf8_bytes():
+    """Test payload size is measured in UTF-8 bytes."""
+    validator = PayloadValidator(max_payload_bytes=4)
+
+    validator.validate_size('"ab"')
+    with pytest.raises(OmegaError) as exc_info:
+        validator.validate_size('"éé"')
+    assert exc_info.value.code == "PAYLOAD_TOO_LARGE"
+
+
+def test_validate_depth_beyond_recursion_limit():
+    """Test very deep payloads are rejected without hitting the recursion limit."""
+    payload: list = []
+    for _ in range(5000):
+        payload = [payload]
+
+    with pytest.raises(OmegaError):
+        PayloadValidator(max_payload_depth=32).validate_depth(payload)
+    PayloadValidator(max_payload_depth=5000).validate_depth(payload)
+
+
+def test_signature_is_hmac_of_canonical_string(federation_client):
+    """Test the signature is HMAC-SHA256 over method, path, timestamp, nonce and body."""
+    payload = {"b": 2, "a": 1}
+    first = federation_client._create_signed_request("csv_processor", payload)
+    second = federation_client._create_signed_request("csv_processor", payload)
+
+    for signed in (first, second):
+        message = (
+            f"POST\n/mcp/tools/invoke\n{signed.timestamp_ms}\n{signed.nonce}\n"
+            '{"a":1,"b":2}'
+        ).encode()
+        expected = hmac.new(SECRET, message, hashlib.sha256).digest()
+        assert base64.b64decode(signed.signature) == expected
+        assert len(base64.b64decode(signed.nonce, validate=True)) == 12
+
+    assert first.nonce != second.nonce
+
+
+def test_signing_requires_secret(mock_config):
+    """Test signing without a configured secret fails with a structured error."""
+    client = FederationClient(FederationClientOptions(), config=mock_config)
+
+    with pytest.raises(OmegaError) as exc_info:
+        client._create_signed_request("csv_processor", {})
+
+    assert exc_info.value.code == "SIGNING_KEY_MISSING"
+
+
+@pytest.mark.asyncio
+async def test_production_rejects_tools_outside_allowlist(mock_config):
+    """Test production clients refuse tools missing from the allowlist before any request."""
+    options = FederationClientOptions(environment="production", allowed_tools=["csv_processor"])
+    client = FederationClient(options, config=mock_config)
+
+    with pytest.raises(OmegaError) as exc_info:
+        await client.invoke_tool_async("shell_exec", {})
+
+    assert exc_info.value.code == "TOOL_NOT_ALLOWED"
+    assert "csv_processor" in exc_info.value.message
+
+
+@pytest.mark.asyncio
+async def test_invoke_sends_signed_request(federation_client):
+    """Test the invocation carries the signature and token, under the token fetch's correlation ID."""
+    seen = []
+    invoke_headers = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers["X-Correlation-Id"]))
+        if request.url.path.endswith("/invoke"):
+            invoke_headers.update(request.headers)
+        data = {"access_token": "tok", "expires_in": 3600} if "token" in request.url.path else {}
+        return httpx.Response(
+            200,
+            json={
+                "ok": True,
+                "data": data,
+                "meta": {
+                    "correlation_id": request.headers["X-Correlation-Id"],
+                    "request_id": "req_1",
+                    "ts": "2025-01-01T00:00:00Z",
+                },
+            },
+        )
+
+    federation_client.gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    await federation_client.invoke_tool_async("csv_processor", {"file": "data.csv"})
+
+    assert [path for path, _ in seen] == ["/api/v1/auth/client/token", "/api/v1/mcp/tools/invoke"]
+    assert seen[0][1] == seen[1][1]
+    assert seen[0][1].startswith("t:tenant_test|c:")
+
+    assert invoke_headers["authorization"] == "Bearer tok"
+    assert invoke_headers["x-omega-passport"] == "passport_1"
+    message = (
+        f"POST\n/mcp/tools/invoke\n{invoke_headers['x-omega-timestamp']}\n"
+        f"{invoke_headers['x-omega-nonce']}\n"
+        '{"file":"data.csv"}'
+    ).encode()
+    expected = hmac.new(SECRET, message, hashlib.sha256).digest()
+    assert base64.b64decode(invoke_headers["x-omega-signature"]) == expected
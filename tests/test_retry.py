@@ -0,0 +1,43 @@
+"""
+Tests for the SDK retry policy.
+"""
+
+import pytest
+
+from omega_sdk.errors import UpstreamError
+from omega_sdk.utils.retry import create_retry_decorator
+
+
+def test_single_attempt_returns_function_unchanged():
+    """Test a one-attempt policy skips the retry wrapper entirely."""
+
+    async def call():
+        return "ok"
+
+    assert create_retry_decorator(max_attempts=1)(call) is call
+    assert create_retry_decorator(max_attempts=0)(call) is call
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors_with_jittered_backoff(monkeypatch):
+    """Test retryable errors are retried with randomized waits up to the cap."""
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr("asyncio.sleep", fake_sleep)
+    attempts = 0
+
+    @create_retry_decorator(max_attempts=4)
+    async def call():
+        nonlocal attempts
+        attempts += 1
+        raise UpstreamError(message="Bad gateway")
+
+    with pytest.raises(UpstreamError):
+        await call()
+
+    assert attempts == 4
+    assert len(waits) == 3
+    assert all(0 <= wait <= 10 for wait in waits)
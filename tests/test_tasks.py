@@ -0,0 +1,356 @@
+"""
+Tests for OmegaClient.tasks namespace.
+
+Covers waiting on task completion via the status stream.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from omega_sdk import OmegaConfig, Task, TaskStatus
+from omega_sdk.client import TasksNamespace
+from omega_sdk.errors import NotFoundError, OmegaError
+from omega_sdk.models import TaskBatchGetResponse
+from omega_sdk.federation import FederationCoreGateway
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock config."""
+    return OmegaConfig(
+        federation_url="http://localhost:9405",
+        api_key="test-api-key",
+        tenant_id="tenant_test",
+        actor_id="user_test",
+        timeout_ms=30000,
+        max_retries=3,
+    )
+
+
+def task_frame(task_id: str, status: str) -> dict:
+    """Build a task status frame."""
+    return {"task_id": task_id, "status": status}
+
+
+def make_stream(frames_by_task: dict[str, list[dict]], delay: float = 0.0):
+    """Build a fake gateway.stream yielding canned frames per task."""
+    calls = []
+
+    async def stream(path, tenant_id, actor_id, correlation_id, params=None):
+        calls.append(path)
+        task_id = path.split("/")[2]
+        for frame in frames_by_task[task_id]:
+            await asyncio.sleep(delay)
+            yield frame
+
+    return stream, calls
+
+
+class TestTasksWait:
+    """Test tasks.wait()."""
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_on_terminal_status(self, mock_config):
+        """wait() resolves with the first terminal frame."""
+        stream, calls = make_stream(
+            {
+                "tk_1": [
+                    task_frame("tk_1", "queued"),
+                    task_frame("tk_1", "running"),
+                    task_frame("tk_1", "completed"),
+                ]
+            }
+        )
+        gateway = MagicMock()
+        gateway.stream = stream
+        tasks = TasksNamespace(gateway, mock_config)
+
+        result = await tasks.wait("tk_1")
+
+        assert result.status is TaskStatus.COMPLETED
+        assert calls == ["/tasks/tk_1/watch"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waits_share_one_stream(self, mock_config):
+        """Concurrent waiters on the same task share a single subscription."""
+        stream, calls = make_stream(
+            {"tk_1": [task_frame("tk_1", "running"), task_frame("tk_1", "failed")]},
+            delay=0.01,
+        )
+        gateway = MagicMock()
+        gateway.stream = stream
+        tasks = TasksNamespace(gateway, mock_config)
+
+        first, second = await asyncio.gather(tasks.wait("tk_1"), tasks.wait("tk_1"))
+
+        assert first.status == second.status == TaskStatus.FAILED
+        assert calls == ["/tasks/tk_1/watch"]
+        assert tasks._watches == {}
+
+    @pytest.mark.asyncio
+    async def test_wait_rechecks_status_when_stream_closes(self, mock_config):
+        """wait() falls back to a status read when the stream ends early."""
+        stream, _ = make_stream({"tk_1": [task_frame("tk_1", "running")]})
+        gateway = MagicMock()
+        gateway.stream = stream
+        gateway.get = AsyncMock(return_value=Task.model_validate(task_frame("tk_1", "cancelled")))
+        tasks = TasksNamespace(gateway, mock_config)
+
+        result = await tasks.wait("tk_1")
+
+        assert result.status == TaskStatus.CANCELLED
+        gateway.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_backs_off_between_resubscriptions(self, mock_config, monkeypatch):
+        """wait() waits longer before each resubscription while the stream keeps closing."""
+        stream, calls = make_stream({"tk_1": []})
+        gateway = MagicMock()
+        gateway.stream = stream
+        gateway.get = AsyncMock(
+            side_effect=[Task.model_validate(task_frame("tk_1", "running"))] * 3
+            + [Task.model_validate(task_frame("tk_1", "completed"))]
+        )
+        tasks = TasksNamespace(gateway, mock_config)
+
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr("omega_sdk.client.random.uniform", lambda a, b: 1.0)
+        monkeypatch.setattr("omega_sdk.client.asyncio.sleep", fake_sleep)
+
+        result = await tasks.wait("tk_1")
+
+        assert result.status == TaskStatus.COMPLETED
+        assert len(calls) == 4
+        assert [d for d in delays if d] == pytest.approx([0.1, 0.2, 0.4])
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_cancels_stream(self, mock_config):
+        """wait() raises TIMEOUT and drops the stream when nobody listens."""
+        stream, _ = make_stream({"tk_1": [task_frame("tk_1", "completed")]}, delay=10)
+        gateway = MagicMock()
+        gateway.stream = stream
+        tasks = TasksNamespace(gateway, mock_config)
+
+        with pytest.raises(OmegaError) as exc_info:
+            await tasks.wait("tk_1", timeout=0.01)
+
+        assert exc_info.value.code == "TIMEOUT"
+        assert tasks._watches == {}
+
+
+class TestGatewayStream:
+    """Test FederationCoreGateway.stream() SSE parsing."""
+
+    @pytest.mark.asyncio
+    async def test_stream_parses_events(self, mock_config):
+        """stream() yields the JSON data of each event."""
+        body = (
+            ": keepalive\n\n"
+            f"data: {json.dumps(task_frame('tk_1', 'running'))}\n\n"
+            "event: status\n"
+            f"data: {json.dumps(task_frame('tk_1', 'completed'))}\n\n"
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["Accept"] == "text/event-stream"
+            return httpx.Response(200, text=body)
+
+        gateway = FederationCoreGateway(mock_config)
+        gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        frames = [
+            frame
+            async for frame in gateway.stream(
+                "/tasks/tk_1/watch",
+                tenant_id="tenant_test",
+                actor_id="user_test",
+                correlation_id="t:tenant_test|c:0194f0b0-1234-7890-abcd-ef0123456789",
+            )
+        ]
+
+        assert [f["status"] for f in frames] == ["running", "completed"]
+
+
+class TestTasksGather:
+    """Test tasks.gather()."""
+
+    @pytest.mark.asyncio
+    async def test_gather_returns_results_in_input_order(self, mock_config):
+        """gather() collects every task, ordered like the input ids."""
+        stream, calls = make_stream(
+            {
+                "tk_slow": [task_frame("tk_slow", "running"), task_frame("tk_slow", "completed")],
+                "tk_fast": [task_frame("tk_fast", "failed")],
+            },
+            delay=0.01,
+        )
+        gateway = MagicMock()
+        gateway.stream = stream
+        tasks = TasksNamespace(gateway, mock_config)
+
+        results = await tasks.gather(["tk_slow", "tk_fast"])
+
+        assert [t.task_id for t in results] == ["tk_slow", "tk_fast"]
+        assert [t.status for t in results] == [TaskStatus.COMPLETED, TaskStatus.FAILED]
+        assert sorted(calls) == ["/tasks/tk_fast/watch", "/tasks/tk_slow/watch"]
+
+    @pytest.mark.asyncio
+    async def test_gather_cancels_remaining_on_error(self, mock_config):
+        """gather() raises the first failure and drops the other streams."""
+        stream, _ = make_stream(
+            {
+                "tk_ok": [task_frame("tk_ok", "running")] * 10 + [task_frame("tk_ok", "completed")],
+                "tk_bad": [{"status": "bogus"}],
+            },
+            delay=0.01,
+        )
+        gateway = MagicMock()
+        gateway.stream = stream
+        tasks = TasksNamespace(gateway, mock_config)
+
+        with pytest.raises(OmegaError) as exc_info:
+            await tasks.gather(["tk_ok", "tk_bad"], timeout=1)
+
+        assert exc_info.value.code == "INVALID_RESPONSE"
+
+        assert tasks._watches == {}
+
+
+def batch(*frames: dict) -> TaskBatchGetResponse:
+    """Build a batchGet response from task frames."""
+    return TaskBatchGetResponse.model_validate({"items": list(frames)})
+
+
+class TestTasksGetMany:
+    """Test tasks.get_many()."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_single_request_in_input_order(self, mock_config):
+        """get_many() fetches all tasks in one request, ordered like the input ids."""
+        gateway = MagicMock()
+        gateway.post = AsyncMock(
+            return_value=batch(task_frame("tk_2", "running"), task_frame("tk_1", "queued"))
+        )
+        tasks = TasksNamespace(gateway, mock_config)
+
+        results = await tasks.get_many(["tk_1", "tk_2"])
+
+        assert [t.task_id for t in results] == ["tk_1", "tk_2"]
+        gateway.post.assert_awaited_once()
+        assert gateway.post.await_args.args[0] == "/tasks:batchGet"
+        assert gateway.post.await_args.kwargs["json"] == {"task_ids": ["tk_1", "tk_2"]}
+
+    @pytest.mark.asyncio
+    async def test_get_many_missing_task(self, mock_config):
+        """get_many() raises NotFoundError when a task is missing from the batch."""
+        gateway = MagicMock()
+        gateway.post = AsyncMock(return_value=batch(task_frame("tk_1", "queued")))
+        tasks = TasksNamespace(gateway, mock_config)
+
+        with pytest.raises(NotFoundError) as exc_info:
+            await tasks.get_many(["tk_1", "tk_2"])
+
+        assert exc_info.value.details["resource_id"] == "tk_2"
+
+
+class TestTasksCreateMany:
+    """Test tasks.create_many()."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_cancels_remaining_on_error(self, mock_config):
+        """create_many() raises the first failure and cancels pending creations."""
+        cancelled = []
+
+        async def create(task_type, input, **kwargs):
+            if task_type == "bad":
+                raise OmegaError(code="VALIDATION_FAILED", message="bad task")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(task_type)
+                raise
+
+        tasks = TasksNamespace(MagicMock(), mock_config)
+        tasks.create = create
+
+        with pytest.raises(OmegaError) as exc_info:
+            await tasks.create_many(
+                [{"task_type": "slow", "input": {}}, {"task_type": "bad", "input": {}}]
+            )
+
+        assert exc_info.value.code == "VALIDATION_FAILED"
+        assert cancelled == ["slow"]
+
+
+class TestTasksPollUntilDone:
+    """Test tasks.poll_until_done()."""
+
+    @pytest.mark.asyncio
+    async def test_poll_backs_off_until_terminal(self, mock_config, monkeypatch):
+        """poll_until_done() grows the interval up to max_interval."""
+        gateway = MagicMock()
+        gateway.get = AsyncMock(
+            side_effect=[
+                Task.model_validate(task_frame("tk_1", status))
+                for status in ["queued"] * 4 + ["completed"]
+            ]
+        )
+        tasks = TasksNamespace(gateway, mock_config)
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        result = await tasks.poll_until_done("tk_1", initial=0.1, max_interval=0.4, jitter=0)
+
+        assert result.status == TaskStatus.COMPLETED
+        assert delays == pytest.approx([0.1, 0.2, 0.4, 0.4])
+        # Same correlation ID on every poll
+        correlation_ids = {c.kwargs["correlation_id"] for c in gateway.get.await_args_list}
+        assert len(correlation_ids) == 1
+
+    @pytest.mark.asyncio
+    async def test_poll_timeout(self, mock_config):
+        """poll_until_done() raises TIMEOUT once the deadline passes."""
+        gateway = MagicMock()
+        gateway.get = AsyncMock(return_value=Task.model_validate(task_frame("tk_1", "running")))
+        tasks = TasksNamespace(gateway, mock_config)
+
+        with pytest.raises(OmegaError) as exc_info:
+            await tasks.poll_until_done("tk_1", initial=0.01, timeout=0.05)
+
+        assert exc_info.value.code == "TIMEOUT"
+
+    @pytest.mark.asyncio
+    async def test_poll_many_batches_pending_tasks(self, mock_config, monkeypatch):
+        """poll_until_done() with a list only re-fetches tasks still pending."""
+        gateway = MagicMock()
+        gateway.post = AsyncMock(
+            return_value=batch(task_frame("tk_1", "completed"), task_frame("tk_2", "running"))
+        )
+        gateway.get = AsyncMock(return_value=Task.model_validate(task_frame("tk_2", "failed")))
+        tasks = TasksNamespace(gateway, mock_config)
+
+        async def fake_sleep(delay):
+            pass
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        results = await tasks.poll_until_done(["tk_1", "tk_2"], jitter=0)
+
+        assert [t.status for t in results] == [TaskStatus.COMPLETED, TaskStatus.FAILED]
+        gateway.post.assert_awaited_once()
+        gateway.get.assert_awaited_once()
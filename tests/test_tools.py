@@ -0,0 +1,199 @@
+"""
+Tests for OmegaClient.tools namespace.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from omega_sdk import OmegaClient, OmegaConfig, Tool
+from omega_sdk.client import ToolsNamespace
+from omega_sdk.errors import OmegaError
+from omega_sdk.models import Envelope, ToolInvokeRequest, ToolListResponse, ToolStatus
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock config."""
+    return OmegaConfig(
+        federation_url="http://localhost:9405",
+        api_key="test-api-key",
+        tenant_id="tenant_test",
+        actor_id="user_test",
+        timeout_ms=30000,
+        max_retries=3,
+    )
+
+
+def tool_item(tool_id: str) -> dict:
+    """Build a tool list item."""
+    return {"tool_id": tool_id, "agent_id": "agent_1", "status": "ready"}
+
+
+class TestToolsIter:
+    """Test tools.iter()."""
+
+    @pytest.mark.asyncio
+    async def test_iter_walks_all_pages(self, mock_config):
+        """iter() follows next_cursor until the last page."""
+        pages = {
+            None: {"items": [tool_item("a"), tool_item("b")], "page": {"limit": 2, "next_cursor": "c1"}},
+            "c1": {"items": [tool_item("c")], "page": {"limit": 2, "next_cursor": None}},
+        }
+
+        async def get(path, tenant_id, actor_id, correlation_id, params=None, **kwargs):
+            return ToolListResponse.model_validate(pages[params.get("cursor")])
+
+        gateway = MagicMock()
+        gateway.get = AsyncMock(side_effect=get)
+        tools = ToolsNamespace(gateway, mock_config)
+
+        tool_ids = [tool.tool_id async for tool in tools.iter(page_size=2)]
+
+        assert tool_ids == ["a", "b", "c"]
+        assert gateway.get.await_count == 2
+        # One correlation ID for every page
+        correlation_ids = {c.kwargs["correlation_id"] for c in gateway.get.await_args_list}
+        assert len(correlation_ids) == 1
+        assert all(c.kwargs["params"]["limit"] == 2 for c in gateway.get.await_args_list)
+
+
+def envelope(data) -> dict:
+    """Wrap data in a success envelope."""
+    return {
+        "ok": True,
+        "data": data,
+        "error": None,
+        "meta": {
+            "correlation_id": "t:tenant_test|c:0194f0b0-1234-7890-abcd-ef0123456789",
+            "request_id": "fc_1",
+            "ts": "2024-01-01T00:00:00Z",
+        },
+    }
+
+
+class TestToolsGet:
+    """Test tools.get() through the gateway's typed envelope decoding."""
+
+    def make_client(self, mock_config, body: dict) -> OmegaClient:
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_get_returns_typed_tool(self, mock_config):
+        """The envelope and its data are validated into a Tool in one pass."""
+        client = self.make_client(mock_config, envelope(tool_item("csv_processor")))
+
+        tool = await client.tools.get("csv_processor")
+
+        assert isinstance(tool, Tool)
+        assert tool.tool_id == "csv_processor"
+        assert tool.status == ToolStatus.READY
+
+    @pytest.mark.asyncio
+    async def test_get_rejects_malformed_data(self, mock_config):
+        """Data that does not match the response model is an INVALID_ENVELOPE error."""
+        client = self.make_client(mock_config, envelope({"tool_id": "csv_processor"}))
+
+        with pytest.raises(OmegaError) as exc_info:
+            await client.tools.get("csv_processor")
+
+        assert exc_info.value.code == "INVALID_ENVELOPE"
+
+    def test_unparseable_body_is_invalid_response(self, mock_config):
+        """A 200 body that is not JSON falls back to a precise INVALID_RESPONSE error."""
+        client = OmegaClient(config=mock_config)
+
+        with pytest.raises(OmegaError) as exc_info:
+            client._gateway._unwrap_envelope(
+                httpx.Response(200, content=b"<html>"), Envelope[Tool]
+            )
+
+        assert exc_info.value.code == "INVALID_RESPONSE"
+
+
+class TestToolsInvoke:
+    """Test tools.invoke() request encoding."""
+
+    @pytest.mark.asyncio
+    async def test_invoke_sends_encoded_json_body(self, mock_config):
+        """The request body is sent as compact JSON with a JSON content type."""
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["content_type"] = request.headers["Content-Type"]
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(
+                200, json=envelope({"tool_id": "csv_processor", "result": {"rows": 3}})
+            )
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.tools.invoke(
+            "csv_processor", input={"file": "data.csv", "counts": {1: 2}}
+        )
+
+        assert result.result == {"rows": 3}
+        assert seen["content_type"] == "application/json"
+        assert seen["body"]["input"] == {"file": "data.csv", "counts": {"1": 2}}
+        assert seen["body"]["context"]["tenant_id"] == "tenant_test"
+
+    @pytest.mark.asyncio
+    async def test_invoke_body_matches_request_model(self, mock_config):
+        """The hand-built body has exactly the ToolInvokeRequest wire shape."""
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json=envelope({"tool_id": "csv_processor", "result": {}}))
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client.tools.invoke(
+            "csv_processor", input={"file": "data.csv"}, timeout_ms=500, tags=["prod"]
+        )
+
+        expected = ToolInvokeRequest.model_validate(seen["body"]).model_dump(exclude_none=True)
+        assert seen["body"] == expected
+        assert seen["body"]["options"] == {"stream": False, "timeout_ms": 500}
+        assert "decision_receipt_id" not in seen["body"]["context"]
+
+
+class TestToolsInvokeMany:
+    """Test tools.invoke_many()."""
+
+    @pytest.mark.asyncio
+    async def test_invoke_many_bounded_and_ordered(self, mock_config):
+        """invoke_many() caps concurrency, shares one correlation ID and keeps order."""
+        in_flight = 0
+        peak = 0
+        correlation_ids = set()
+
+        async def invoke(tool_id, input, tenant_id, actor_id, correlation_id, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            correlation_ids.add(correlation_id)
+            await asyncio.sleep(0.01 * (5 - input["n"]))
+            in_flight -= 1
+            return input["n"]
+
+        tools = ToolsNamespace(MagicMock(), mock_config)
+        tools.invoke = invoke
+
+        results = await tools.invoke_many(
+            [{"tool_id": "echo", "input": {"n": n}} for n in range(5)],
+            max_concurrency=2,
+        )
+
+        assert results == [0, 1, 2, 3, 4]
+        assert peak == 2
+        assert len(correlation_ids) == 1
@@ -11,6 +11,8 @@ These are contract tests that verify the SDK correctly:
 import os
 import sys
 import asyncio
+import json
+import httpx
 import pytest
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
@@ -304,7 +306,7 @@ class TestWorkflowsNamespaceRunWorkflow:
         # Create mock HTTP client
         mock_response = MagicMock()
         mock_response.status_code = 201
-        mock_response.json.return_value = mock_fc_responses["create_run"]
+        mock_response.content = json.dumps(mock_fc_responses["create_run"]).encode()
 
         mock_http_client = AsyncMock()
         mock_http_client.post.return_value = mock_response
@@ -337,7 +339,7 @@ class TestWorkflowsNamespaceRunWorkflow:
         """T2: run_workflow() threads tenant_id/actor_id/correlation_id in headers."""
         mock_response = MagicMock()
         mock_response.status_code = 201
-        mock_response.json.return_value = mock_fc_responses["create_run"]
+        mock_response.content = json.dumps(mock_fc_responses["create_run"]).encode()
 
         mock_http_client = AsyncMock()
         mock_http_client.post.return_value = mock_response
@@ -364,6 +366,71 @@ class TestWorkflowsNamespaceRunWorkflow:
         assert headers["X-Actor-Id"] == "custom_actor"
         assert headers["X-Correlation-Id"] == "custom_corr_001"
 
+    @pytest.mark.asyncio
+    async def test_run_workflow_idempotency_keys(self, mock_config, mock_fc_responses):
+        """T2b: Explicit keys pass through; deterministic keys depend only on the request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_response.content = json.dumps(mock_fc_responses["create_run"]).encode()
+
+        mock_http_client = AsyncMock()
+        mock_http_client.post.return_value = mock_response
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+
+        await namespace.run_workflow("test-workflow", {"a": 1}, idempotency_key="key-1")
+        for inputs in ({"a": 1, "b": 2}, {"b": 2, "a": 1}, {"a": 2}):
+            await namespace.run_workflow(
+                "test-workflow", inputs, deterministic_idempotency=True
+            )
+
+        keys = [c[1]["headers"]["X-Idempotency-Key"] for c in mock_http_client.post.call_args_list]
+        assert keys[0] == "key-1"
+        assert keys[1] == keys[2]
+        assert keys[3] != keys[1]
+        assert len(keys[1]) == 32
+
+
+class TestWorkflowsNamespaceRunMany:
+    """Test run_many method."""
+
+    @pytest.mark.asyncio
+    async def test_run_many_shares_context_and_keeps_order(self, mock_config, mock_fc_responses):
+        """run_many() starts every run under one correlation ID and keeps request order."""
+        def side_effect(url, **kwargs):
+            mock_resp = MagicMock()
+            mock_resp.status_code = 201
+            run = {
+                **mock_fc_responses["create_run"]["run"],
+                "workflow_id": kwargs["json"]["workflow_id"],
+            }
+            mock_resp.content = json.dumps({"run": run}).encode()
+            return mock_resp
+
+        mock_http_client = AsyncMock()
+        mock_http_client.post.side_effect = side_effect
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+
+        results = await namespace.run_many(
+            [{"workflow_id": f"wf-{i}", "inputs": {"i": i}} for i in range(5)],
+            max_concurrency=2,
+        )
+
+        assert [r.workflow_id for r in results] == [f"wf-{i}" for i in range(5)]
+        correlation_ids = {
+            c[1]["headers"]["X-Correlation-Id"] for c in mock_http_client.post.call_args_list
+        }
+        assert len(correlation_ids) == 1
+
 
 class TestWorkflowsNamespaceGetRun:
     """Test get_run method."""
@@ -373,7 +440,7 @@ class TestWorkflowsNamespaceGetRun:
         """T3: If status is paused, gate_info is present."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_fc_responses["get_run_paused"]
+        mock_response.content = json.dumps(mock_fc_responses["get_run_paused"]).encode()
 
         mock_http_client = AsyncMock()
         mock_http_client.get.return_value = mock_response
@@ -393,16 +460,101 @@ class TestWorkflowsNamespaceGetRun:
         assert result.gate_info.status == GateStatus.PENDING
         assert len(result.gates) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_run_headers_from_template(self, mock_config, mock_fc_responses):
+        """GET requests carry auth and identity headers but no Content-Type."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(mock_fc_responses["get_run_paused"]).encode()
+
+        mock_http_client = AsyncMock()
+        mock_http_client.get.return_value = mock_response
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+
+        await namespace.get_run("run-456", correlation_id="corr-1")
+        await namespace.get_run("run-456", tenant_id="other", correlation_id="corr-2")
+
+        first, second = (c[1]["headers"] for c in mock_http_client.get.call_args_list)
+        assert first == {
+            "Authorization": "Bearer test-api-key",
+            "X-Tenant-Id": "tenant_test",
+            "X-Actor-Id": "user_test",
+            "X-Correlation-Id": "corr-1",
+        }
+        assert second["X-Tenant-Id"] == "other"
+        assert "X-Tenant-Id" not in namespace._get_headers_base
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status_code", "content", "message", "retryable"),
+        [
+            (404, b'{"detail": "Run not found"}', "Run not found", False),
+            (409, b'{"detail": {"message": "Run is not paused"}}', "Run is not paused", False),
+            (502, b"<html>Bad Gateway</html>", "HTTP 502", True),
+        ],
+    )
+    async def test_get_run_error_raises_fc_error(
+        self, mock_config, status_code, content, message, retryable
+    ):
+        """FC error responses raise FC_ERROR with the response detail."""
+        from omega_sdk.errors import OmegaError
+
+        mock_response = MagicMock()
+        mock_response.status_code = status_code
+        mock_response.content = content
+
+        mock_http_client = AsyncMock()
+        mock_http_client.get.return_value = mock_response
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+
+        with pytest.raises(OmegaError) as exc_info:
+            await namespace.get_run("run-404")
+
+        assert exc_info.value.code == "FC_ERROR"
+        assert exc_info.value.message == message
+        assert exc_info.value.retryable is retryable
+
+    @pytest.mark.asyncio
+    async def test_empty_success_body_decodes_to_empty_dict(self, mock_config):
+        """A 204 (or other empty 2xx) response decodes to {} instead of failing."""
+        mock_response = MagicMock()
+        mock_response.status_code = 204
+        mock_response.content = b""
+
+        mock_http_client = AsyncMock()
+        mock_http_client.get.return_value = mock_response
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+
+        assert await namespace.get_run_logs("run-123") == []
+        assert await namespace._fc_get(
+            namespace._runs_url, "tenant_test", "user_test", "corr-1"
+        ) == {}
+
 
 class TestWorkflowsNamespaceResumeRun:
     """Test resume_run method."""
 
     @pytest.mark.asyncio
     async def test_resume_run_approved_transitions_to_running(self, mock_config, mock_fc_responses):
-        """T4: resume_run() with decision='approve' transitions status correctly."""
+        """T4: resume_run() with decision='approve' transitions status correctly."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_fc_responses["resume_approved"]
+        mock_response.content = json.dumps(mock_fc_responses["resume_approved"]).encode()
 
         mock_http_client = AsyncMock()
         mock_http_client.post.return_value = mock_response
@@ -413,12 +565,12 @@ class TestWorkflowsNamespaceResumeRun:
 
         namespace = WorkflowsNamespace(mock_gateway, mock_config)
 
-        result = await namespace.resume_run(
-            run_id="run-456",
-            gate_id="gate-789",
-            decision="approve",
-            input={"answers": ["a1"]},
-        )
+        result = await namespace.resume_run(
+            run_id="run-456",
+            gate_id="gate-789",
+            decision="approve",
+            input={"answers": ["a1"]},
+        )
 
         # Assertions
         assert result.status == WorkflowRunStatus.RUNNING
@@ -428,10 +580,10 @@ class TestWorkflowsNamespaceResumeRun:
 
     @pytest.mark.asyncio
     async def test_resume_run_denied_transitions_to_failed(self, mock_config, mock_fc_responses):
-        """T5: resume_run() with decision='deny' transitions to failed."""
+        """T5: resume_run() with decision='deny' transitions to failed."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_fc_responses["resume_denied"]
+        mock_response.content = json.dumps(mock_fc_responses["resume_denied"]).encode()
 
         mock_http_client = AsyncMock()
         mock_http_client.post.return_value = mock_response
@@ -442,11 +594,11 @@ class TestWorkflowsNamespaceResumeRun:
 
         namespace = WorkflowsNamespace(mock_gateway, mock_config)
 
-        result = await namespace.resume_run(
-            run_id="run-456",
-            gate_id="gate-789",
-            decision="deny",
-        )
+        result = await namespace.resume_run(
+            run_id="run-456",
+            gate_id="gate-789",
+            decision="deny",
+        )
 
         # Assertions
         assert result.status == WorkflowRunStatus.FAILED
@@ -460,7 +612,7 @@ class TestWorkflowsNamespaceResumeRun:
         """T6: resume_run() calls POST /api/fc/runs/{id}:resume."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_fc_responses["resume_approved"]
+        mock_response.content = json.dumps(mock_fc_responses["resume_approved"]).encode()
 
         mock_http_client = AsyncMock()
         mock_http_client.post.return_value = mock_response
@@ -471,13 +623,13 @@ class TestWorkflowsNamespaceResumeRun:
 
         namespace = WorkflowsNamespace(mock_gateway, mock_config)
 
-        await namespace.resume_run(
-            run_id="run-456",
-            gate_id="gate-789",
-            decision="approve",
-            input={"answers": ["a1", "a2"]},
-            decision_receipt_id="sha256:receipt123",
-        )
+        await namespace.resume_run(
+            run_id="run-456",
+            gate_id="gate-789",
+            decision="approve",
+            input={"answers": ["a1", "a2"]},
+            decision_receipt_id="sha256:receipt123",
+        )
 
         # Verify endpoint
         call_args = mock_http_client.post.call_args
@@ -485,42 +637,42 @@ class TestWorkflowsNamespaceResumeRun:
         json_body = call_args[1]["json"]
 
         assert "/api/fc/runs/run-456:resume" in url
-        assert json_body["run_id"] == "run-456"
-        assert json_body["gate_id"] == "gate-789"
-        assert json_body["decision"] == "approve"
-        assert json_body["input"]["answers"] == ["a1", "a2"]
-        assert json_body["decision_receipt_id"] == "sha256:receipt123"
-
-    @pytest.mark.asyncio
-    async def test_register_idempotent(self, mock_config):
-        """T6b: register() parses idempotent registration response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "workflow_id": "forgepilot.teaser.v1",
-            "version": "1.0.0",
-            "artifact_hashes": {
-                "workflowYaml": "sha256:a",
-                "promptsPoml": "sha256:b",
-                "schemas": {"output.schema.json": "sha256:c"},
-            },
-            "idempotent": True,
-        }
-
-        mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
-
-        mock_gateway = MagicMock()
-        mock_gateway._client = mock_http_client
-        mock_gateway.config = mock_config
-
-        namespace = WorkflowsNamespace(mock_gateway, mock_config)
-        result = await namespace.register(
-            workflow_yaml="id: forgepilot.teaser.v1\nversion: 1.0.0",
-            prompts_poml="<Prompt id='p'>x</Prompt>",
-        )
-        assert result.workflow_id == "forgepilot.teaser.v1"
-        assert result.idempotent is True
+        assert json_body["run_id"] == "run-456"
+        assert json_body["gate_id"] == "gate-789"
+        assert json_body["decision"] == "approve"
+        assert json_body["input"]["answers"] == ["a1", "a2"]
+        assert json_body["decision_receipt_id"] == "sha256:receipt123"
+
+    @pytest.mark.asyncio
+    async def test_register_idempotent(self, mock_config):
+        """T6b: register() parses idempotent registration response."""
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_response.content = json.dumps({
+            "workflow_id": "forgepilot.teaser.v1",
+            "version": "1.0.0",
+            "artifact_hashes": {
+                "workflowYaml": "sha256:a",
+                "promptsPoml": "sha256:b",
+                "schemas": {"output.schema.json": "sha256:c"},
+            },
+            "idempotent": True,
+        }).encode()
+
+        mock_http_client = AsyncMock()
+        mock_http_client.post.return_value = mock_response
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+        result = await namespace.register(
+            workflow_yaml="id: forgepilot.teaser.v1\nversion: 1.0.0",
+            prompts_poml="<Prompt id='p'>x</Prompt>",
+        )
+        assert result.workflow_id == "forgepilot.teaser.v1"
+        assert result.idempotent is True
 
 
 class TestWorkflowsNamespaceGetLogs:
@@ -531,7 +683,7 @@ class TestWorkflowsNamespaceGetLogs:
         """T7: get_run_logs() returns log entries."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_fc_responses["get_logs"]
+        mock_response.content = json.dumps(mock_fc_responses["get_logs"]).encode()
 
         mock_http_client = AsyncMock()
         mock_http_client.get.return_value = mock_response
@@ -550,6 +702,42 @@ class TestWorkflowsNamespaceGetLogs:
         assert logs[1].event_type == "FC-STEP-001"
         assert logs[1].step_id == "step-1"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("server_cap", "offsets"),
+        [(None, [0, 2, 4, 5]), (1, [0, 1, 2, 3, 4, 5])],
+        ids=["uncapped", "server_caps_limit"],
+    )
+    async def test_iter_run_logs_pages_until_empty_page(
+        self, mock_config, mock_fc_responses, server_cap, offsets
+    ):
+        """T7b: iter_run_logs() walks offsets until a page comes back empty."""
+        entries = [
+            {**mock_fc_responses["get_logs"][0], "log_id": f"log-{i}"} for i in range(5)
+        ]
+
+        def side_effect(url, headers, params):
+            mock_resp = MagicMock()
+            mock_resp.status_code = 200
+            limit = min(params["limit"], server_cap or params["limit"])
+            page = entries[params["offset"]:params["offset"] + limit]
+            mock_resp.content = json.dumps(page).encode()
+            return mock_resp
+
+        mock_http_client = AsyncMock()
+        mock_http_client.get.side_effect = side_effect
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+
+        logs = [log async for log in namespace.iter_run_logs("run-123", page_size=2)]
+
+        assert [log.log_id for log in logs] == [f"log-{i}" for i in range(5)]
+        assert [c[1]["params"]["offset"] for c in mock_http_client.get.call_args_list] == offsets
+
 
 class TestWorkflowsNamespaceWaitForCompletion:
     """Test wait_for_completion method."""
@@ -591,7 +779,8 @@ class TestWorkflowsNamespaceWaitForCompletion:
         def side_effect(*args, **kwargs):
             mock_resp = MagicMock()
             mock_resp.status_code = 200
-            mock_resp.json.return_value = responses[min(call_count[0], len(responses) - 1)]
+            body = responses[min(call_count[0], len(responses) - 1)]
+            mock_resp.content = json.dumps(body).encode()
             call_count[0] += 1
             return mock_resp
 
@@ -606,6 +795,7 @@ class TestWorkflowsNamespaceWaitForCompletion:
 
         result = await namespace.wait_for_completion(
             run_id="run-123",
+            use_events=False,
             poll_interval_ms=10,  # Fast polling for test
             timeout_ms=5000,
         )
@@ -618,7 +808,7 @@ class TestWorkflowsNamespaceWaitForCompletion:
         """T9: wait_for_completion() also stops on paused status."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_fc_responses["get_run_paused"]
+        mock_response.content = json.dumps(mock_fc_responses["get_run_paused"]).encode()
 
         mock_http_client = AsyncMock()
         mock_http_client.get.return_value = mock_response
@@ -631,6 +821,7 @@ class TestWorkflowsNamespaceWaitForCompletion:
 
         result = await namespace.wait_for_completion(
             run_id="run-456",
+            use_events=False,
             poll_interval_ms=10,
             timeout_ms=5000,
         )
@@ -638,6 +829,294 @@ class TestWorkflowsNamespaceWaitForCompletion:
         assert result.status == WorkflowRunStatus.PAUSED
         assert result.gate_info is not None
 
+        # One status-only poll, then a single full fetch with gates
+        params = [c[1]["params"] for c in mock_http_client.get.call_args_list]
+        assert params == [{}, {"include_gates": "true"}]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_backs_off(self, mock_config, monkeypatch):
+        """T9b: Poll intervals grow from the initial interval up to poll_interval_ms."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "run": {
+                "run_id": "run-123",
+                "workflow_id": "test-workflow",
+                "status": "running",
+                "tenant_id": "tenant_test",
+                "actor_id": "user_test",
+                "correlation_id": "corr-123",
+            },
+        }).encode()
+
+        mock_http_client = AsyncMock()
+        mock_http_client.get.return_value = mock_response
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            if len(delays) == 6:
+                raise asyncio.CancelledError
+
+        monkeypatch.setattr("omega_sdk.workflows.random.uniform", lambda a, b: 0.0)
+        monkeypatch.setattr("omega_sdk.workflows.asyncio.sleep", fake_sleep)
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+
+        with pytest.raises(asyncio.CancelledError):
+            await namespace.wait_for_completion(
+                run_id="run-123",
+                use_events=False,
+                poll_interval_ms=1000,
+                initial_poll_interval_ms=200,
+            )
+
+        assert delays == pytest.approx([0.2, 0.32, 0.512, 0.8192, 1.0, 1.0])
+
+        # Every poll reuses one prebuilt headers dict
+        headers = [c[1]["headers"] for c in mock_http_client.get.call_args_list]
+        assert len(headers) == 6
+        assert all(h is headers[0] for h in headers)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_times_out(self, mock_config):
+        """T9c: wait_for_completion() raises TIMEOUT once the deadline passes."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "run": {
+                "run_id": "run-123",
+                "workflow_id": "test-workflow",
+                "status": "running",
+                "tenant_id": "tenant_test",
+                "actor_id": "user_test",
+                "correlation_id": "corr-123",
+            },
+        }).encode()
+
+        mock_http_client = AsyncMock()
+        mock_http_client.get.return_value = mock_response
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+
+        from omega_sdk.errors import OmegaError
+
+        with pytest.raises(OmegaError) as exc_info:
+            await namespace.wait_for_completion(
+                run_id="run-123",
+                use_events=False,
+                poll_interval_ms=10,
+                timeout_ms=50,
+                initial_poll_interval_ms=5,
+            )
+
+        assert exc_info.value.code == "TIMEOUT"
+
+
+class TestWorkflowsNamespaceRunAndWait:
+    """Test run_and_wait method."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("start_status", "gets"), [("completed", 0), ("pending", 2)])
+    async def test_run_and_wait_skips_wait_when_start_has_stopped(
+        self, mock_config, mock_fc_responses, start_status, gets
+    ):
+        """run_and_wait() returns the start response when the run has already stopped."""
+        created = {
+            **mock_fc_responses["create_run"],
+            "run": {**mock_fc_responses["create_run"]["run"], "status": start_status},
+        }
+        completed = {"run": {**created["run"], "status": "completed"}}
+
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_response.content = json.dumps(created).encode()
+        mock_get_response = MagicMock()
+        mock_get_response.status_code = 200
+        mock_get_response.content = json.dumps(completed).encode()
+
+        mock_http_client = AsyncMock()
+        mock_http_client.post.return_value = mock_response
+        mock_http_client.get.return_value = mock_get_response
+
+        mock_gateway = MagicMock()
+        mock_gateway._client = mock_http_client
+        mock_gateway.config = mock_config
+
+        namespace = WorkflowsNamespace(mock_gateway, mock_config)
+
+        result = await namespace.run_and_wait(
+            "test-workflow", {"key": "value"}, use_events=False, poll_interval_ms=10
+        )
+
+        assert result.status == WorkflowRunStatus.COMPLETED
+        assert mock_http_client.post.call_count == 1
+        assert mock_http_client.get.call_count == gets
+
+
+class TestWorkflowsNamespaceEvents:
+    """Test stream_run_events and event-driven waiting."""
+
+    RUN = {
+        "run_id": "run-123",
+        "workflow_id": "test-workflow",
+        "status": "completed",
+        "tenant_id": "tenant_test",
+        "actor_id": "user_test",
+        "correlation_id": "corr-123",
+    }
+
+    @pytest.mark.asyncio
+    async def test_stream_run_events_types_payloads(self, mock_config, mock_fc_responses):
+        """Status, log and gate events are decoded into typed fields."""
+        log = mock_fc_responses["get_logs"][0]
+        gate = mock_fc_responses["get_run_paused"]["gates"][0]
+        body = (
+            f"event: log\ndata: {json.dumps(log)}\n\n"
+            f"event: gate\ndata: {json.dumps(gate)}\n\n"
+            ": keepalive\n\n"
+            'event: status\ndata: {"run_id": "run-123", "status": "paused"}\n\n'
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/fc/runs/run-123/events"
+            assert request.headers["Accept"] == "text/event-stream"
+            return httpx.Response(200, text=body)
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        events = [e async for e in client.workflows.stream_run_events("run-123")]
+
+        assert [e.event for e in events] == ["log", "gate", "status"]
+        assert events[0].log.event_type == "FC-RUN-001"
+        assert events[1].gate.gate_id == "gate-789"
+        assert events[2].status == WorkflowRunStatus.PAUSED
+
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_uses_events(self, mock_config):
+        """wait_for_completion() returns on a terminal status event without polling."""
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append((request.url.path, request.url.query))
+            if request.url.path.endswith("/events"):
+                return httpx.Response(
+                    200,
+                    text=(
+                        'event: status\ndata: {"status": "running"}\n\n'
+                        'event: status\ndata: {"status": "completed"}\n\n'
+                    ),
+                )
+            return httpx.Response(200, json={"run": self.RUN, "gates": []})
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.workflows.wait_for_completion("run-123")
+
+        assert result.status == WorkflowRunStatus.COMPLETED
+        assert paths == [
+            ("/api/fc/runs/run-123/events", b""),
+            ("/api/fc/runs/run-123", b"include_gates=true"),
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "frame",
+        [
+            'event: status\ndata: "x"\n\n',
+            "event: status\ndata: []\n\n",
+            'event: status\ndata: {"status": "exploded"}\n\n',
+            "event: status\ndata: {not json\n\n",
+        ],
+    )
+    async def test_wait_for_completion_polls_after_bad_event(self, mock_config, frame):
+        """A malformed event makes wait_for_completion() fall back to polling."""
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/events"):
+                return httpx.Response(200, text=frame)
+            return httpx.Response(200, json={"run": self.RUN})
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.workflows.wait_for_completion("run-123")
+
+        assert result.status == WorkflowRunStatus.COMPLETED
+        assert paths == ["/api/fc/runs/run-123/events"] + ["/api/fc/runs/run-123"] * 2
+
+    @pytest.mark.asyncio
+    async def test_stream_run_events_rejects_bad_event(self, mock_config):
+        """Malformed events surface as INVALID_RESPONSE, not raw decode errors."""
+        from omega_sdk.errors import OmegaError
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text="event: status\ndata: []\n\n")
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(OmegaError) as exc_info:
+            [e async for e in client.workflows.stream_run_events("run-123")]
+
+        assert exc_info.value.code == "INVALID_RESPONSE"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_polls_after_dropped_stream(self, mock_config):
+        """A connection dropped mid-stream makes wait_for_completion() poll."""
+        paths = []
+
+        class DroppedStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b'event: status\ndata: {"status": "running"}\n\n'
+                raise httpx.RemoteProtocolError("peer closed connection")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/events"):
+                return httpx.Response(200, stream=DroppedStream())
+            return httpx.Response(200, json={"run": self.RUN})
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.workflows.wait_for_completion("run-123")
+
+        assert result.status == WorkflowRunStatus.COMPLETED
+        assert paths == ["/api/fc/runs/run-123/events"] + ["/api/fc/runs/run-123"] * 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_falls_back_to_polling(self, mock_config):
+        """Without an event stream on the server, wait_for_completion() polls."""
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/events"):
+                return httpx.Response(404, json={"detail": "Not Found"})
+            return httpx.Response(200, json={"run": self.RUN})
+
+        client = OmegaClient(config=mock_config)
+        client._gateway._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.workflows.wait_for_completion("run-123")
+
+        assert result.status == WorkflowRunStatus.COMPLETED
+        assert paths == ["/api/fc/runs/run-123/events"] + ["/api/fc/runs/run-123"] * 2
+
 
 # =============================================================================
 # OmegaClient Integration Tests